@@ -4,6 +4,7 @@ setup(
     name='ASHRAE140Automation',
     version='0.0.0',
     packages=['src'],
+    package_data={'src': ['validation_schema.json']},
     url='https://github.com/JasonGlazer/ashrae-140-automation',
     license='',
     author='GARD Analytics and NREL for US DOE',
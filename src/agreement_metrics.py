@@ -0,0 +1,228 @@
+import argparse
+import numbers
+import pathlib
+import sys
+import numpy as np
+import pandas as pd
+
+root_directory = pathlib.Path(__file__).parent.parent.resolve()
+
+if str(root_directory) not in sys.path:
+    sys.path.append(str(root_directory))
+
+# imports below the system path append operation above are necessary to run this file as a script
+from src.baseline_cache import read_processed_json  # noqa: E402
+from src.processed_catalog import ProcessedCatalog  # noqa: E402
+
+# monthly and hourly profile tables of each section.  The step of a profile is the path level (case first) of the
+# time step, or the key that the time steps are nested under.  When quantities are given, only the leaves with those
+# keys are compared, so that the day and hour of a peak are left out.
+agreement_profile_tables = {
+    'TF': {
+        'monthly_conditioned_zone_loads': {
+            'step': 1,
+            'quantities': ('total_heating_kwh', 'total_cooling_kwh', 'peak_heating_kw', 'peak_cooling_kw')},
+        'specific_day_hourly_output': {'step': 'hour'},
+        'specific_day_hourly_output_free_float_zone_loads': {'step': 'hour'},
+        'specific_day_hourly_output_free_float_zone_temperatures': {'step': 'hour'}}}
+
+# histogram tables of each section, with the key that the numeric bin labels are nested under
+agreement_distribution_tables = {
+    'TF': {
+        'hourly_annual_zone_temperature_bin_data': {'step': 'temperature_bin_c'}}}
+
+agreement_columns = [
+    'program', 'baseline', 'table_name', 'series', 'steps', 'nmbe_percent', 'cv_rmse_percent', 'ks_distance',
+    'earth_movers_distance']
+
+
+def _get_series_values(json_data, table_name, step, quantities=None) -> tuple:
+    """
+    Gather the leaves of a table for every program into series, where a series is the leaf path without its step
+    level, e.g. 600>total_heating_kwh of the monthly loads.
+
+    :param json_data: dictionary of model name to processed json object
+    :param table_name: table key in the processed json objects
+    :param step: path level of the step, or the key that the steps are nested under
+    :param quantities: leaf keys to keep.  All leaves are kept if not provided.
+    :return: tuple of the series labels, the step labels, and a program x series x step array of values
+    """
+    series_positions = {}
+    step_positions = {}
+    leaves = []
+
+    def add_leaves(program_index, node, path):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                add_leaves(program_index, value, path + (key, ))
+            return
+        if not isinstance(node, numbers.Number) or isinstance(node, bool):
+            return
+        if quantities is not None and path[-1] not in quantities:
+            return
+        if isinstance(step, int):
+            step_level = step
+        elif step in path[:-1]:
+            step_level = path.index(step) + 1
+        else:
+            return
+        series = '>'.join(path[:step_level] + path[step_level + 1:])
+        leaves.append((
+            program_index,
+            series_positions.setdefault(series, len(series_positions)),
+            step_positions.setdefault(path[step_level], len(step_positions)),
+            node))
+        return
+
+    for program_index, json_obj in enumerate(json_data.values()):
+        add_leaves(program_index, json_obj.get(table_name) or {}, ())
+    values = np.full((len(json_data), len(series_positions), len(step_positions)), np.nan)
+    if leaves:
+        program_indices, series_indices, step_indices, leaf_values = zip(*leaves)
+        values[list(program_indices), list(series_indices), list(step_indices)] = leaf_values
+    return list(series_positions.keys()), list(step_positions.keys()), values
+
+
+def get_profile_agreement(values, reference_mask) -> dict:
+    """
+    Calculate the normalized mean bias error (NMBE) and the coefficient of variation of the root mean square error
+    (CV(RMSE)) of every program and series against the mean of the reference programs, in one array operation.
+    Steps where either value is missing are left out, and the errors are normalized by the magnitude of the mean
+    reference value of the remaining steps (no parameter count is subtracted).  A positive NMBE means the program is
+    above the reference.
+
+    :param values: program x series x step array of values
+    :param reference_mask: boolean array of the programs that make up the reference
+    :return: dictionary of program x series arrays of the steps compared ('steps'), NMBE in percent ('nmbe_percent'),
+        and CV(RMSE) in percent ('cv_rmse_percent').  Series without steps or with a zero reference mean are NaN.
+    """
+    reference_values = values[np.asarray(reference_mask, dtype=bool)]
+    reference_counts = np.sum(~np.isnan(reference_values), axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        reference = np.nansum(reference_values, axis=0) / reference_counts
+        compared = ~np.isnan(values) & ~np.isnan(reference)
+        steps = np.sum(compared, axis=-1)
+        errors = np.where(compared, values - reference, 0.0)
+        reference_means = np.abs(np.sum(np.where(compared, reference, 0.0), axis=-1) / steps)
+        nmbe = 100 * np.sum(errors, axis=-1) / steps / reference_means
+        cv_rmse = 100 * np.sqrt(np.sum(errors ** 2, axis=-1) / steps) / reference_means
+    return {
+        'steps': steps,
+        'nmbe_percent': np.where(np.isfinite(nmbe), nmbe, np.nan),
+        'cv_rmse_percent': np.where(np.isfinite(cv_rmse), cv_rmse, np.nan)}
+
+
+def get_distribution_agreement(values, bins, reference_mask) -> dict:
+    """
+    Calculate the Kolmogorov-Smirnov (KS) distance and the earth mover's distance of the histograms of every program
+    and series from the mean histogram of the reference programs, in one array operation.  Each histogram is
+    normalized to a distribution, and bins that a program does not report count as empty.  The earth mover's
+    distance is in the units of the bin labels.
+
+    :param values: program x series x bin array of counts
+    :param bins: numeric bin labels
+    :param reference_mask: boolean array of the programs that make up the reference
+    :return: dictionary of program x series arrays of the bins compared ('steps'), KS distance ('ks_distance'), and
+        earth mover's distance ('earth_movers_distance').  Series that a program does not report are NaN.
+    """
+    bins = np.asarray(bins, dtype=float)
+    bin_order = np.argsort(bins)
+    bins = bins[bin_order]
+    values = values[..., bin_order]
+    steps = np.sum(~np.isnan(values), axis=-1)
+    totals = np.nansum(values, axis=-1, keepdims=True)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        distributions = np.where(totals > 0, np.nan_to_num(values) / totals, np.nan)
+    reference_distributions = distributions[np.asarray(reference_mask, dtype=bool)]
+    reference_counts = np.sum(~np.isnan(reference_distributions[..., :1]), axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        reference_distribution = np.nansum(reference_distributions, axis=0) / reference_counts
+    cumulative_differences = np.abs(np.cumsum(distributions, axis=-1) - np.cumsum(reference_distribution, axis=-1))
+    ks_distance = np.max(cumulative_differences, axis=-1, initial=0.0)
+    earth_movers_distance = np.sum(cumulative_differences[..., :-1] * np.diff(bins), axis=-1)
+    return {
+        'steps': steps,
+        'ks_distance': ks_distance,
+        'earth_movers_distance': earth_movers_distance}
+
+
+def get_agreement_table(section_type, catalog=None, baseline_cache=None) -> pd.DataFrame:
+    """
+    Calculate the agreement metrics of every processed file of a section against the mean of its baseline
+    (reference program) files.  Only the profile and histogram tables of the section are read, and every program is
+    calculated at once.  Baseline files are compared with a reference that includes themselves.
+
+    :param section_type: section type (e.g. TF, GC, HE)
+    :param catalog: ProcessedCatalog object used to select the files.  The catalog in the processed directory is used
+        if not provided.
+    :param baseline_cache: BaselineCache object used to read the files.  The files are read directly if not provided.
+    :return: dataframe with a row per program, table, and series, and the columns in agreement_columns.  Profile rows
+        hold NMBE and CV(RMSE), histogram rows hold the KS and earth mover's distances, and the other metric columns
+        are NaN.
+    """
+    catalog = catalog or ProcessedCatalog()
+    profile_tables = agreement_profile_tables.get(section_type, {})
+    distribution_tables = agreement_distribution_tables.get(section_type, {})
+    data_keys = list(profile_tables.keys()) + list(distribution_tables.keys())
+    baseline_files = catalog.get_baseline_files(section_type)
+    file_locations = baseline_files + catalog.get_files(section=section_type, baseline=False)
+    model_names = ['-'.join([i.parts[-3], i.parts[-2]]) for i in file_locations]
+    if not data_keys or not baseline_files:
+        return pd.DataFrame(columns=agreement_columns)
+    if baseline_cache is None:
+        json_data = {
+            model_name: read_processed_json(file_location, data_keys=data_keys)
+            for file_location, model_name in zip(file_locations, model_names)}
+    else:
+        bundle = baseline_cache.load_bundle(section_type, file_locations, model_names, [], data_keys=data_keys)
+        json_data = {model_name: bundle['models'][model_name]['json'] for model_name in model_names}
+    reference_mask = np.arange(len(file_locations)) < len(baseline_files)
+    table_frames = []
+    for table_name, table_specification in list(profile_tables.items()) + list(distribution_tables.items()):
+        series, steps, values = _get_series_values(
+            json_data, table_name, table_specification['step'], table_specification.get('quantities'))
+        if table_name in distribution_tables:
+            metrics = get_distribution_agreement(values, steps, reference_mask)
+        else:
+            metrics = get_profile_agreement(values, reference_mask)
+        table_frame = pd.DataFrame({
+            'program': np.repeat(model_names, len(series)),
+            'baseline': np.repeat(reference_mask, len(series)),
+            'table_name': table_name,
+            'series': np.tile(np.array(series, dtype=object), len(model_names)),
+            **{k: v.ravel() for k, v in metrics.items()}})
+        table_frames.append(table_frame[table_frame['steps'] > 0])
+    return pd.concat(table_frames, ignore_index=True).reindex(columns=agreement_columns)
+
+
+def build_parser():
+    """
+    Build argument parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog='ASHRAE 140 Automation agreement metrics',
+        description='Calculate the agreement of every processed file with the reference programs of its section')
+    parser.add_argument(
+        '--sections',
+        '-s',
+        nargs='+',
+        default=list(agreement_profile_tables.keys()),
+        help='Section types to calculate, e.g. TF.')
+    parser.add_argument(
+        '--output',
+        '-o',
+        help='Directory to write a csv file of each section to, named agreement_<section>.csv.')
+    return parser
+
+
+if __name__ == "__main__":
+    agreement_args = build_parser().parse_args()
+    for agreement_section_type in agreement_args.sections:
+        agreement_table = get_agreement_table(agreement_section_type)
+        print(agreement_section_type)
+        print(agreement_table.to_string(index=False))
+        if agreement_args.output:
+            output_directory = pathlib.Path(agreement_args.output)
+            output_directory.mkdir(parents=True, exist_ok=True)
+            agreement_table.to_csv(
+                output_directory.joinpath('agreement_{}.csv'.format(agreement_section_type.lower())), index=False)
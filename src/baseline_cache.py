@@ -0,0 +1,297 @@
+import hashlib
+import json
+import os
+import pathlib
+import pickle
+import re
+import numpy as np
+import pandas as pd
+from src.ingest_cache import _get_code_fingerprint
+from src.result_cube import ResultCube
+from src.processed_sidecar import read_sidecar, leaves_to_json, leaves_to_frame
+
+# processed files are written by InputProcessor with an indent of 4, so each top level key starts a line with exactly
+# four spaces of indentation.  Strings cannot contain raw line breaks, so the pattern cannot match inside a value.
+top_level_key_pattern = re.compile(r'^    ("(?:[^"\\]|\\.)*"): ', re.MULTILINE)
+
+# modules whose source determines the cached entries, bundles, and reference statistics
+baseline_code_files = ['baseline_cache.py', 'result_cube.py', 'processed_sidecar.py']
+
+
+def read_processed_json(file_location, data_keys=None) -> dict:
+    """
+    Read a processed json file.  When data keys are provided, the top level keys of the file are indexed from the
+    text and only the sections of the requested keys are parsed.  Files that are not laid out as written by
+    InputProcessor are parsed in full and then filtered.
+
+    :param file_location: processed json file
+    :param data_keys: top level json keys to read.  All keys are read if not provided.
+    :return: json object
+    """
+    with open(file_location, 'r') as jf:
+        text = jf.read()
+    if data_keys is None:
+        return json.loads(text)
+    if text.startswith('{\n    "'):
+        key_matches = list(top_level_key_pattern.finditer(text))
+        data = {}
+        try:
+            for idx, key_match in enumerate(key_matches):
+                key = json.loads(key_match.group(1))
+                if key in data_keys:
+                    section_end = key_matches[idx + 1].start() if idx + 1 < len(key_matches) else text.rindex('}')
+                    data[key] = json.loads(text[key_match.end():section_end].rstrip().rstrip(','))
+            return data
+        except ValueError:
+            pass
+    return {k: v for k, v in json.loads(text).items() if k in data_keys}
+
+
+def load_processed_file(file_location, model_name, table_lookup, data_keys=None) -> dict:
+    """
+    Read a processed json file and convert its tables into dataframes with a multiIndex for each json level.  When
+    tables are converted, the binary sidecar of the file is used instead of the json text if it exists and matches
+    the file.  Sections that are only read as json are parsed faster from the text.
+
+    :param file_location: processed json file
+    :param model_name: model name used as the row index of the tables
+    :param table_lookup: list of (json key name, list to make row index) tuples for the tables to convert
+    :param data_keys: top level json keys to read.  All keys are read if not provided.
+    :return: dictionary with the json object ('json') and a dictionary of table dataframes ('tables')
+    """
+    sidecar_tables = read_sidecar(file_location, data_keys=data_keys) if table_lookup else None
+    if sidecar_tables is None:
+        data = read_processed_json(file_location, data_keys=data_keys)
+    else:
+        data = {tbl: leaves_to_json(leaves) for tbl, leaves in sidecar_tables.items()}
+    tables = {}
+    for tbl, row_index in table_lookup:
+        tbl_data = data.get(tbl)
+        if tbl_data:
+            # Format the json data to a multiIndex table with a meaningful row index
+            # Make the separator something uncommon for easier splitting and re-leveling
+            if sidecar_tables is None:
+                tmp_df = pd.json_normalize(tbl_data, sep=">")
+            else:
+                tmp_df = leaves_to_frame(sidecar_tables[tbl], sep=">")
+            tmp_df.columns = pd.MultiIndex.from_tuples([i.split('>') for i in tmp_df.columns])
+            tmp_df['program_name'] = model_name
+            tmp_df = tmp_df.set_index(row_index)
+            tables[tbl] = tmp_df
+    return {'json': data, 'tables': tables}
+
+
+def get_reference_statistics(json_data) -> dict:
+    """
+    Calculate the minimum, maximum and mean of every numeric case/metric cell across a set of reference programs.
+    Missing values are excluded, and the values are combined in program order so that the results match statistics
+    calculated from a table row.
+
+    :param json_data: dictionary of model name to processed json object for the reference programs
+    :return: dictionary of table name to ResultCube object with 'min', 'max', and 'mean' on the program axis
+    """
+    reference_statistics = {}
+    table_names = []
+    for data in json_data.values():
+        for tbl, tbl_data in data.items():
+            if tbl not in table_names and ResultCube.is_case_metric_table(tbl_data):
+                table_names.append(tbl)
+    for tbl in table_names:
+        result_cube = ResultCube.from_json_data(json_data, tbl)
+        statistics = np.full((3, len(result_cube.cases), len(result_cube.metrics)), np.nan)
+        counts = np.sum(~np.isnan(result_cube.values), axis=0)
+        # cells without any value are left as NaN, and an axis 0 sum adds the values in program order
+        with np.errstate(invalid='ignore', divide='ignore'):
+            statistics[0] = np.fmin.reduce(result_cube.values, axis=0, initial=np.inf)
+            statistics[1] = np.fmax.reduce(result_cube.values, axis=0, initial=-np.inf)
+            statistics[2] = np.nansum(result_cube.values, axis=0) / counts
+        statistics[:, counts == 0] = np.nan
+        reference_statistics[tbl] = ResultCube(
+            values=statistics,
+            programs=['min', 'max', 'mean'],
+            cases=result_cube.cases,
+            metrics=result_cube.metrics)
+    return reference_statistics
+
+
+class BaselineCache:
+    """
+    Cache of parsed baseline (reference program) files, shared by every GraphicsRenderer that is given the same
+    object.
+
+    Entries are held in memory and checked against the file modification time and size on each request.  When a
+    cache directory is provided, entries are also stored on disk under a hash of the file contents and of the source
+    of the code that builds them, so that other processes and later runs do not need to parse the file again.  The
+    cached objects are shared and must be treated as read-only.
+
+    :param cache_directory: location of the disk cache.  Only the in-memory cache is used if not provided.
+    """
+
+    def __init__(self, cache_directory=None):
+        self.cache_directory = pathlib.Path(cache_directory) if cache_directory else None
+        self._code_fingerprint = _get_code_fingerprint(baseline_code_files)
+        # file location -> (file modification time and size, entry)
+        self._memory_cache = {}
+        return
+
+    def __repr__(self):
+        rep = 'BaselineCache(cache_directory=' + str(self.cache_directory) + ')'
+        return rep
+
+    @staticmethod
+    def _get_file_fingerprint(file_location) -> tuple:
+        file_stat = pathlib.Path(file_location).stat()
+        return file_stat.st_mtime_ns, file_stat.st_size
+
+    def _write_to_disk(self, cache_file_location, entry):
+        self.cache_directory.mkdir(parents=True, exist_ok=True)
+        temporary_file_location = cache_file_location.with_name(
+            '.'.join([cache_file_location.name, str(os.getpid()), 'tmp']))
+        with open(temporary_file_location, 'wb') as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        temporary_file_location.replace(cache_file_location)
+        return
+
+    @staticmethod
+    def _read_from_disk(cache_file_location):
+        if cache_file_location.is_file():
+            try:
+                with open(cache_file_location, 'rb') as f:
+                    return pickle.load(f)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                pass
+        return None
+
+    def _get_disk_key(self, file_bytes, model_name, table_lookup) -> str:
+        disk_hash = hashlib.sha256(file_bytes)
+        disk_hash.update(json.dumps([model_name, table_lookup, self._code_fingerprint, pd.__version__]).encode())
+        return disk_hash.hexdigest()
+
+    def _load_from_disk(self, file_location, model_name, table_lookup) -> dict:
+        """
+        Get an entry from the disk cache, or parse the file and store the entry on disk.
+
+        :param file_location: processed json file
+        :param model_name: model name used as the row index of the tables
+        :param table_lookup: list of (json key name, list to make row index) tuples for the tables to convert
+        :return: cache entry
+        """
+        disk_key = self._get_disk_key(pathlib.Path(file_location).read_bytes(), model_name, table_lookup)
+        cache_file_location = self.cache_directory.joinpath('.'.join([disk_key, 'pickle']))
+        entry = self._read_from_disk(cache_file_location)
+        if entry is None:
+            entry = load_processed_file(file_location, model_name, table_lookup)
+            self._write_to_disk(cache_file_location, entry)
+        return entry
+
+    def _load_sections_from_disk(self, file_location, model_name, table_lookup, data_keys) -> dict:
+        """
+        Get the requested sections of a file from the disk cache, where each top level json key is stored separately
+        with its table dataframe.  Sections that are not cached are parsed from the file and stored on disk.
+
+        :param file_location: processed json file
+        :param model_name: model name used as the row index of the tables
+        :param table_lookup: list of (json key name, list to make row index) tuples for the tables to convert
+        :param data_keys: top level json keys to read
+        :return: cache entry holding only the requested sections
+        """
+        disk_key = self._get_disk_key(pathlib.Path(file_location).read_bytes(), model_name, table_lookup)
+        section_file_locations = {
+            data_key: self.cache_directory.joinpath('.'.join([
+                hashlib.sha256(json.dumps([disk_key, data_key]).encode()).hexdigest(), 'section', 'pickle']))
+            for data_key in data_keys}
+        sections = {data_key: self._read_from_disk(i) for data_key, i in section_file_locations.items()}
+        missing_keys = [data_key for data_key, section in sections.items() if section is None]
+        if missing_keys:
+            entry = load_processed_file(
+                file_location, model_name, [i for i in table_lookup if i[0] in missing_keys], data_keys=missing_keys)
+            for data_key in missing_keys:
+                sections[data_key] = {
+                    'json': {k: v for k, v in entry['json'].items() if k == data_key},
+                    'tables': {k: v for k, v in entry['tables'].items() if k == data_key}}
+                self._write_to_disk(section_file_locations[data_key], sections[data_key])
+        entry = {'json': {}, 'tables': {}}
+        for data_key in data_keys:
+            entry['json'].update(sections[data_key]['json'])
+            entry['tables'].update(sections[data_key]['tables'])
+        return entry
+
+    def load(self, file_location, model_name, table_lookup) -> dict:
+        """
+        Get the parsed json object and table dataframes of a baseline file.  The file is parsed again when it has
+        changed since it was cached.
+
+        :param file_location: processed json file
+        :param model_name: model name used as the row index of the tables
+        :param table_lookup: list of (json key name, list to make row index) tuples for the tables to convert
+        :return: dictionary with the json object ('json') and a dictionary of table dataframes ('tables')
+        """
+        file_location = pathlib.Path(file_location).resolve()
+        file_fingerprint = self._get_file_fingerprint(file_location)
+        memory_key = (str(file_location), model_name, repr(table_lookup))
+        cached_fingerprint, entry = self._memory_cache.get(memory_key, (None, None))
+        if cached_fingerprint != file_fingerprint:
+            if self.cache_directory:
+                entry = self._load_from_disk(file_location, model_name, table_lookup)
+            else:
+                entry = load_processed_file(file_location, model_name, table_lookup)
+            self._memory_cache[memory_key] = (file_fingerprint, entry)
+        return entry
+
+    def load_bundle(self, section_type, file_locations, model_names, table_lookup, data_keys=None) -> dict:
+        """
+        Get the baseline bundle of a section.  The bundle holds the parsed data of every baseline file together with
+        the reference statistics of every table cell, so that a renderer loads one object instead of parsing each
+        baseline and recalculating the statistics.  The bundle is rebuilt when any of its baseline files changes.
+
+        When data keys are provided, a partial bundle is built from only those sections of each baseline file, so
+        that the cost of loading scales with the data requested.  Partial bundles are held in memory, and their
+        sections are cached on disk separately for each file and key.
+
+        :param section_type: section type (e.g. TF, GC, HE)
+        :param file_locations: baseline processed json files
+        :param model_names: model names of the baseline files
+        :param table_lookup: list of (json key name, list to make row index) tuples for the tables to convert
+        :param data_keys: top level json keys to read.  All keys are read if not provided.
+        :return: dictionary with the parsed data of each model ('models') and the reference statistics
+            ('statistics'), formatted as described in get_reference_statistics
+        """
+        file_locations = [pathlib.Path(i).resolve() for i in file_locations]
+        file_fingerprints = [self._get_file_fingerprint(i) for i in file_locations]
+        if data_keys is not None:
+            data_keys = sorted(data_keys)
+            table_lookup = [i for i in table_lookup if i[0] in data_keys]
+        memory_key = ('bundle', section_type, tuple(str(i) for i in file_locations), tuple(model_names),
+                      repr(table_lookup), repr(data_keys))
+        cached_fingerprints, bundle = self._memory_cache.get(memory_key, (None, None))
+        if cached_fingerprints == file_fingerprints:
+            return bundle
+        bundle = None
+        if self.cache_directory and data_keys is None:
+            bundle_hash = hashlib.sha256(section_type.encode())
+            for file_location, model_name in zip(file_locations, model_names):
+                bundle_hash.update(self._get_disk_key(file_location.read_bytes(), model_name, table_lookup).encode())
+            cache_file_location = self.cache_directory.joinpath(
+                '.'.join([section_type.lower(), 'bundle', bundle_hash.hexdigest(), 'pickle']))
+            bundle = self._read_from_disk(cache_file_location)
+        if bundle is None:
+            if data_keys is not None and self.cache_directory:
+                models = {
+                    model_name: self._load_sections_from_disk(file_location, model_name, table_lookup, data_keys)
+                    for file_location, model_name in zip(file_locations, model_names)}
+            else:
+                models = {
+                    model_name: load_processed_file(file_location, model_name, table_lookup, data_keys=data_keys)
+                    for file_location, model_name in zip(file_locations, model_names)}
+            bundle = {
+                'section_type': section_type,
+                'models': models,
+                'statistics': get_reference_statistics({k: v['json'] for k, v in models.items()})}
+            if self.cache_directory and data_keys is None:
+                self._write_to_disk(cache_file_location, bundle)
+        self._memory_cache[memory_key] = (file_fingerprints, bundle)
+        return bundle
+
+
+# cache used by renderers that are not given a cache object, so that baselines are parsed once per process
+default_baseline_cache = BaselineCache()
@@ -0,0 +1,108 @@
+import json
+import pathlib
+import subprocess
+from custom_exceptions import ASHRAE140ProcessingError
+from src.render_dependencies import get_affected_render_functions
+
+root_directory = pathlib.Path(__file__).parent.parent.resolve()
+
+
+def _run_git(git_arguments, repository_directory, check=True):
+    """
+    Run a git command in a repository
+
+    :param git_arguments: git command arguments
+    :param repository_directory: root directory of the git repository
+    :param check: raise an error if the command fails.  Otherwise, None is returned.
+    :return: standard output of the command
+    """
+    try:
+        completed_process = subprocess.run(
+            ['git', ] + git_arguments, cwd=repository_directory, capture_output=True, text=True, check=check)
+    except (OSError, subprocess.CalledProcessError) as e:
+        raise ASHRAE140ProcessingError(
+            'git {} failed: {}'.format(' '.join(git_arguments), getattr(e, 'stderr', None) or str(e)))
+    if completed_process.returncode:
+        return None
+    return completed_process.stdout
+
+
+def get_changed_files(git_ref, directories=('input', 'processed'), repository_directory=None) -> list:
+    """
+    Get the files under a set of directories that were added or modified since a git reference, including
+    uncommitted and untracked files.  Deleted files are not returned.
+
+    :param git_ref: git reference to compare against, e.g. origin/main or a commit hash
+    :param directories: directories relative to the repository root
+    :param repository_directory: root directory of the git repository
+    :return: sorted list of file locations
+    """
+    repository_directory = pathlib.Path(repository_directory or root_directory)
+    changed_files = _run_git(
+        ['diff', '--name-only', '--no-renames', '--diff-filter=d', git_ref, '--', *directories],
+        repository_directory).splitlines()
+    changed_files.extend(_run_git(
+        ['ls-files', '--others', '--exclude-standard', '--', *directories], repository_directory).splitlines())
+    return sorted({repository_directory.joinpath(i) for i in changed_files if i})
+
+
+def get_changed_data_keys(file_location, git_ref, repository_directory=None):
+    """
+    Compare the top level keys of a processed json file with its contents at a git reference.
+
+    :param file_location: processed json file
+    :param git_ref: git reference to compare against
+    :param repository_directory: root directory of the git repository
+    :return: set of top level json keys whose values differ, or None if the file did not exist at the reference
+    """
+    repository_directory = pathlib.Path(repository_directory or root_directory)
+    relative_location = pathlib.Path(file_location).resolve().relative_to(repository_directory.resolve()).as_posix()
+    previous_source = _run_git(['show', ':'.join([git_ref, relative_location])], repository_directory, check=False)
+    try:
+        previous_data = json.loads(previous_source)
+    except (TypeError, ValueError):
+        return None
+    with open(file_location, 'r') as f:
+        current_data = json.load(f)
+    return {
+        i for i in set(previous_data.keys()).union(current_data.keys())
+        if previous_data.get(i) != current_data.get(i)}
+
+
+def plan_render_jobs(processed_files, git_ref, catalog, renderer_class, repository_directory=None) -> dict:
+    """
+    Plan the renders needed for a set of changed processed files.  A changed tested file renders the graphics that
+    depend on the keys that changed, and a changed baseline file renders those graphics for every tested file of its
+    section.  Files that are new since the reference render every graphic.
+
+    :param processed_files: processed json files that changed
+    :param git_ref: git reference to compare against
+    :param catalog: ProcessedCatalog object
+    :param renderer_class: renderer class, e.g. GraphicsRenderer
+    :param repository_directory: root directory of the git repository
+    :return: dictionary of processed file to a list of rendering function names, or None to render every graphic
+    """
+    render_jobs = {}
+
+    def add_render_job(file_location, render_function_names):
+        if render_function_names is None or render_jobs.get(file_location, []) is None:
+            render_jobs[file_location] = None
+            return
+        # keep the functions of the file section, as is done when every graphic is rendered
+        section = ((catalog.get_entry(file_location) or {}).get('section') or '').lower().replace('-', '_')
+        render_function_names = [i for i in render_function_names if section and section in i]
+        if render_function_names:
+            render_jobs[file_location] = sorted(set(render_jobs.get(file_location, [])).union(render_function_names))
+        return
+
+    for file_location in processed_files:
+        changed_data_keys = get_changed_data_keys(file_location, git_ref, repository_directory)
+        render_function_names = None if changed_data_keys is None else get_affected_render_functions(
+            renderer_class, changed_data_keys)
+        if catalog.is_baseline(file_location):
+            for tested_file_location in catalog.get_files(
+                    section=catalog.get_entry(file_location)['section'], baseline=False):
+                add_render_job(tested_file_location, render_function_names)
+        else:
+            add_render_job(pathlib.Path(file_location), render_function_names)
+    return render_jobs
@@ -1,6 +1,9 @@
+import logging
 import pathlib
 import pandas as pd
 from logger import Logger
+from src.validation_events import ValidationEvents
+from src.validation_schema import TablePlan, get_validation_schema
 
 root_directory = pathlib.Path(__file__).parent.parent.resolve()
 
@@ -10,26 +13,15 @@ class DataCleanser(Logger):
     Verification and cleansing of data objects from input testing results in dataframe format.
     """
 
-    def __init__(self, df, logger_level='WARNING', logger_name="console_only_logger"):
+    def __init__(self, df, logger_level='WARNING', logger_name="console_only_logger", validation_events=None):
         super().__init__(logger_level=logger_level, logger_name=logger_name)
         self.input_df = df
         self.df = df
-        # these following three lines do not seem to be geting used.
-        # self.reference_files = [
-        #    'inputs/RESULTS5-2A-EnergyPlus-9.0.1.xlsx',
-        #    'inputs/RESULTS5-2A-BSIMAC-9-9.0.74.xlsx']
-        self.valid_tf_cases = {
-            '600', '610', '620', '630', '640', '650', '660', '670', '680', '685', '695', '900', '910', '920',
-            '930', '940', '950', '960', '980', '985', '995', '195', '200', '210', '215', '220', '230', '240',
-            '250', '270', '280', '290', '300', '310', '320', '395', '400', '410', '420', '430', '440', '450',
-            '460', '470', '800', '810', '600FF', '650FF', '680FF', '900FF', '950FF', '980FF'}
-        self.valid_he_cases = {
-            'CASE HE100', 'CASE HE110', 'CASE HE120', 'CASE HE130', 'CASE HE140', 'CASE HE150', 'CASE HE160',
-            'CASE HE170', 'CASE HE210', 'CASE HE220', 'CASE HE230'}
-        self.valid_months = {
-            'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'
-        }
-
+        # failures are collected as row indices and values, and are only rendered to text in a validation report
+        self.validation_events = ValidationEvents() if validation_events is None else validation_events
+        # valid cases, months, and the limits of each table are read from the validation schema, which is compiled
+        # once per process
+        self.validation_schema = get_validation_schema()
         return
 
     def __repr__(self):
@@ -46,20 +38,21 @@ class DataCleanser(Logger):
         :return: boolean series to filter input dataframe.  The internal cleansed dataframe is also updated with
             erroneous entries removed.
         """
-        self.logger.info('Cleansing column {}'.format(check_column))
+        self.logger.info('Cleansing column %s', check_column)
         try:
-            if test_suite == 'TF':
-                failed_cases = ~self.df[check_column].astype(str).isin(self.valid_tf_cases)
-            elif test_suite == 'HE':
-                failed_cases = ~self.df[check_column].astype(str).isin(self.valid_he_cases)
+            failed_cases = ~self.df[check_column].astype(str).isin(self.validation_schema.valid_cases[test_suite])
             if failed_cases.any():
-                self.logger.error('Error: Invalid Case referenced.  These cases will be removed: {}'
-                                  .format(self.df['case'][failed_cases]))
+                failed_rows = self.df[check_column][failed_cases]
+                validation_event = self.validation_events.add(
+                    'cases', check_column, 'Invalid case referenced.  The rows were removed',
+                    failed_rows.index, failed_rows)
+                self.logger.error('Error: Invalid Case referenced.  These cases will be removed: %s',
+                                  validation_event['values'])
                 self.df = self.df[~failed_cases].reset_index()
         except (KeyError, ValueError):
             failed_cases = None
-            self.logger.error('Error: Case column was improperly referenced ({}).  No validation was performed on this '
-                              'column'.format(check_column))
+            self.logger.error('Error: Case column was improperly referenced (%s).  No validation was performed on this '
+                              'column', check_column)
         return failed_cases
 
     def _check_months(self, check_column):
@@ -70,67 +63,88 @@ class DataCleanser(Logger):
         :return: boolean series to filter input dataframe.  The internal cleansed dataframe is also updated with
             erroneous entries removed.
         """
-        self.logger.info('Cleansing column {}'.format(check_column))
+        self.logger.info('Cleansing column %s', check_column)
         try:
-            failed_cols = ~self.df[check_column].astype(str).isin(self.valid_months)
+            failed_cols = ~self.df[check_column].astype(str).isin(self.validation_schema.valid_months)
             if failed_cols.any():
-                self.logger.error('Error: Invalid month referenced.  These cases will be removed: {}'
-                                  .format(self.df[failed_cols]))
+                failed_rows = self.df[check_column][failed_cols]
+                validation_event = self.validation_events.add(
+                    'months', check_column, 'Invalid month referenced.  The rows were removed',
+                    failed_rows.index, failed_rows)
+                self.logger.error('Error: Invalid month referenced.  These rows will be removed: %s',
+                                  validation_event['row_index'])
                 self.df = self.df[~failed_cols].reset_index()
         except (KeyError, ValueError):
             failed_cols = None
-            self.logger.error('Error: Month column was improperly referenced ({}).  No validation was performed on this'
-                              ' column'.format(check_column))
+            self.logger.error('Error: Month column was improperly referenced (%s).  No validation was performed on this'
+                              ' column', check_column)
         return failed_cols
 
-    def _check_numeric_with_limits(self, check_column, lower_limit=-float("inf"), upper_limit=float("inf")):
+    def _check_numeric_columns(self, column_list):
         """
-        Verify a column is a valid numeric.  Also, optionally verify the values are within specified limits
+        Verify a set of columns are valid numerics within their limits.  All columns are coerced to numeric and
+        compared against their limits in one array operation, see TablePlan.check_numeric, and the failures are then
+        logged column by column.
 
-        :param check_column: Column to verify
-        :param lower_limit: Lowest allowable limit
-        :param upper_limit: Highest allowable limit
-        :return: boolean series to filter input dataframe.  The internal cleansed dataframe is also updated with
-            erroneous entries removed.
-        """
-        self.logger.info('Cleansing column {}'.format(check_column))
-        try:
-            failed_numeric = pd.to_numeric(self.df[check_column], errors='coerce').isnull()
-            if failed_numeric.any():
-                self.logger.error('Info: Values for the {} column did not appear to be numeric and '
-                                  'have been removed\n{}'
-                                  .format(check_column, self.df[check_column][failed_numeric]))
-            self.df[check_column] = self.df[check_column].apply(pd.to_numeric, errors='coerce')
-            failed_limit = ~self.df[check_column]\
-                .apply(lambda x: False if pd.isnull(x) else lower_limit <= int(x) <= upper_limit)
-            if failed_limit.any():
+        :param column_list: TablePlan object, or tuple of tuple containing numeric check, where inner tuple is:
+            0 - column name
+            1 - kwargs for numeric check function (lower_limit, upper_limit)
+        :return: boolean dataframe of the failed values of each verified column.  The internal cleansed dataframe is
+            also updated with the failed values removed.
+        """
+        if isinstance(column_list, TablePlan):
+            table_plan = column_list
+        else:
+            table_plan = TablePlan(
+                table_name=None,
+                section_type=None,
+                table_schema={'columns': {
+                    column_name: {**kwargs, 'type': 'numeric'}
+                    for column_name, kwargs in self._get_column_instructions(column_list)}})
+        check_columns = []
+        for column_name in table_plan.numeric_columns:
+            self.logger.info('Cleansing column %s', column_name)
+            if column_name not in self.df.columns:
+                self.logger.error('Error: The %s column was improperly referenced for numeric verification. '
+                                  'No validation was performed on this column', column_name)
+                continue
+            check_columns.append(column_name)
+        check_columns, numeric_df, failed_numeric, failed_limits = table_plan.check_numeric(self.df, check_columns)
+        for column_index, column_name in enumerate(check_columns):
+            if failed_numeric[:, column_index].any():
+                failed_rows = self.df[column_name][failed_numeric[:, column_index]]
+                validation_event = self.validation_events.add(
+                    'numeric', column_name, 'Values did not appear to be numeric and have been removed',
+                    failed_rows.index, failed_rows)
+                self.logger.error('Info: Values for the %s column did not appear to be numeric and '
+                                  'have been removed from rows %s', column_name, validation_event['row_index'])
+            if failed_limits[:, column_index].any():
+                failed_rows = numeric_df[column_name][failed_limits[:, column_index]]
+                validation_event = self.validation_events.add(
+                    'limits', column_name, 'Values were either missing or appeared to be incorrect and have been '
+                    'removed', failed_rows.index, failed_rows, level=logging.WARNING)
                 self.logger.warning(
-                    'Info: Values for the {} column were either missing or appeared to be incorrect '
-                    'and the values have been removed\n{}'.format(check_column, self.df[check_column][failed_limit]))
-                self.df.loc[failed_limit, check_column] = None
-        except (KeyError, ValueError):
-            import traceback
-            print(traceback.print_exc())
-            failed_limit = None
-            self.logger.error('Error: The {} column was improperly referenced for numeric verification. '
-                              'No validation was performed on this column'
-                              .format(check_column))
-        return failed_limit
+                    'Info: Values for the %s column were either missing or appeared to be incorrect '
+                    'and the values have been removed from rows %s', column_name, validation_event['row_index'])
+                numeric_df[column_name] = numeric_df[column_name].mask(failed_limits[:, column_index])
+        if check_columns:
+            self.df[check_columns] = numeric_df
+        return pd.DataFrame(failed_limits, index=self.df.index, columns=check_columns)
 
-    def _check_columns(self, column_check_function, column_list):
+    def _get_column_instructions(self, column_list):
         """
-        format instructions and iterate a column check function
+        format column check instructions
 
-        :param column_check_function: function to iterate
-        :param column_list: list of columns to iterate over. This is a
+        :param column_list: list of columns.  This is a
             tuple of tuple containing numeric check, where inner tuple is:
                 0 - column name
                 1 - kwargs for numeric check function
-        :return: Updated self.df dataframe
+        :return: list of tuples of column name and kwargs
         """
         # reformat numeric column list in case it was accidentally passed as string
         if isinstance(column_list, str):
             column_list = [column_list, ]
+        column_instructions = []
         for numeric_check_instructions in column_list:
             # process if kwargs were given
             if isinstance(numeric_check_instructions, (tuple, list)):
@@ -141,322 +155,26 @@ class DataCleanser(Logger):
                 kwargs = {}
             else:
                 self.logger.error('Error: Invalid numeric columns input.  This validation was not performed')
-                return self.df
-            column_check_function(check_column=column_name, **kwargs)
-        return
+                break
+            column_instructions.append((column_name, kwargs))
+        return column_instructions
 
-    def cleanse_conditioned_zone_loads_non_free_float(
-            self,
-            case_column: str = 'case',
-            numeric_columns: list = (
-                ('peak_heating_hour', {'lower_limit': 0, 'upper_limit': 24}),
-                ('peak_cooling_hour', {'lower_limit': 0, 'upper_limit': 24}), ), ):
+    def cleanse(self, table_name, section_type='TF'):
         """
-        Perform operations to cleanse and verify data for the Conditioned Zone Loads (Non-Free-Float Test Cases) table.
+        Perform operations to cleanse and verify data for a table of the validation schema.  The case and month
+        columns of the table are verified first, and then all of its numeric columns in one pass.
 
-        :param case_column: column containing test case identifiers
-        :param numeric_columns: tuple of tuple containing numeric check, where inner tuple is:
-            0 - column name
-            1 - kwargs for numeric check function
-        :return: Cleansed pandas DataFrame
-        """
-        self.logger.info('Cleansing Conditioned Zone Loads (Non-Free-Float Test Cases) table')
-        self._check_cases(case_column)
-        self._check_columns(
-            column_check_function=self._check_numeric_with_limits,
-            column_list=numeric_columns)
-        return self.df
-
-    def cleanse_solar_radiation_annual(
-            self,
-            case_column: str = None,
-            numeric_columns: list = (
-                ('kWh/m2', {'lower_limit': 0}), )):
-        """
-        Perform operations to cleanse and verify data for the Annual Solar Radiation (Direct + Diffuse)
-        :param case_column: column containing test case identifiers
-        :param numeric_columns: tuple of tuple containing numeric check, where inner tuple is:
-            0 - column name
-            1 - kwargs for numeric check function
-        :return: Cleansed pandas DataFrame
-        """
-        self.logger.info('Cleansing Solar Radiation Annual Incident table')
-        if case_column:
-            self._check_cases(case_column)
-        self._check_columns(
-            column_check_function=self._check_numeric_with_limits,
-            column_list=numeric_columns)
-        return self.df
-
-    def cleanse_sky_temperature_output(
-            self,
-            case_column: str = 'case',
-            numeric_columns: list = (
-                ('Ann. Hourly Average C', {'lower_limit': -50, 'upper_limit': 50}),
-                ('Minimum C', {'lower_limit': -100, 'upper_limit': 100}),
-                ('Minimum Day', {'lower_limit': 1, 'upper_limit': 31}),
-                ('Minimum Hour', {'lower_limit': 0, 'upper_limit': 24}),
-                ('Maximum C', {'lower_limit': -100, 'upper_limit': 100}),
-                ('Maximum Day', {'lower_limit': 1, 'upper_limit': 31}),
-                ('Maximum Hour', {'lower_limit': 0, 'upper_limit': 24}))):
-        """
-        Perform operations to cleanse and verify data for the Sky Temperature Output table
-        :param case_column: column containing test case identifiers
-        :param numeric_columns: tuple of tuple containing numeric check, where inner tuple is:
-            0 - column name
-            1 - kwargs for numeric check function
-        :return: Cleansed pandas DataFrame
-        """
-        self.logger.info('Cleansing sky temperature output')
-        # check case column
-        self._check_cases(case_column)
-        self._check_columns(
-            column_check_function=self._check_numeric_with_limits,
-            column_list=numeric_columns)
-        return self.df
-
-    def cleanse_monthly_conditioned_loads(
-            self,
-            case_column: str = 'case',
-            month_column: str = 'month',
-            numeric_columns: list = (
-                ('total_heating_kwh', {'lower_limit': 0, 'upper_limit': 1000}),
-                ('total_cooling_kwh', {'lower_limit': 0, 'upper_limit': 1000}),
-                ('peak_heating_kw', {'lower_limit': 0, 'upper_limit': 10}),
-                ('peak_heating_day', {'lower_limit': 1, 'upper_limit': 31}),
-                ('peak_heating_hour', {'lower_limit': 0, 'upper_limit': 24}),
-                ('peak_cooling_kw', {'lower_limit': 0, 'upper_limit': 10}),
-                ('peak_cooling_day', {'lower_limit': 1, 'upper_limit': 31}),
-                ('peak_cooling_hour', {'lower_limit': 0, 'upper_limit': 24}))):
-        """
-        Perform operations to cleanse and verify data for the Sky Temperature Output table
-        :param case_column: column containing test case identifiers
-        :param month_column: column containing month values
-        :param numeric_columns: tuple of tuple containing numeric check, where inner tuple is:
-            0 - column name
-            1 - kwargs for numeric check function
-        :return: Cleansed pandas DataFrame
-        """
-        self.logger.info('Cleansing Monthly Conditioned Loads')
-        # check case column
-        self._check_cases(case_column)
-        self._check_months(month_column)
-        self._check_columns(
-            column_check_function=self._check_numeric_with_limits,
-            column_list=numeric_columns)
-        return self.df
-
-    def cleanse_specific_day_hourly_output_incident_solar_radiation(
-        self,
-        numeric_columns: list = (
-            ('hour', {'lower_limit': 0, 'upper_limit': 24}),
-            ('horizontal', {'lower_limit': 0, 'upper_limit': 10000}),
-            ('south', {'lower_limit': 0, 'upper_limit': 10000}),
-            ('west', {'lower_limit': 0, 'upper_limit': 10000}))):
-        """
-        Perform operations to cleanse and verify data for the Sky Temperature Output table
-        :param numeric_columns: tuple of tuple containing numeric check, where inner tuple is:
-            0 - column name
-            1 - kwargs for numeric check function
-        :return: Cleansed pandas DataFrame
-        """
-        self.logger.info('Cleansing Specific Day Hourly Output Table')
-        # check case column
-        self._check_columns(
-            column_check_function=self._check_numeric_with_limits,
-            column_list=numeric_columns)
-        return self.df
-
-    def cleanse_specific_day_hourly_output_free_float_zone_temperatures(
-            self,
-            numeric_columns: list = (
-                ('hour', {'lower_limit': 0, 'upper_limit': 24}),
-                ('600FF', {'lower_limit': -100, 'upper_limit': 100}),
-                ('900FF', {'lower_limit': -100, 'upper_limit': 100}),
-                ('650FF', {'lower_limit': -100, 'upper_limit': 100}),
-                ('950FF', {'lower_limit': -100, 'upper_limit': 100}),
-                ('680FF', {'lower_limit': -100, 'upper_limit': 100}),
-                ('980FF', {'lower_limit': -100, 'upper_limit': 100}))):
-        """
-        Perform operations to cleanse and verify data for the Sky Temperature Output table
-        :param numeric_columns: tuple of tuple containing numeric check, where inner tuple is:
-            0 - column name
-            1 - kwargs for numeric check function
-        :return: Cleansed pandas DataFrame
-        """
-        self.logger.info('Cleansing Specific Day Hourly Output Free Float Temperatures Table')
-        self._check_columns(
-            column_check_function=self._check_numeric_with_limits,
-            column_list=numeric_columns)
-        return self.df
-
-    def cleanse_specific_day_hourly_output_free_float_zone_loads_feb_1(
-        self,
-        numeric_columns: list = (
-            ('hour', {'lower_limit': 0, 'upper_limit': 24}),
-            ('600', {'lower_limit': -100, 'upper_limit': 100}),
-            ('640', {'lower_limit': -100, 'upper_limit': 100}),
-            ('660', {'lower_limit': -100, 'upper_limit': 100}),
-            ('670', {'lower_limit': -100, 'upper_limit': 100}),
-            ('680', {'lower_limit': -100, 'upper_limit': 100}),
-            ('685', {'lower_limit': -100, 'upper_limit': 100}),
-            ('695', {'lower_limit': -100, 'upper_limit': 100}),
-            ('900', {'lower_limit': -100, 'upper_limit': 100}),
-            ('940', {'lower_limit': -100, 'upper_limit': 100}),
-            ('980', {'lower_limit': -100, 'upper_limit': 100}),
-            ('985', {'lower_limit': -100, 'upper_limit': 100}),
-            ('995', {'lower_limit': -100, 'upper_limit': 100}))):
-        """
-        Perform operations to cleanse and verify data for the Sky Temperature Output table
-        :param numeric_columns: tuple of tuple containing numeric check, where inner tuple is:
-            0 - column name
-            1 - kwargs for numeric check function
-        :return: Cleansed pandas DataFrame
-        """
-        self.logger.info('Cleansing Specific Day Hourly Output Free Float Zone Loads Table')
-        # check case column
-        self._check_columns(
-            column_check_function=self._check_numeric_with_limits,
-            column_list=numeric_columns)
-        return self.df
-
-    def cleanse_specific_day_hourly_output_free_float_zone_loads_july_14(
-            self,
-            numeric_columns: list = (
-                ('hour', {'lower_limit': 0, 'upper_limit': 24}),
-                ('600', {'lower_limit': -100, 'upper_limit': 100}),
-                ('660', {'lower_limit': -100, 'upper_limit': 100}),
-                ('670', {'lower_limit': -100, 'upper_limit': 100}),
-                ('670', {'lower_limit': -100, 'upper_limit': 100}),
-                ('680', {'lower_limit': -100, 'upper_limit': 100}),
-                ('685', {'lower_limit': -100, 'upper_limit': 100}),
-                ('695', {'lower_limit': -100, 'upper_limit': 100}),
-                ('900', {'lower_limit': -100, 'upper_limit': 100}),
-                ('980', {'lower_limit': -100, 'upper_limit': 100}),
-                ('985', {'lower_limit': -100, 'upper_limit': 100}),
-                ('995', {'lower_limit': -100, 'upper_limit': 100}))):
-        """
-        Perform operations to cleanse and verify data for the Sky Temperature Output table
-        :param numeric_columns: tuple of tuple containing numeric check, where inner tuple is:
-            0 - column name
-            1 - kwargs for numeric check function
-        :return: Cleansed pandas DataFrame
-        """
-        self.logger.info('Cleansing Specific Day Hourly Output Free Float Zone Loads Table')
-        # check case column
-        self._check_columns(
-            column_check_function=self._check_numeric_with_limits,
-            column_list=numeric_columns)
-        return self.df
-
-    def cleanse_specific_day_hourly_output_free_float_zone_loads_zone_temps(
-            self,
-            numeric_columns: list = (
-                ('hour', {'lower_limit': 0, 'upper_limit': 24}),
-                ('640', {'lower_limit': -100, 'upper_limit': 100}),
-                ('940', {'lower_limit': -100, 'upper_limit': 100}))):
-        """
-        Perform operations to cleanse and verify data for the Sky Temperature Output table
-        :param numeric_columns: tuple of tuple containing numeric check, where inner tuple is:
-            0 - column name
-            1 - kwargs for numeric check function
-        :return: Cleansed pandas DataFrame
-        """
-        self.logger.info('Cleansing Specific Day Hourly Output Free Float Zone Loads Table')
-        # check case column
-        self._check_columns(
-            column_check_function=self._check_numeric_with_limits,
-            column_list=numeric_columns)
-        return self.df
-
-    def cleanse_specific_day_hourly_output_transmitted_total_solar_radiation(
-            self,
-            numeric_columns: list = (
-                ('hour', {'lower_limit': 0, 'upper_limit': 24}),
-                ('feb_1', {'lower_limit': -100, 'upper_limit': 1000}),
-                ('may_4', {'lower_limit': -100, 'upper_limit': 1000}),
-                ('july_14', {'lower_limit': -100, 'upper_limit': 1000}))):
-        """
-        Perform operations to cleanse and verify data for the Sky Temperature Output table
-        :param numeric_columns: tuple of tuple containing numeric check, where inner tuple is:
-            0 - column name
-            1 - kwargs for numeric check function
-        :return: Cleansed pandas DataFrame
-        """
-        self.logger.info('Cleansing Monthly Conditioned Loads')
-        # check case column
-        self._check_columns(
-            column_check_function=self._check_numeric_with_limits,
-            column_list=numeric_columns)
-        return self.df
-
-    def cleanse_free_float_case_zone_temperatures(
-            self,
-            case_column: str = 'case',
-            numeric_columns: list = (
-                ('average_temperature', {'lower_limit': 0, 'upper_limit': 50}),
-                ('minimum_temperature', {'lower_limit': -50, 'upper_limit': 50}),
-                ('minimum_day', {'lower_limit': 1, 'upper_limit': 31}),
-                ('minimum_hour', {'lower_limit': 0, 'upper_limit': 24}),
-                ('maximum_temperature', {'lower_limit': 0, 'upper_limit': 100}),
-                ('maximum_day', {'lower_limit': 1, 'upper_limit': 31}),
-                ('maximum_hour', {'lower_limit': 0, 'upper_limit': 24}))):
-        """
-        Perform operations to cleanse and verify data for the free float case zone temperatures table
-        :param case_column: column containing test case identifiers
-        :param numeric_columns: tuple of tuple containing numeric check, where inner tuple is:
-            0 - column name
-            1 - kwargs for numeric check function
-        :return: Cleansed pandas DataFrame
-        """
-        self.logger.info('Cleansing free float case zone temperature output')
-        # check case column
-        self._check_cases(case_column)
-        self._check_columns(
-            column_check_function=self._check_numeric_with_limits,
-            column_list=numeric_columns)
-        return self.df
-
-    def cleanse_he_furnace_energy(
-            self,
-            case_column: str = 'case',
-            numeric_columns: list = (
-                ('GJ', {'lower_limit': 0}), )):
-        """
-        Perform operations to cleanse and verify data for the heating equipment furnace load
-        :param case_column: column containing test case identifiers
-        :param numeric_columns: tuple of tuple containing numeric check, where inner tuple is:
-            0 - column name
-            1 - kwargs for numeric check function
-        :return: Cleansed pandas DataFrame
-        """
-        self.logger.info('Cleansing heating equipment furnace energy related')
-        if case_column:
-            self._check_cases(case_column, 'HE')
-        self._check_columns(
-            column_check_function=self._check_numeric_with_limits,
-            column_list=numeric_columns)
-        return self.df
-
-    def cleanse_he_temperature(
-            self,
-            case_column: str = 'case',
-            numeric_columns: list = (
-                ('C', {'lower_limit': -40, 'upper_limit': 100}), )):
-        """
-        Perform operations to cleanse and verify data for the heating equipment furnace load
-        :param case_column: column containing test case identifiers
-        :param numeric_columns: tuple of tuple containing numeric check, where inner tuple is:
-            0 - column name
-            1 - kwargs for numeric check function
+        :param table_name: table key of the validation schema, e.g. monthly_conditioned_zone_loads
+        :param section_type: section type (e.g. TF, GC, HE)
         :return: Cleansed pandas DataFrame
         """
-        self.logger.info('Cleansing heating equipment furnace energy related')
-        if case_column:
-            self._check_cases(case_column, 'HE')
-        self._check_columns(
-            column_check_function=self._check_numeric_with_limits,
-            column_list=numeric_columns)
+        table_plan = self.validation_schema.get_plan(section_type, table_name)
+        self.logger.info('Cleansing %s table', table_name)
+        if table_plan.case_column and table_plan.valid_cases is not None:
+            self._check_cases(table_plan.case_column, section_type)
+        if table_plan.month_column:
+            self._check_months(table_plan.month_column)
+        self._check_numeric_columns(table_plan)
         return self.df
 
     # todo_140: Make a set of verification test that ensure the data is good for a specific output graphic
@@ -5,6 +5,10 @@ from descriptors import VerifyInputFile
 from logger import Logger
 from custom_exceptions import ASHRAE140ProcessingError
 from src.data_cleanser import DataCleanser
+from src.validation_events import ValidationEvents
+from src.validation_schema import get_validation_schema
+from src.workbook_session import WorkbookSession
+from src.frame_converter import frame_to_nested_dict, wide_frame_to_nested_dict
 
 
 class SectionType:
@@ -23,9 +27,8 @@ class SectionType:
         elif re.match(r'.*Std140_HE_Output.*', str(value.name), re.IGNORECASE):
             obj._section_type = 'HE'
         else:
-            obj.logger.error('Error: The file name ({}) did not match formatting guidelines or '
-                             'the referenced section at the beginning of the name is not supported'
-                             .format(str(value.name)))
+            obj.logger.error('Error: The file name (%s) did not match formatting guidelines or '
+                             'the referenced section at the beginning of the name is not supported', value.name)
         return
 
 
@@ -81,13 +84,18 @@ class SetDataSources:
                     'minimum_zone_temperature': ('Sheet1', 93, 'A:B', 3)
                 }
             else:
-                obj.logger.error('Error: Section ({}) is not currently supported'.format(obj.section_type))
+                obj.logger.error('Error: Section (%s) is not currently supported', obj.section_type)
         return
 
 
 class SetProcessingFunctions:
     """
-    Set the functions to perform for processing.
+    Set the functions to perform for processing.  The functions are not evaluated here; they are called by run() for
+    the requested tables only.
+
+    processing_functions formatting:
+        0 - extraction method
+        1 - data_sources region read by the extraction method
     """
     def __get__(self, obj, owner):
         processing_functions = obj._processing_functions
@@ -96,37 +104,49 @@ class SetProcessingFunctions:
     def __set__(self, obj, value):
         if value == 'TF':
             obj._processing_functions = {
-                'identifying_information': obj._extract_identifying_information_tf(),
-                'conditioned_zone_loads_non_free_float': obj._extract_conditioned_zone_loads_non_free_float(),
-                'solar_radiation_annual_incident': obj._extract_solar_radiation_annual_incident(),
-                'solar_radiation_unshaded_annual_transmitted': obj._extract_solar_radiation_unshaded_annual_transmitted(),
-                'solar_radiation_shaded_annual_transmitted': obj._extract_solar_radiation_shaded_annual_transmitted(),
-                'sky_temperature_output': obj._extract_sky_temperature_output(),
-                'hourly_annual_zone_temperature_bin_data': obj._extract_hourly_annual_zone_temperature_bin_data(),
-                'free_float_case_zone_temperatures': obj._extract_free_float_case_zone_temperatures(),
-                'monthly_conditioned_zone_loads': obj._extract_monthly_conditioned_zone_loads(),
-                'specific_day_hourly_output': obj._extract_specific_day_hourly_output(),
-                'specific_day_hourly_output_free_float_zone_temperatures':
-                    obj._extract_specific_day_hourly_output_free_float_zone_temperatures(),
-                'specific_day_hourly_output_free_float_zone_loads':
-                    obj._extract_specific_day_hourly_output_free_float_zone_loads()}
+                'identifying_information': (obj._extract_identifying_information_tf, 'identifying_information'),
+                'conditioned_zone_loads_non_free_float': (
+                    obj._extract_conditioned_zone_loads_non_free_float, 'conditioned_zone_loads_non_free_float'),
+                'solar_radiation_annual_incident': (
+                    obj._extract_solar_radiation_annual_incident, 'solar_radiation_annual_incident'),
+                'solar_radiation_unshaded_annual_transmitted': (
+                    obj._extract_solar_radiation_unshaded_annual_transmitted,
+                    'solar_radiation_unshaded_annual_transmitted'),
+                'solar_radiation_shaded_annual_transmitted': (
+                    obj._extract_solar_radiation_shaded_annual_transmitted,
+                    'solar_radiation_shaded_annual_transmitted'),
+                'sky_temperature_output': (obj._extract_sky_temperature_output, 'sky_temperature_output'),
+                'hourly_annual_zone_temperature_bin_data': (
+                    obj._extract_hourly_annual_zone_temperature_bin_data, 'annual_hourly_zone_temperature_bin_data'),
+                'free_float_case_zone_temperatures': (
+                    obj._extract_free_float_case_zone_temperatures, 'free_float_case_zone_temperatures'),
+                'monthly_conditioned_zone_loads': (
+                    obj._extract_monthly_conditioned_zone_loads, 'monthly_conditioned_zone_loads'),
+                'specific_day_hourly_output': (
+                    obj._extract_specific_day_hourly_output, 'specific_day_hourly_output'),
+                'specific_day_hourly_output_free_float_zone_temperatures': (
+                    obj._extract_specific_day_hourly_output_free_float_zone_temperatures,
+                    'specific_day_hourly_output_free_float_zone_temperatures'),
+                'specific_day_hourly_output_free_float_zone_loads': (
+                    obj._extract_specific_day_hourly_output_free_float_zone_loads,
+                    'specific_day_hourly_output_free_float_zone_loads')}
         elif value == 'GC':
             obj._processing_functions = {
-                'identifying_information': obj._extract_identifying_information_gc(),
-                'steady_state_cases': obj._extract_steady_state_cases()}
+                'identifying_information': (obj._extract_identifying_information_gc, 'identifying_information'),
+                'steady_state_cases': (obj._extract_steady_state_cases, 'steady_state_cases')}
         elif value == 'HE':
             obj._processing_functions = {
-                'identifying_information': obj._extract_identifying_information_he(),
-                'furnace_loads': obj._extract_he_furnace_load(),
-                'furnace_input': obj._extract_he_furnace_input(),
-                'fuel_consumption': obj._extract_he_fuel_consumption(),
-                'fan_energy': obj._extract_he_fan_energy(),
-                'mean_zone_temperature': obj._extract_he_mean_zone_temperature(),
-                'maximum_zone_temperature': obj._extract_he_maximum_zone_temperature(),
-                'minimum_zone_temperature': obj._extract_he_minimum_zone_temperature()
+                'identifying_information': (obj._extract_identifying_information_he, 'identifying_information'),
+                'furnace_loads': (obj._extract_he_furnace_load, 'total_furnace_load'),
+                'furnace_input': (obj._extract_he_furnace_input, 'total_furnace_input'),
+                'fuel_consumption': (obj._extract_he_fuel_consumption, 'fuel_consumption'),
+                'fan_energy': (obj._extract_he_fan_energy, 'fan_energy_both_fans'),
+                'mean_zone_temperature': (obj._extract_he_mean_zone_temperature, 'mean_zone_temperature'),
+                'maximum_zone_temperature': (obj._extract_he_maximum_zone_temperature, 'maximum_zone_temperature'),
+                'minimum_zone_temperature': (obj._extract_he_minimum_zone_temperature, 'minimum_zone_temperature')
             }
         else:
-            obj.logger.error('Error: Section ({}) is not currently supported'.format(obj.section_type))
+            obj.logger.error('Error: Section (%s) is not currently supported', obj.section_type)
         return
 
 
@@ -136,6 +156,9 @@ class ExcelProcessor(Logger):
 
     :param file_location: location of file to be processed
     :param data_sources (Optional): data extraction instructions.
+    :param tables (Optional): table keys to extract.  All tables for the section are extracted if not provided.
+    :param ingest_cache (Optional): IngestCache object used to serve raw workbook rows and extracted tables from
+        previous runs.
     """
 
     file_location = VerifyInputFile()
@@ -147,14 +170,21 @@ class ExcelProcessor(Logger):
             self,
             file_location,
             data_sources=None,
+            tables=None,
+            ingest_cache=None,
             logger_level="WARNING",
             logger_name="console_only_logger"):
         super().__init__(logger_level=logger_level, logger_name=logger_name)
         self.file_location = file_location
         self.section_type = self.file_location
         self.data_sources = data_sources
+        self.workbook = WorkbookSession(file_location=self.file_location, data_sources=self.data_sources)
         self.processing_functions = self.section_type
+        self.tables = tables
+        self.ingest_cache = ingest_cache
         self.test_data = {}
+        # validation failures of every table cleansed by the processor
+        self.validation_events = ValidationEvents()
         self.software_name = None
         self.software_version = None
         self.software_release_date = None
@@ -168,24 +198,16 @@ class ExcelProcessor(Logger):
 
     def _get_data(self, region_name) -> pd.DataFrame:
         """
-        Retrieve section of data and return it as a pandas dataframe
+        Retrieve section of data and return it as a pandas dataframe.  The region is sliced from the in-memory copy
+        of the workbook, which is read once by run() for all requested tables.
 
         :param region_name: Named section of data in the data_sources class object.
         :return: Section of excel file converted to dataframe
         """
-        try:
-            data_source = self.data_sources[region_name]
-        except KeyError:
+        if region_name not in self.data_sources:
             raise ASHRAE140ProcessingError('Data extraction instructions for Identifying Information section '
                                            'was not found')
-        data_tab, skip_rows, excel_cols, n_rows, kwargs = [*list(data_source) + [{}] * 5][:5]
-        df = pd.read_excel(
-            self.file_location,
-            sheet_name=data_tab,
-            skiprows=skip_rows,
-            usecols=excel_cols,
-            nrows=n_rows,
-            **kwargs)
+        df = self.workbook.get_region(region_name)
         # todo_140: Write simple verifications that data loaded
         return df
 
@@ -232,15 +254,13 @@ class ExcelProcessor(Logger):
                       'peak_heating_day', 'peak_heating_hour', 'peak_cooling_kW', 'peak_cooling_month',
                       'peak_cooling_day', 'peak_cooling_hour']
         df['case'] = df['case'].astype(str)
-        dc = DataCleanser(df)
-        df = dc.cleanse_conditioned_zone_loads_non_free_float()
+        dc = DataCleanser(df, validation_events=self.validation_events)
+        df = dc.cleanse('conditioned_zone_loads_non_free_float', self.section_type)
         # format cleansed dataframe into dictionary
-        data_d = {}
-        for idx, row in df.iterrows():
-            case_number = row[0]
-            row_obj = df.iloc[idx, 1:].to_dict()
-            data_d.update({
-                str(case_number): row_obj})
+        data_d = frame_to_nested_dict(
+            df,
+            key_columns=['case', ],
+            value_columns=[i for i in df.columns if i not in ['case', 'index']])
         return data_d
 
     def _extract_solar_radiation_annual_incident(self) -> dict:
@@ -251,12 +271,13 @@ class ExcelProcessor(Logger):
         """
         df = self._get_data('solar_radiation_annual_incident')
         df.columns = ['Surface', 'kWh/m2']
-        dc = DataCleanser(df)
-        df = dc.cleanse_solar_radiation_annual()
-        data_d = {'600': {'Surface': {}}}
-        for idx, row in df.iterrows():
-            data_d['600']['Surface'].update({
-                str(row['Surface']): {'kWh/m2': row['kWh/m2']}})
+        dc = DataCleanser(df, validation_events=self.validation_events)
+        df = dc.cleanse('solar_radiation_annual_incident', self.section_type)
+        df['Surface'] = df['Surface'].astype(str)
+        data_d = {'600': {'Surface': frame_to_nested_dict(
+            df,
+            key_columns=['Surface', ],
+            value_columns=['kWh/m2', ])}}
         return data_d
 
     def _extract_solar_radiation_unshaded_annual_transmitted(self) -> dict:
@@ -270,16 +291,14 @@ class ExcelProcessor(Logger):
         df.columns = ['Case/Surface', 'kWh/m2']
         df[['Case', 'Surface']] = df['Case/Surface'].str.split(pat='/', expand=True)
         df = df.drop(columns=['Case/Surface', ])
-        dc = DataCleanser(df)
-        df = dc.cleanse_solar_radiation_annual(case_column='Case')
-        data_d = {}
-        for idx, row in df.iterrows():
-            data_d.update(
-                {
-                    row['Case']: {
-                        'Surface': {
-                            row['Surface']: {
-                                'kWh/m2': row['kWh/m2']}}}})
+        dc = DataCleanser(df, validation_events=self.validation_events)
+        df = dc.cleanse('solar_radiation_unshaded_annual_transmitted', self.section_type)
+        data_d = {
+            case_number: {'Surface': surface_d}
+            for case_number, surface_d in frame_to_nested_dict(
+                df,
+                key_columns=['Case', 'Surface'],
+                value_columns=['kWh/m2', ]).items()}
         return data_d
 
     def _extract_solar_radiation_shaded_annual_transmitted(self):
@@ -293,16 +312,14 @@ class ExcelProcessor(Logger):
         df.columns = ['Case/Surface', 'kWh/m2']
         df[['Case', 'Surface']] = df['Case/Surface'].str.split(pat='/', expand=True)
         df = df.drop(columns=['Case/Surface', ])
-        dc = DataCleanser(df)
-        df = dc.cleanse_solar_radiation_annual(case_column='Case')
-        data_d = {}
-        for idx, row in df.iterrows():
-            data_d.update(
-                {
-                    row['Case']: {
-                        'Surface': {
-                            row['Surface']: {
-                                'kWh/m2': row['kWh/m2']}}}})
+        dc = DataCleanser(df, validation_events=self.validation_events)
+        df = dc.cleanse('solar_radiation_shaded_annual_transmitted', self.section_type)
+        data_d = {
+            case_number: {'Surface': surface_d}
+            for case_number, surface_d in frame_to_nested_dict(
+                df,
+                key_columns=['Case', 'Surface'],
+                value_columns=['kWh/m2', ]).items()}
         return data_d
 
     def _extract_sky_temperature_output(self) -> dict:
@@ -314,22 +331,24 @@ class ExcelProcessor(Logger):
         df = self._get_data('sky_temperature_output')
         df.columns = ['case', 'Ann. Hourly Average C', 'Minimum C', 'Minimum Month', 'Minimum Day', 'Minimum Hour',
                       'Maximum C', 'Maximum Month', 'Maximum Day', 'Maximum Hour']
-        dc = DataCleanser(df)
-        df = dc.cleanse_sky_temperature_output()
+        dc = DataCleanser(df, validation_events=self.validation_events)
+        df = dc.cleanse('sky_temperature_output', self.section_type)
         data_d = {'600': {}}
-        for idx, row in df.iterrows():
-            data_d['600'].update({'Average': {'C': row['Ann. Hourly Average C']}})
-            data_d['600'].update({'Minimum': {
-                'C': row['Minimum C'],
-                'Month': row['Minimum Month'],
-                'Day': row['Minimum Day'],
-                'Hour': row['Minimum Hour']}})
-            data_d['600'].update({'Maximum': {
-                'C': row['Maximum C'],
-                'Month': row['Maximum Month'],
-                'Day': row['Maximum Day'],
-                'Hour': row['Maximum Hour']
-            }})
+        if df.shape[0] > 0:
+            # only the last row of the table is reported
+            row = dict(zip(df.columns, df.to_numpy()[-1].tolist()))
+            data_d['600'].update({
+                'Average': {'C': row['Ann. Hourly Average C']},
+                'Minimum': {
+                    'C': row['Minimum C'],
+                    'Month': row['Minimum Month'],
+                    'Day': row['Minimum Day'],
+                    'Hour': row['Minimum Hour']},
+                'Maximum': {
+                    'C': row['Maximum C'],
+                    'Month': row['Maximum Month'],
+                    'Day': row['Maximum Day'],
+                    'Hour': row['Maximum Hour']}})
         return data_d
 
     def _extract_hourly_annual_zone_temperature_bin_data(self) -> dict:
@@ -340,10 +359,11 @@ class ExcelProcessor(Logger):
         """
         df = self._get_data('annual_hourly_zone_temperature_bin_data')
         df.columns = ['temperature_bin_c', 'number_of_hours']
-        data_d = {'900FF': {'temperature_bin_c': {}}}
-        for idx, row in df.iterrows():
-            data_d['900FF']['temperature_bin_c'].update(
-                {int(row['temperature_bin_c']): {'number_of_hours': int(row['number_of_hours'])}})
+        df = df.astype(int)
+        data_d = {'900FF': {'temperature_bin_c': frame_to_nested_dict(
+            df,
+            key_columns=['temperature_bin_c', ],
+            value_columns=['number_of_hours', ])}}
         return data_d
 
     def _extract_free_float_case_zone_temperatures(self):
@@ -354,14 +374,13 @@ class ExcelProcessor(Logger):
         df = self._get_data('free_float_case_zone_temperatures')
         df.columns = ['case', 'average_temperature', 'minimum_temperature', 'minimum_month', 'minimum_day', 'minimum_hour',
                       'maximum_temperature', 'maximum_month', 'maximum_day', 'maximum_hour']
-        dc = DataCleanser(df)
-        df = dc.cleanse_free_float_case_zone_temperatures()
-        data_d = {}
-        for idx, row in df.iterrows():
-            case_number = row[0]
-            row_obj = df.iloc[idx, 1:].to_dict()
-            data_d.update({
-                str(case_number): row_obj})
+        dc = DataCleanser(df, validation_events=self.validation_events)
+        df = dc.cleanse('free_float_case_zone_temperatures', self.section_type)
+        df['case'] = df['case'].astype(str)
+        data_d = frame_to_nested_dict(
+            df,
+            key_columns=['case', ],
+            value_columns=[i for i in df.columns if i not in ['case', 'index']])
         return data_d
 
     def _extract_monthly_conditioned_zone_loads(self):
@@ -378,20 +397,16 @@ class ExcelProcessor(Logger):
         df_900 = df.iloc[:, [0, ] + list(range(9, 17))].copy()
         df_900.columns = df_columns
         df_900['case'] = '900'
-        dc_600 = DataCleanser(df_600)
-        dc_900 = DataCleanser(df_900)
-        df_600 = dc_600.cleanse_monthly_conditioned_loads()
-        df_900 = dc_900.cleanse_monthly_conditioned_loads()
+        dc_600 = DataCleanser(df_600, validation_events=self.validation_events)
+        dc_900 = DataCleanser(df_900, validation_events=self.validation_events)
+        df_600 = dc_600.cleanse('monthly_conditioned_zone_loads', self.section_type)
+        df_900 = dc_900.cleanse('monthly_conditioned_zone_loads', self.section_type)
         df = pd.concat([df_600, df_900], ignore_index=True)
-        data_d = {}
-        for idx, row in df.iterrows():
-            case_number = str(row['case'])
-            col_idx = [i for i, j in enumerate(df.columns) if j not in ['case', 'index', 'month']]
-            row_obj = df.iloc[idx, col_idx].to_dict()
-            if not data_d.get(case_number):
-                data_d[case_number] = {}
-            data_d[case_number].update({
-                row['month']: row_obj})
+        df['case'] = df['case'].astype(str)
+        data_d = frame_to_nested_dict(
+            df,
+            key_columns=['case', 'month'],
+            value_columns=[i for i in df.columns if i not in ['case', 'index', 'month']])
         return data_d
 
     def _extract_specific_day_hourly_output(self):
@@ -402,95 +417,63 @@ class ExcelProcessor(Logger):
         df = self._get_data('specific_day_hourly_output')
         df_incident_solar_radiation_may_4 = df.iloc[:, range(4)].copy()
         df_incident_solar_radiation_may_4.columns = ['hour', 'horizontal', 'south', 'west']
-        dc = DataCleanser(df_incident_solar_radiation_may_4)
-        df_incident_solar_radiation_may_4 = dc.cleanse_specific_day_hourly_output_incident_solar_radiation()
+        dc = DataCleanser(df_incident_solar_radiation_may_4, validation_events=self.validation_events)
+        df_incident_solar_radiation_may_4 = dc.cleanse(
+            'specific_day_hourly_output_incident_solar_radiation', self.section_type)
         df_incident_solar_radiation_july_14 = df.iloc[:, [0, ] + list(range(4, 7))].copy()
         df_incident_solar_radiation_july_14.columns = ['hour', 'horizontal', 'south', 'west']
-        dc = DataCleanser(df_incident_solar_radiation_july_14)
-        df_incident_solar_radiation_july_14 = dc.cleanse_specific_day_hourly_output_incident_solar_radiation()
+        dc = DataCleanser(df_incident_solar_radiation_july_14, validation_events=self.validation_events)
+        df_incident_solar_radiation_july_14 = dc.cleanse(
+            'specific_day_hourly_output_incident_solar_radiation', self.section_type)
         df_sky_temperature = df.iloc[:, [0, ] + list(range(7, 10))].copy()
         df_sky_temperature.columns = ['hour', 'feb_1', 'may_4', 'july_14']
         df_transmitted_total_solar_radiation_600 = df.iloc[:, [0, 10, 13, 16]].copy()
         df_transmitted_total_solar_radiation_600.columns = ['hour', 'feb_1', 'may_4', 'july_14']
-        dc = DataCleanser(df_transmitted_total_solar_radiation_600)
-        df_transmitted_total_solar_radiation_600 = \
-            dc.cleanse_specific_day_hourly_output_transmitted_total_solar_radiation()
+        dc = DataCleanser(df_transmitted_total_solar_radiation_600, validation_events=self.validation_events)
+        df_transmitted_total_solar_radiation_600 = dc.cleanse(
+            'specific_day_hourly_output_transmitted_total_solar_radiation', self.section_type)
         df_transmitted_total_solar_radiation_660 = df.iloc[:, [0, 11, 14, 17]].copy()
         df_transmitted_total_solar_radiation_660.columns = ['hour', 'feb_1', 'may_4', 'july_14']
-        dc = DataCleanser(df_transmitted_total_solar_radiation_660)
-        df_transmitted_total_solar_radiation_660 = \
-            dc.cleanse_specific_day_hourly_output_transmitted_total_solar_radiation()
+        dc = DataCleanser(df_transmitted_total_solar_radiation_660, validation_events=self.validation_events)
+        df_transmitted_total_solar_radiation_660 = dc.cleanse(
+            'specific_day_hourly_output_transmitted_total_solar_radiation', self.section_type)
         df_transmitted_total_solar_radiation_670 = df.iloc[:, [0, 12, 15, 18]].copy()
         df_transmitted_total_solar_radiation_670.columns = ['hour', 'feb_1', 'may_4', 'july_14']
-        dc = DataCleanser(df_transmitted_total_solar_radiation_670)
-        df_transmitted_total_solar_radiation_670 = \
-            dc.cleanse_specific_day_hourly_output_transmitted_total_solar_radiation()
+        dc = DataCleanser(df_transmitted_total_solar_radiation_670, validation_events=self.validation_events)
+        df_transmitted_total_solar_radiation_670 = dc.cleanse(
+            'specific_day_hourly_output_transmitted_total_solar_radiation', self.section_type)
         data_d = {}
-        if df_incident_solar_radiation_may_4.shape[0] > 0:
-            if not data_d.get('600'):
-                data_d.update({'600': {}})
-            if not data_d['600'].get('incident_solar_radiation'):
-                data_d['600'].update({'incident_solar_radiation': {}})
-            data_d['600']['incident_solar_radiation'].update({
-                'may_4': {'horizontal': {'hour': {}}, 'south': {'hour': {}}, 'west': {'hour': {}}}})
-            for idx, row in df_incident_solar_radiation_may_4.iterrows():
-                for col_name in ['horizontal', 'south', 'west']:
-                    data_d['600']['incident_solar_radiation']['may_4'][col_name]['hour'].update(
-                        {int(row['hour']): {'Whm/m2': row[col_name]}})
-        if df_incident_solar_radiation_july_14.shape[0] > 0:
-            if not data_d.get('600'):
-                data_d.update({'600': {}})
-            if not data_d['600'].get('incident_solar_radiation'):
-                data_d['600'].update({'incident_solar_radiation': {}})
-            data_d['600']['incident_solar_radiation'].update({
-                'july_14': {'horizontal': {'hour': {}}, 'south': {'hour': {}}, 'west': {'hour': {}}}})
-            for idx, row in df_incident_solar_radiation_july_14.iterrows():
-                for col_name in ['horizontal', 'south', 'west']:
-                    data_d['600']['incident_solar_radiation']['july_14'][col_name]['hour'].update(
-                        {int(row['hour']): {'Whm/m2': row[col_name]}})
+        for day, df_incident_solar_radiation in [
+                ('may_4', df_incident_solar_radiation_may_4),
+                ('july_14', df_incident_solar_radiation_july_14)]:
+            if df_incident_solar_radiation.shape[0] > 0:
+                wide_frame_to_nested_dict(
+                    df_incident_solar_radiation,
+                    index_column='hour',
+                    column_paths={
+                        i: ('600', 'incident_solar_radiation', day, i, 'hour') for i in ['horizontal', 'south', 'west']},
+                    leaf_key='Whm/m2',
+                    data_d=data_d)
         if df_sky_temperature.shape[0] > 0:
-            if not data_d.get('600'):
-                data_d.update({'600': {}})
-            if not data_d['600'].get('sky_temperature'):
-                data_d['600'].update({'sky_temperature': {}})
-            data_d['600']['sky_temperature'].update(
-                {'feb_1': {'hour': {}}, 'may_4': {'hour': {}}, 'july_14': {'hour': {}}})
-            for idx, row in df_sky_temperature.iterrows():
-                for col_name in ['feb_1', 'may_4', 'july_14']:
-                    data_d['600']['sky_temperature'][col_name]['hour'].update({int(row['hour']): {'C': row[col_name]}})
-        if df_transmitted_total_solar_radiation_600.shape[0] > 0:
-            if not data_d.get('600'):
-                data_d.update({'600': {}})
-            if not data_d['600'].get('transmitted_total_solar_radiation'):
-                data_d['600'].update({'transmitted_total_solar_radiation': {}})
-            data_d['600']['transmitted_total_solar_radiation'].update(
-                {'feb_1': {'hour': {}}, 'may_4': {'hour': {}}, 'july_14': {'hour': {}}})
-            for idx, row in df_transmitted_total_solar_radiation_600.iterrows():
-                for col_name in ['feb_1', 'may_4', 'july_14']:
-                    data_d['600']['transmitted_total_solar_radiation'][col_name]['hour'].update(
-                        {int(row['hour']): {'Whm/m2': row[col_name]}})
-        if df_transmitted_total_solar_radiation_600.shape[0] > 0:
-            if not data_d.get('660'):
-                data_d.update({'660': {}})
-            if not data_d['660'].get('transmitted_total_solar_radiation'):
-                data_d['660'].update({'transmitted_total_solar_radiation': {}})
-            data_d['660']['transmitted_total_solar_radiation'].update(
-                {'feb_1': {'hour': {}}, 'may_4': {'hour': {}}, 'july_14': {'hour': {}}})
-            for idx, row in df_transmitted_total_solar_radiation_660.iterrows():
-                for col_name in ['feb_1', 'may_4', 'july_14']:
-                    data_d['660']['transmitted_total_solar_radiation'][col_name]['hour'].update(
-                        {int(row['hour']): {'Whm/m2': row[col_name]}})
-        if df_transmitted_total_solar_radiation_600.shape[0] > 0:
-            if not data_d.get('670'):
-                data_d.update({'670': {}})
-            if not data_d['670'].get('transmitted_total_solar_radiation'):
-                data_d['670'].update({'transmitted_total_solar_radiation': {}})
-            data_d['670']['transmitted_total_solar_radiation'].update(
-                {'feb_1': {'hour': {}}, 'may_4': {'hour': {}}, 'july_14': {'hour': {}}})
-            for idx, row in df_transmitted_total_solar_radiation_670.iterrows():
-                for col_name in ['feb_1', 'may_4', 'july_14']:
-                    data_d['670']['transmitted_total_solar_radiation'][col_name]['hour'].update(
-                        {int(row['hour']): {'Whm/m2': row[col_name]}})
+            wide_frame_to_nested_dict(
+                df_sky_temperature,
+                index_column='hour',
+                column_paths={i: ('600', 'sky_temperature', i, 'hour') for i in ['feb_1', 'may_4', 'july_14']},
+                leaf_key='C',
+                data_d=data_d)
+        for case_number, df_transmitted_total_solar_radiation in [
+                ('600', df_transmitted_total_solar_radiation_600),
+                ('660', df_transmitted_total_solar_radiation_660),
+                ('670', df_transmitted_total_solar_radiation_670)]:
+            if df_transmitted_total_solar_radiation.shape[0] > 0:
+                wide_frame_to_nested_dict(
+                    df_transmitted_total_solar_radiation,
+                    index_column='hour',
+                    column_paths={
+                        i: (case_number, 'transmitted_total_solar_radiation', i, 'hour')
+                        for i in ['feb_1', 'may_4', 'july_14']},
+                    leaf_key='Whm/m2',
+                    data_d=data_d)
         return data_d
 
     def _extract_specific_day_hourly_output_free_float_zone_temperatures(self):
@@ -500,24 +483,19 @@ class ExcelProcessor(Logger):
         """
         df = self._get_data('specific_day_hourly_output_free_float_zone_temperatures')
         df.columns = ['hour', '600FF', '900FF', '650FF', '950FF', '680FF', '980FF']
-        dc = DataCleanser(df)
-        df = dc.cleanse_specific_day_hourly_output_free_float_zone_temperatures()
-        data_d = {
-            '600FF': {'feb_1': {'hour': {}}},
-            '900FF': {'feb_1': {'hour': {}}},
-            '650FF': {'july_14': {'hour': {}}},
-            '950FF': {'july_14': {'hour': {}}},
-            '680FF': {'feb_1': {'hour': {}}},
-            '980FF': {'feb_1': {'hour': {}}}
-        }
-        if df.shape[0] > 0:
-            for idx, row in df.iterrows():
-                data_d['600FF']['feb_1']['hour'].update({int(row['hour']): {'C': row['600FF']}})
-                data_d['900FF']['feb_1']['hour'].update({int(row['hour']): {'C': row['900FF']}})
-                data_d['650FF']['july_14']['hour'].update({int(row['hour']): {'C': row['650FF']}})
-                data_d['950FF']['july_14']['hour'].update({int(row['hour']): {'C': row['950FF']}})
-                data_d['680FF']['feb_1']['hour'].update({int(row['hour']): {'C': row['680FF']}})
-                data_d['980FF']['feb_1']['hour'].update({int(row['hour']): {'C': row['980FF']}})
+        dc = DataCleanser(df, validation_events=self.validation_events)
+        df = dc.cleanse('specific_day_hourly_output_free_float_zone_temperatures', self.section_type)
+        data_d = wide_frame_to_nested_dict(
+            df,
+            index_column='hour',
+            column_paths={
+                '600FF': ('600FF', 'feb_1', 'hour'),
+                '900FF': ('900FF', 'feb_1', 'hour'),
+                '650FF': ('650FF', 'july_14', 'hour'),
+                '950FF': ('950FF', 'july_14', 'hour'),
+                '680FF': ('680FF', 'feb_1', 'hour'),
+                '980FF': ('980FF', 'feb_1', 'hour')},
+            leaf_key='C')
         return data_d
 
     def _extract_specific_day_hourly_output_free_float_zone_loads(self):
@@ -528,38 +506,31 @@ class ExcelProcessor(Logger):
         df = self._get_data('specific_day_hourly_output_free_float_zone_loads')
         df_feb_1 = df.iloc[:, range(13)].copy()
         df_feb_1.columns = ['hour', '600', '640', '660', '670', '680', '685', '695', '900', '940', '980', '985', '995']
-        dc = DataCleanser(df_feb_1)
-        df_feb_1 = dc.cleanse_specific_day_hourly_output_free_float_zone_loads_feb_1()
+        dc = DataCleanser(df_feb_1, validation_events=self.validation_events)
+        df_feb_1 = dc.cleanse('specific_day_hourly_output_free_float_zone_loads_feb_1', self.section_type)
         df_july_14 = df.iloc[:, [0, ] + list(range(13, 23))].copy()
         df_july_14.columns = ['hour', '600', '660', '670', '680', '685', '695', '900', '980', '985', '995']
-        dc = DataCleanser(df_july_14)
-        df_july_14 = dc.cleanse_specific_day_hourly_output_free_float_zone_loads_july_14()
+        dc = DataCleanser(df_july_14, validation_events=self.validation_events)
+        df_july_14 = dc.cleanse('specific_day_hourly_output_free_float_zone_loads_july_14', self.section_type)
         df_zone_temps = df.iloc[:, [0, ] + [23, 24]].copy()
         df_zone_temps.columns = ['hour', '640', '940']
-        dc = DataCleanser(df_zone_temps)
-        df_zone_temps = dc.cleanse_specific_day_hourly_output_free_float_zone_loads_zone_temps()
+        dc = DataCleanser(df_zone_temps, validation_events=self.validation_events)
+        df_zone_temps = dc.cleanse('specific_day_hourly_output_free_float_zone_loads_zone_temps', self.section_type)
         data_d = {}
-        for col_name in df_feb_1.columns[1:]:
-            if not data_d.get(col_name):
-                data_d[col_name] = {}
-            data_d[col_name]['feb_1'] = {'hour': {}}
-            for idx, row in df_feb_1.iterrows():
-                data_d[col_name]['feb_1']['hour'].update({int(row['hour']): {'kWh': row[col_name]}})
-        for col_name in df_july_14.columns[1:]:
-            if not data_d.get(col_name):
-                data_d[col_name] = {}
-            data_d[col_name]['july_14'] = {'hour': {}}
-            for idx, row in df_july_14.iterrows():
-                data_d[col_name]['july_14']['hour'].update({int(row['hour']): {'kWh': row[col_name]}})
-        for col_name in df_zone_temps.columns[1:]:
-            if not data_d.get(col_name):
-                data_d[col_name] = {}
-            if not data_d[col_name].get('feb_1'):
-                data_d[col_name]['feb_1'] = {'hour': {}}
-            for idx, row in df_zone_temps.iterrows():
-                if not data_d[col_name]['feb_1']['hour'].get(int(row['hour'])):
-                    data_d[col_name]['feb_1']['hour'] = {int(row['hour']): {}}
-                data_d[col_name]['feb_1']['hour'][row['hour']]['C'] = row[col_name]
+        for day, df_day in [('feb_1', df_feb_1), ('july_14', df_july_14)]:
+            wide_frame_to_nested_dict(
+                df_day,
+                index_column='hour',
+                column_paths={i: (i, day, 'hour') for i in df_day.columns[1:]},
+                leaf_key='kWh',
+                data_d=data_d)
+        # zone temperatures are added to the Feb 1 hourly entries of the same cases
+        wide_frame_to_nested_dict(
+            df_zone_temps,
+            index_column='hour',
+            column_paths={i: (i, 'feb_1', 'hour') for i in df_zone_temps.columns[1:]},
+            leaf_key='C',
+            data_d=data_d)
         return data_d
 
     # Section Ground Coupled GC data
@@ -588,13 +559,10 @@ class ExcelProcessor(Logger):
         """
         df = self._get_data('steady_state_cases')
         df.columns = ['cases', 'qfloor', 'qzone', 'Tzone', 'tsim']
-        data_d = {}
-        for idx, row in df.iterrows():
-            data_d[row['cases']] = {
-                'qfloor': row['qfloor'],
-                'qzone': row['qzone'],
-                'Tzone': row['Tzone'],
-                'tsim': row['tsim']}
+        data_d = frame_to_nested_dict(
+            df,
+            key_columns=['cases', ],
+            value_columns=['qfloor', 'qzone', 'Tzone', 'tsim'])
         return data_d
 
     def _extract_identifying_information_he(self):
@@ -628,12 +596,10 @@ class ExcelProcessor(Logger):
         """
         df = self._get_data('total_furnace_load')
         df.columns = ['case', 'GJ']
-        dc = DataCleanser(df)
-        df = dc.cleanse_he_furnace_energy()
-        data_d = {}
-        for idx, row in df.iterrows():
-            row_name = str(row['case']).removeprefix('CASE ')
-            data_d[row_name] = row['GJ']
+        dc = DataCleanser(df, validation_events=self.validation_events)
+        df = dc.cleanse('furnace_loads', self.section_type)
+        df['case'] = df['case'].astype(str).str.removeprefix('CASE ')
+        data_d = frame_to_nested_dict(df, key_columns=['case', ], value_columns='GJ')
         return data_d
 
     def _extract_he_furnace_input(self) -> dict:
@@ -644,12 +610,10 @@ class ExcelProcessor(Logger):
         """
         df = self._get_data('total_furnace_input')
         df.columns = ['case', 'GJ']
-        dc = DataCleanser(df)
-        df = dc.cleanse_he_furnace_energy()
-        data_d = {}
-        for idx, row in df.iterrows():
-            row_name = str(row['case']).removeprefix('CASE ')
-            data_d[row_name] = row['GJ']
+        dc = DataCleanser(df, validation_events=self.validation_events)
+        df = dc.cleanse('furnace_input', self.section_type)
+        df['case'] = df['case'].astype(str).str.removeprefix('CASE ')
+        data_d = frame_to_nested_dict(df, key_columns=['case', ], value_columns='GJ')
         return data_d
 
     def _extract_he_fuel_consumption(self) -> dict:
@@ -660,12 +624,10 @@ class ExcelProcessor(Logger):
         """
         df = self._get_data('fuel_consumption')
         df.columns = ['case', 'm3/2']
-        dc = DataCleanser(df)
-        df = dc.cleanse_he_furnace_energy(numeric_columns=(('m3/2', {'lower_limit': 0}), ))
-        data_d = {}
-        for idx, row in df.iterrows():
-            row_name = str(row['case']).removeprefix('CASE ')
-            data_d[row_name] = row['m3/2']
+        dc = DataCleanser(df, validation_events=self.validation_events)
+        df = dc.cleanse('fuel_consumption', self.section_type)
+        df['case'] = df['case'].astype(str).str.removeprefix('CASE ')
+        data_d = frame_to_nested_dict(df, key_columns=['case', ], value_columns='m3/2')
         return data_d
 
     def _extract_he_fan_energy(self) -> dict:
@@ -676,12 +638,10 @@ class ExcelProcessor(Logger):
         """
         df = self._get_data('fan_energy_both_fans')
         df.columns = ['case', 'kWh']
-        dc = DataCleanser(df)
-        df = dc.cleanse_he_furnace_energy(numeric_columns=(('kWh', {'lower_limit': 0}), ))
-        data_d = {}
-        for idx, row in df.iterrows():
-            row_name = str(row['case']).removeprefix('CASE ')
-            data_d[row_name] = row['kWh']
+        dc = DataCleanser(df, validation_events=self.validation_events)
+        df = dc.cleanse('fan_energy', self.section_type)
+        df['case'] = df['case'].astype(str).str.removeprefix('CASE ')
+        data_d = frame_to_nested_dict(df, key_columns=['case', ], value_columns='kWh')
         return data_d
 
     def _extract_he_mean_zone_temperature(self) -> dict:
@@ -692,12 +652,10 @@ class ExcelProcessor(Logger):
         """
         df = self._get_data('mean_zone_temperature')
         df.columns = ['case', 'C']
-        dc = DataCleanser(df)
-        df = dc.cleanse_he_temperature()
-        data_d = {}
-        for idx, row in df.iterrows():
-            row_name = str(row['case']).removeprefix('CASE ')
-            data_d[row_name] = row['C']
+        dc = DataCleanser(df, validation_events=self.validation_events)
+        df = dc.cleanse('mean_zone_temperature', self.section_type)
+        df['case'] = df['case'].astype(str).str.removeprefix('CASE ')
+        data_d = frame_to_nested_dict(df, key_columns=['case', ], value_columns='C')
         return data_d
 
     def _extract_he_maximum_zone_temperature(self) -> dict:
@@ -708,12 +666,10 @@ class ExcelProcessor(Logger):
         """
         df = self._get_data('maximum_zone_temperature')
         df.columns = ['case', 'C']
-        dc = DataCleanser(df)
-        df = dc.cleanse_he_temperature()
-        data_d = {}
-        for idx, row in df.iterrows():
-            row_name = str(row['case']).removeprefix('CASE ')
-            data_d[row_name] = row['C']
+        dc = DataCleanser(df, validation_events=self.validation_events)
+        df = dc.cleanse('maximum_zone_temperature', self.section_type)
+        df['case'] = df['case'].astype(str).str.removeprefix('CASE ')
+        data_d = frame_to_nested_dict(df, key_columns=['case', ], value_columns='C')
         return data_d
 
     def _extract_he_minimum_zone_temperature(self) -> dict:
@@ -724,19 +680,84 @@ class ExcelProcessor(Logger):
         """
         df = self._get_data('minimum_zone_temperature')
         df.columns = ['case', 'C']
-        dc = DataCleanser(df)
-        df = dc.cleanse_he_temperature()
-        data_d = {}
-        for idx, row in df.iterrows():
-            row_name = str(row['case']).removeprefix('CASE ')
-            data_d[row_name] = row['C']
+        dc = DataCleanser(df, validation_events=self.validation_events)
+        df = dc.cleanse('minimum_zone_temperature', self.section_type)
+        df['case'] = df['case'].astype(str).str.removeprefix('CASE ')
+        data_d = frame_to_nested_dict(df, key_columns=['case', ], value_columns='C')
         return data_d
 
+    def _check_consistency(self):
+        """
+        Check that the extracted tables are consistent with each other, e.g. that the monthly loads of a case sum to
+        its annual load, using the consistency checks of the validation schema.  Failures are logged and added to
+        the validation events of the processor.
+
+        :return: ValidationEvents object of the failed consistency checks
+        """
+        consistency_events = get_validation_schema().check_consistency(self.test_data, self.section_type)
+        for event in consistency_events:
+            self.logger.warning(
+                'WARNING: Consistency check %s failed for %s: %s', event['check'], event['row_index'], event['message'])
+        self.validation_events.events.extend(consistency_events.events)
+        return consistency_events
+
+    def _add_cached_validation_events(self, validation_events):
+        """
+        Add and log the validation events of tables served from the ingest cache, so that the failures of a
+        submission are reported on every run and not only when its tables are cleansed.
+
+        :param validation_events: list of validation events, as created by ValidationEvents.add()
+        :return: None
+        """
+        for event in validation_events:
+            self.logger.log(
+                event['level'], 'Info: %s (%s column of %s table, served from the ingest cache) from rows %s',
+                event['message'], event['column'], event['table_name'], event['row_index'])
+        self.validation_events.events.extend(validation_events)
+        return
+
     def run(self):
         """
-        Perform operations to convert Excel file into dictionary of dataframes.
+        Perform operations to convert Excel file into dictionary of dataframes.  Only the tables requested in the
+        tables class attribute are extracted, and only their data source regions are read from the file.
 
         :return: json object of input data
         """
-        self.test_data.update(self.processing_functions)
+        table_names = list(self.tables or self.processing_functions.keys())
+        bad_table_names = [i for i in table_names if i not in self.processing_functions]
+        for bad_table_name in bad_table_names:
+            self.logger.warning('WARNING: Table (%s) does not exist for section %s', bad_table_name, self.section_type)
+        table_names = [i for i in table_names if i in self.processing_functions]
+        if not table_names:
+            return self
+        if self.ingest_cache is not None:
+            cache_keys = self.ingest_cache.get_keys(self.file_location, self.data_sources)
+            cache_entry = self.ingest_cache.load(cache_keys['test_data'], 'test_data') or {}
+            cached_test_data = cache_entry.get('test_data', {})
+            cached_validation_events = cache_entry.get('validation_events', {})
+            if all(i in cached_test_data for i in table_names):
+                self.logger.info('Tables for %s served from the ingest cache', str(self.file_location))
+                self.test_data.update({i: cached_test_data[i] for i in table_names})
+                for table_name in table_names:
+                    self._add_cached_validation_events(cached_validation_events.get(table_name, []))
+                self._check_consistency()
+                return self
+            self.workbook.grid = self.ingest_cache.load(cache_keys['grid'], 'grid') or {}
+        grid_rows = {k: len(v) for k, v in self.workbook.grid.items()}
+        # read all regions needed by the requested tables in a single pass over the workbook
+        self.workbook.load([self.processing_functions[i][1] for i in table_names])
+        for table_name in table_names:
+            extract_function, _ = self.processing_functions[table_name]
+            self.validation_events.table_name = table_name
+            self.test_data[table_name] = extract_function()
+        if self.ingest_cache is not None:
+            if grid_rows != {k: len(v) for k, v in self.workbook.grid.items()}:
+                self.ingest_cache.save(cache_keys['grid'], 'grid', self.workbook.grid)
+            # the cleansing events are cached with the tables, and the consistency checks are run again on each hit
+            self.ingest_cache.save(cache_keys['test_data'], 'test_data', {
+                'test_data': {**cached_test_data, **self.test_data},
+                'validation_events': {
+                    **cached_validation_events,
+                    **{i: [j for j in self.validation_events if j['table_name'] == i] for i in self.test_data}}})
+        self._check_consistency()
         return self
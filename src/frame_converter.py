@@ -0,0 +1,70 @@
+import pandas as pd
+
+
+def _get_column_values(df: pd.DataFrame, columns) -> list:
+    """
+    Get the values of dataframe columns as lists of python objects.  Values are cast to the common dtype of the whole
+    dataframe, as they would be when read row by row, so the output matches iterating over the dataframe rows.
+
+    :param df: dataframe
+    :param columns: columns to retrieve
+    :return: list of value lists, one for each column
+    """
+    if not columns:
+        return []
+    column_positions = [df.columns.get_loc(column) for column in columns]
+    return df.to_numpy()[:, column_positions].T.tolist()
+
+
+def frame_to_nested_dict(df: pd.DataFrame, key_columns, value_columns, data_d=None) -> dict:
+    """
+    Convert a cleansed dataframe into a nested dictionary with one level for each key column.  The values are taken
+    from the dataframe in one columnar step.
+
+    :param df: cleansed dataframe
+    :param key_columns: columns holding the nested dictionary keys, outermost level first
+    :param value_columns: list of columns stored as a dictionary at the innermost level, or a single column name to
+        store the bare value
+    :param data_d: existing dictionary to merge the output into
+    :return: nested dictionary
+    """
+    if data_d is None:
+        data_d = {}
+    if isinstance(value_columns, str):
+        leaves, = _get_column_values(df, [value_columns, ])
+    else:
+        value_columns = list(value_columns)
+        leaves = [dict(zip(value_columns, row)) for row in zip(*_get_column_values(df, value_columns))]
+    key_rows = zip(*[df[key_column].tolist() for key_column in key_columns])
+    for keys, leaf in zip(key_rows, leaves):
+        node = data_d
+        for key in keys[:-1]:
+            node = node.setdefault(key, {})
+        node[keys[-1]] = leaf
+    return data_d
+
+
+def wide_frame_to_nested_dict(df: pd.DataFrame, index_column, column_paths, leaf_key, data_d=None) -> dict:
+    """
+    Convert a cleansed dataframe in wide format, with one row per index value (e.g. hour) and one column per series,
+    into a nested dictionary.  Each column is stored under its key path as {index: {leaf_key: value}}.
+
+    :param df: cleansed dataframe
+    :param index_column: column holding the integer index values
+    :param column_paths: dictionary of column name to the tuple of keys the column is stored under
+    :param leaf_key: key for each value at the innermost level (e.g. unit of measure)
+    :param data_d: existing dictionary to merge the output into.  Existing innermost dictionaries are updated.
+    :return: nested dictionary
+    """
+    if data_d is None:
+        data_d = {}
+    columns = list(column_paths.keys())
+    index_values = df[index_column].astype(int).tolist()
+    column_values = _get_column_values(df, columns)
+    for column, values in zip(columns, column_values):
+        node = data_d
+        for key in column_paths[column]:
+            node = node.setdefault(key, {})
+        for index_value, value in zip(index_values, values):
+            node.setdefault(index_value, {})[leaf_key] = value
+    return data_d
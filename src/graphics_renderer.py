@@ -1,5 +1,4 @@
 import pathlib
-import json
 import re
 import pandas as pd
 import numpy as np
@@ -10,6 +9,11 @@ import plotly.express as px
 # import kaleido
 
 from logger import Logger
+from src.result_cube import ResultCube
+from src.baseline_cache import default_baseline_cache, load_processed_file
+from src.render_manifest import AccessRecordingDict
+from src.processed_catalog import ProcessedCatalog
+from src.validation_schema import get_validation_schema
 
 root_directory = pathlib.Path(__file__).parent.parent.resolve()
 
@@ -49,10 +53,22 @@ class GraphicsRenderer(Logger):
             model_results_file,
             processed_file_directory=None,
             base_model_list=None,
+            baseline_cache=None,
+            data_keys=None,
+            results_store=None,
+            catalog=None,
             logger_level='WARNING',
             logger_name="console_only_logger"):
         """
         :param model_results_file: file with the model file results to be visualized
+        :param baseline_cache: BaselineCache object holding parsed baseline files.  A cache shared by the process is
+            used if not provided.
+        :param data_keys: top level json keys to load, e.g. from get_data_keys() for the rendering functions to be
+            run.  All keys are loaded if not provided.
+        :param results_store: ResultsStore object.  If provided, the loaded files are added to the store and the
+            result cubes are queried from it.
+        :param catalog: ProcessedCatalog object used to select the baseline files when base_model_list is not
+            provided.  The catalog in the processed directory is used if not provided.
         :param logger_level: logger level for reporting
         :param logger_name: logger object to use.
         """
@@ -141,38 +157,14 @@ class GraphicsRenderer(Logger):
                 },
                 orient='index',
                 columns=['case_name', 'case_order'])
+        self.baseline_cache = baseline_cache or default_baseline_cache
         if not processed_file_directory:
             self.processed_file_directory = root_directory.joinpath('processed')
         else:
             self.processed_file_directory = processed_file_directory
+        self.catalog = catalog or ProcessedCatalog()
         if not base_model_list:
-            if self.section_type == 'TF':
-                self.baseline_model_list = [
-                    root_directory.joinpath('processed', 'bsimac', '9.9.0.7.4', 'std140_tf_output.json'),
-                    root_directory.joinpath('processed', 'cse', '0.861.1', 'std140_tf_output.json'),
-                    root_directory.joinpath('processed', 'dest', '2.0.20190401', 'std140_tf_output.json'),
-                    root_directory.joinpath('processed', 'energyplus', '9.0.1', 'std140_tf_output.json'),
-                    root_directory.joinpath('processed', 'esp-r', '13.3', 'std140_tf_output.json'),
-                    root_directory.joinpath('processed', 'trnsys', '18.00.0001', 'std140_tf_output.json')]
-            elif self.section_type == 'GC':
-                self.baseline_model_list = [
-                    root_directory.joinpath('processed', 'basecalc', 'v1.0e', 'std140_gc_output.json'),
-                    root_directory.joinpath('processed', 'energyplus', '9.0.1', 'std140_gc_output.json'),
-                    root_directory.joinpath('processed', 'esp-r', '13.3', 'std140_gc_output.json'),
-                    root_directory.joinpath('processed', 'fluent', '6.1', 'std140_gc_output.json'),
-                    root_directory.joinpath('processed', 'ght', '2.02', 'std140_gc_output.json'),
-                    root_directory.joinpath('processed', 'matlab', '7.0.4.365-r14-sp2', 'std140_gc_output.json'),
-                    root_directory.joinpath('processed', 'sunrel-gc', '1.14.02', 'std140_gc_output.json'),
-                    root_directory.joinpath('processed', 'trnsys', '18.00.0001', 'std140_gc_output.json'),
-                    root_directory.joinpath('processed', 'va114', '2.20', 'std140_gc_output.json')
-                ]
-            elif self.section_type == 'HE':
-                self.baseline_model_list = [
-                    root_directory.joinpath('processed', 'esp-r-hot3000', '1.7', 'std140_he_output.json'),
-                    root_directory.joinpath('processed', 'energyplus', '1.0.2', 'std140_he_output.json'),
-                    root_directory.joinpath('processed', 'doe21e', 'c133', 'std140_he_output.json'),
-                    root_directory.joinpath('processed', 'analytical', '0', 'std140_he_output.json')
-                ]
+            self.baseline_model_list = self.catalog.get_baseline_files(self.section_type)
         else:
             self.baseline_model_list = base_model_list
         if isinstance(model_results_file, str):
@@ -203,6 +195,22 @@ class GraphicsRenderer(Logger):
         # instantiate objects to store data as a dictionary of json objects, and a dictionary of pandas dataframes
         self.json_data = {}
         self.df_data = {}
+        # dictionary of table name to program x case x metric ResultCube objects.  This dictionary is filled on data
+        # loading for every table formatted as {case: {metric: value}}.
+        self.result_cubes = {}
+        # dictionary of table name to ResultCube objects holding the minimum, maximum, and mean of the baseline models
+        # for every case and metric.  This dictionary is filled on data loading from the baseline bundle.
+        self.reference_statistics = {}
+        # top level json keys to load.  identifying_information is always loaded to name the models.
+        self.data_keys = None if data_keys is None else set(data_keys).union(['identifying_information', ])
+        self.results_store = results_store
+        # ValidationEvents object of the tested model values that fail the validation schema.  This object is filled
+        # on data loading.
+        self.validation_events = None
+        # top level json keys read, and files written, by the rendering functions.  These objects are reset by the
+        # caller before each rendering function is run, and are used to build the render manifest.
+        self.accessed_data_keys = set()
+        self.rendered_files = []
         # set hatches list for visualization objects
         self.hatches = ['/', '-', 'x', '\\', '//', 'o', '||', '+', 'O', '.', '*']
         self.colors = ['blue', 'green', 'red', 'cyan', 'yellow', 'black', 'orange']
@@ -280,38 +288,136 @@ class GraphicsRenderer(Logger):
         :return: Updated class objects that represent the data as a json object and pandas dataframe
         """
         table_objects = {}
-        for f, model_name in zip(
-                self.baseline_model_list + [self.model_results_file, ],
-                self.baseline_model_names + [self.model_name, ]):
-            with open(self.processed_file_directory.joinpath(f), 'r') as jf:
-                data = json.load(jf)
-                # load json objects as objects with the file name as the key
-                self.json_data.update({model_name: data})
-                # make mapping dictionary of file name to cleansed model name
-                if data.get('identifying_information') and data[
-                        'identifying_information'].get('software_name') and data[
-                        'identifying_information'].get('software_version'):
-                    self.cleansed_model_names[model_name] = '-'.join([
-                        str(data['identifying_information']['software_name']),
-                        str(data['identifying_information']['software_version'])])
-                # load each table, if exists into a dataframe of the json key name
-                for tbl, row_index in self.table_lookup:
-                    tbl_data = data.get(tbl)
-                    if tbl_data:
-                        try:
-                            table_objects[tbl]
-                        except KeyError:
-                            table_objects[tbl] = pd.DataFrame()
-                        # Format the json data to a multiIndex table with a meaningful row index
-                        # Make the separator something uncommon for easier splitting and re-leveling
-                        tmp_df = pd.json_normalize(tbl_data, sep=">")
-                        tmp_df.columns = pd.MultiIndex.from_tuples([i.split('>') for i in tmp_df.columns])
-                        tmp_df['program_name'] = model_name
-                        tmp_df = tmp_df.set_index(row_index)
-                        table_objects.update({tbl: pd.concat([table_objects[tbl], tmp_df])})
-        self.df_data = table_objects
+        model_file_locations = dict(zip(
+            self.baseline_model_names,
+            [self.processed_file_directory.joinpath(f) for f in self.baseline_model_list]))
+        model_file_locations[self.model_name] = self.processed_file_directory.joinpath(self.model_results_file)
+        # baseline files and their reference statistics are loaded as one bundle shared through the cache, the tested
+        # model file is always re-read.  When data keys are set, only those sections of each file are parsed.
+        baseline_bundle = self.baseline_cache.load_bundle(
+            self.section_type,
+            [self.processed_file_directory.joinpath(f) for f in self.baseline_model_list],
+            self.baseline_model_names,
+            self.table_lookup,
+            data_keys=self.data_keys)
+        self.reference_statistics = baseline_bundle['statistics']
+        processed_files = list(baseline_bundle['models'].items())
+        processed_files.append((
+            self.model_name,
+            load_processed_file(
+                model_file_locations[self.model_name],
+                self.model_name,
+                [i for i in self.table_lookup if self.data_keys is None or i[0] in self.data_keys],
+                data_keys=self.data_keys)))
+        # check the tested model values against the validation schema before they are rendered
+        self.validation_events = get_validation_schema().check_processed_data(
+            processed_files[-1][1]['json'], self.section_type)
+        if self.validation_events:
+            self.logger.warning(
+                'WARNING: Processed data of %s failed %s validation schema checks', str(self.model_results_file),
+                len(self.validation_events))
+            self.logger.debug('Validation report for %s\n%s', str(self.model_results_file), self.validation_events)
+        for model_name, processed_data in processed_files:
+            data = processed_data['json']
+            # load json objects as objects with the file name as the key.  Each object records the keys that are read
+            # from it.
+            self.json_data.update({model_name: AccessRecordingDict(data, self.accessed_data_keys)})
+            # make mapping dictionary of file name to cleansed model name
+            if data.get('identifying_information') and data[
+                    'identifying_information'].get('software_name') and data[
+                    'identifying_information'].get('software_version'):
+                self.cleansed_model_names[model_name] = '-'.join([
+                    str(data['identifying_information']['software_name']),
+                    str(data['identifying_information']['software_version'])])
+            # add each table, if it exists, to the dataframe of the json key name
+            for tbl, tmp_df in processed_data['tables'].items():
+                table_objects.setdefault(tbl, []).append(tmp_df)
+        # concatenate each table once, rather than once per file
+        self.df_data = AccessRecordingDict(
+            {tbl: pd.concat(tmp_dfs) for tbl, tmp_dfs in table_objects.items()}, self.accessed_data_keys)
+        # build a numeric cube for each case/metric table found in any of the loaded files
+        cube_table_names = []
+        for data in self.json_data.values():
+            for tbl, tbl_data in data.items():
+                if tbl not in cube_table_names and ResultCube.is_case_metric_table(tbl_data):
+                    cube_table_names.append(tbl)
+        if self.results_store:
+            self.results_store.update_files(model_file_locations.values())
+            self.result_cubes = {
+                tbl: self.results_store.get_result_cube(
+                    tbl, [model_file_locations[i] for i in self.json_data.keys()], self.json_data.keys())
+                for tbl in cube_table_names}
+        else:
+            self.result_cubes = {tbl: ResultCube.from_json_data(self.json_data, tbl) for tbl in cube_table_names}
+        self.accessed_data_keys.clear()
         return
 
+    def _get_result_cube(self, table_name):
+        """
+        Get the result cube for a table.  An empty cube, which returns NaN for every selection, is returned when the
+        table was not found in any loaded file.
+
+        :param table_name: table key in the processed json objects
+        :return: ResultCube object
+        """
+        self.accessed_data_keys.add(table_name)
+        result_cube = self.result_cubes.get(table_name)
+        if result_cube is None:
+            result_cube = ResultCube(values=[], programs=self.json_data.keys(), cases=[], metrics=[])
+        return result_cube
+
+    def _get_cube_data(self, table_name, cases, metric) -> list:
+        """
+        Select a metric for a list of cases from every program.
+
+        :param table_name: table key in the processed json objects
+        :param cases: list of cases
+        :param metric: metric key
+        :return: nested lists of values with one sublist per program, in the order of json_data
+        """
+        return self._get_result_cube(table_name).select(cases=cases, metrics=[metric, ])[:, :, 0].tolist()
+
+    def _get_cube_delta_data(self, table_name, delta_items) -> list:
+        """
+        Evaluate case differences for every program.  All differences are computed in one array operation over the
+        result cube, and then the requested metric is taken for each item.
+
+        :param table_name: table key in the processed json objects
+        :param delta_items: list of (case difference expression, metric) tuples, e.g. ('610-600', 'annual_heating_MWh')
+        :return: nested lists of differences with one sublist per program, in the order of json_data
+        """
+        expressions = [expression for expression, _ in delta_items]
+        metrics = list(dict.fromkeys(metric for _, metric in delta_items))
+        deltas = self._get_result_cube(table_name).select_deltas(expressions, metrics=metrics)
+        metric_positions = [metrics.index(metric) for _, metric in delta_items]
+        return deltas[:, np.arange(len(delta_items)), metric_positions].tolist()
+
+    def _get_reference_statistics(self, table_name, cases, metric) -> list:
+        """
+        Get the precomputed statistics of the baseline models for a metric of a list of cases.
+
+        :param table_name: table key in the processed json objects
+        :param cases: list of cases
+        :param metric: metric key
+        :return: list of (min, max, mean) values for each case.  The values are None if no statistics exist for the
+            table.
+        """
+        cases = list(cases)
+        self.accessed_data_keys.add(table_name)
+        statistics = self.reference_statistics.get(table_name)
+        if statistics is None:
+            return [None for _ in cases]
+        return statistics.select(
+            programs=['min', 'max', 'mean'], cases=cases, metrics=[metric, ])[:, :, 0].T.tolist()
+
+    def _get_software_names(self) -> list:
+        """
+        Get the software name of every program, in the order of json_data
+
+        :return: list of software names
+        """
+        return [json_obj['identifying_information']['software_name'] for json_obj in self.json_data.values()]
+
     @staticmethod
     def _set_theme(fig, ax):
         """
@@ -609,6 +715,7 @@ class GraphicsRenderer(Logger):
                     'png'
                 ]))
         plt.savefig(img_name, bbox_inches='tight', facecolor='white')
+        self.rendered_files.append(img_name)
         return
 
     def _make_markdown_from_table(self, figure_name, caption, table, footnotes=[],
@@ -639,6 +746,7 @@ class GraphicsRenderer(Logger):
                         ]),
                     'md'
                 ]))
+        self.rendered_files.append(md_name)
         with open(md_name, 'w') as md:
             md.write('# ' + caption + '\n')
             # first find the maximum width for each column
@@ -675,7 +783,8 @@ class GraphicsRenderer(Logger):
             md.write('\n')
         return
 
-    def _add_stats_to_table(self, row_headings, column_headings, data_table, digits=1, time_stamps=[]):
+    def _add_stats_to_table(self, row_headings, column_headings, data_table, digits=1, time_stamps=[],
+                            reference_statistics=None):
         """
         Add statistics to a table as well as merging the headings and time stamps
 
@@ -684,6 +793,8 @@ class GraphicsRenderer(Logger):
         :param data_table: a list of lists where the outer list contains rows and each row list contains values
         :param digits: the number of digits shown to the right of the decimal point
         :param time_stamps: a list of lists where the outer list contains rows and each row list contains time stamps
+        :param reference_statistics: a list with the precomputed (min, max, mean) of the reference programs for each
+            row, as returned by _get_reference_statistics.  Rows without precomputed values are calculated.
         :return: merged table (list of lists) containing text for every column and row formatted and merged
         """
         formatting_string = '{:.' + str(digits) + 'f}'
@@ -709,11 +820,15 @@ class GraphicsRenderer(Logger):
                         row.append(formatting_string.format(item))
                     reference_data_row = self._scrub_number_list(data_row[:-2])  # remove the last item which is the tested software
                 row.append('')
-                row_min = min(reference_data_row)
+                if reference_statistics and reference_statistics[row_index] and \
+                        not any(math.isnan(i) for i in reference_statistics[row_index]):
+                    row_min, row_max, row_mean = reference_statistics[row_index]
+                else:
+                    row_min = min(reference_data_row)
+                    row_max = max(reference_data_row)
+                    row_mean = sum(reference_data_row) / len(reference_data_row)
                 row.append(formatting_string.format(row_min))
-                row_max = max(reference_data_row)
                 row.append(formatting_string.format(row_max))
-                row_mean = sum(reference_data_row) / len(reference_data_row)
                 if self.section_type == 'HE' and 'HE1' in row_headings[row_index]:
                     row_mean = data_row[-2]  # substitute the analytical value for mean
                     row.append('')  # leave the "mean" column empty
@@ -835,6 +950,7 @@ class GraphicsRenderer(Logger):
         # fig.show() # for debugging purposes shows the figure in the browser
         # fig.write_html(file_name + '.html') # save the interactive version of the chart
         fig.write_image(img_name, engine='kaleido', width=1400, height=1000)
+        self.rendered_files.append(img_name)
 
     def render_section_tf_figure_b8_1(self):
         """
@@ -1036,18 +1152,8 @@ class GraphicsRenderer(Logger):
         :return: modified fig and ax objects from matplotlib.subplots()
         """
         cases = ['395', '430', '600', '610', '620', '630', '640', '650']
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            for case in cases:
-                try:
-                    tmp_data.append(
-                        json_obj['conditioned_zone_loads_non_free_float'][case]['annual_heating_MWh'])
-                except (KeyError, ValueError):
-                    tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_data('conditioned_zone_loads_non_free_float', cases=cases, metric='annual_heating_MWh')
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -1065,18 +1171,8 @@ class GraphicsRenderer(Logger):
         :return: modified fig and ax objects from matplotlib.subplots()
         """
         cases = ['395', '430', '600', '610', '620', '630', '640', '650']
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            for case in cases:
-                try:
-                    tmp_data.append(
-                        json_obj['conditioned_zone_loads_non_free_float'][case]['annual_cooling_MWh'])
-                except (KeyError, ValueError):
-                    tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_data('conditioned_zone_loads_non_free_float', cases=cases, metric='annual_cooling_MWh')
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -1093,18 +1189,8 @@ class GraphicsRenderer(Logger):
         :return: modified fig and ax objects from matplotlib.subplots()
         """
         cases = ['395', '430', '600', '610', '620', '630', '640', '650']
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            for case in cases:
-                try:
-                    tmp_data.append(
-                        json_obj['conditioned_zone_loads_non_free_float'][case]['peak_heating_kW'])
-                except (KeyError, ValueError):
-                    tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_data('conditioned_zone_loads_non_free_float', cases=cases, metric='peak_heating_kW')
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -1121,18 +1207,8 @@ class GraphicsRenderer(Logger):
         :return: modified fig and ax objects from matplotlib.subplots()
         """
         cases = ['395', '430', '600', '610', '620', '630', '640', '650']
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            for case in cases:
-                try:
-                    tmp_data.append(
-                        json_obj['conditioned_zone_loads_non_free_float'][case]['peak_cooling_kW'])
-                except (KeyError, ValueError):
-                    tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_data('conditioned_zone_loads_non_free_float', cases=cases, metric='peak_cooling_kW')
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -1149,18 +1225,8 @@ class GraphicsRenderer(Logger):
         :return: modified fig and ax objects from matplotlib.subplots()
         """
         cases = ['800', '900', '910', '920', '930', '940', '950', '960']
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            for case in cases:
-                try:
-                    tmp_data.append(
-                        json_obj['conditioned_zone_loads_non_free_float'][case]['annual_heating_MWh'])
-                except (KeyError, ValueError):
-                    tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_data('conditioned_zone_loads_non_free_float', cases=cases, metric='annual_heating_MWh')
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -1177,18 +1243,8 @@ class GraphicsRenderer(Logger):
         :return: modified fig and ax objects from matplotlib.subplots()
         """
         cases = ['800', '900', '910', '920', '930', '940', '950', '960']
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            for case in cases:
-                try:
-                    tmp_data.append(
-                        json_obj['conditioned_zone_loads_non_free_float'][case]['annual_cooling_MWh'])
-                except (KeyError, ValueError):
-                    tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_data('conditioned_zone_loads_non_free_float', cases=cases, metric='annual_cooling_MWh')
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -1205,18 +1261,8 @@ class GraphicsRenderer(Logger):
         :return: modified fig and ax objects from matplotlib.subplots()
         """
         cases = ['800', '900', '910', '920', '930', '940', '950', '960']
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            for case in cases:
-                try:
-                    tmp_data.append(
-                        json_obj['conditioned_zone_loads_non_free_float'][case]['peak_heating_kW'])
-                except (KeyError, ValueError):
-                    tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_data('conditioned_zone_loads_non_free_float', cases=cases, metric='peak_heating_kW')
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -1233,18 +1279,8 @@ class GraphicsRenderer(Logger):
         :return: modified fig and ax objects from matplotlib.subplots()
         """
         cases = ['800', '900', '910', '920', '930', '940', '950', '960']
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            for case in cases:
-                try:
-                    tmp_data.append(
-                        json_obj['conditioned_zone_loads_non_free_float'][case]['peak_cooling_kW'])
-                except (KeyError, ValueError):
-                    tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_data('conditioned_zone_loads_non_free_float', cases=cases, metric='peak_cooling_kW')
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -1260,35 +1296,12 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-15 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'annual_heating_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['430'][
-                        'annual_heating_MWh']
-                )
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'annual_cooling_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['430'][
-                        'annual_cooling_MWh']
-                )
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'annual_heating_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['800'][
-                        'annual_heating_MWh']
-                )
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'annual_cooling_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['800'][
-                        'annual_cooling_MWh']
-                )
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+            ('600-430', 'annual_heating_MWh'),
+            ('600-430', 'annual_cooling_MWh'),
+            ('900-800', 'annual_heating_MWh'),
+            ('900-800', 'annual_cooling_MWh')])
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -1308,35 +1321,12 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-16 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'peak_heating_kW'] - json_obj['conditioned_zone_loads_non_free_float']['430'][
-                        'peak_heating_kW']
-                )
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'peak_cooling_kW'] - json_obj['conditioned_zone_loads_non_free_float']['430'][
-                        'peak_cooling_kW']
-                )
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'peak_heating_kW'] - json_obj['conditioned_zone_loads_non_free_float']['800'][
-                        'peak_heating_kW']
-                )
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'peak_cooling_kW'] - json_obj['conditioned_zone_loads_non_free_float']['800'][
-                        'peak_cooling_kW']
-                )
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+            ('600-430', 'peak_heating_kW'),
+            ('600-430', 'peak_cooling_kW'),
+            ('900-800', 'peak_heating_kW'),
+            ('900-800', 'peak_cooling_kW')])
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -1357,103 +1347,23 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-17 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data_lists = [[] for _ in range(3)]
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            # Left chart data
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['610'][
-                        'annual_heating_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'annual_heating_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['610'][
-                        'annual_cooling_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'annual_cooling_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['910'][
-                        'annual_heating_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'annual_heating_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['910'][
-                        'annual_cooling_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'annual_cooling_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            data_lists[0].insert(idx, tmp_data)
-            # Mid chart data
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['620'][
-                        'annual_heating_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'annual_heating_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['620'][
-                        'annual_cooling_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'annual_cooling_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['920'][
-                        'annual_heating_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'annual_heating_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['920'][
-                        'annual_cooling_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'annual_cooling_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            data_lists[1].insert(idx, tmp_data)
-            # Right chart data
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['630'][
-                        'annual_heating_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['620'][
-                        'annual_heating_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['630'][
-                        'annual_cooling_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['620'][
-                        'annual_cooling_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['930'][
-                        'annual_heating_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['920'][
-                        'annual_heating_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['930'][
-                        'annual_cooling_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['920'][
-                        'annual_cooling_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            data_lists[2].insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data_lists = [
+            self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+                ('610-600', 'annual_heating_MWh'),
+                ('610-600', 'annual_cooling_MWh'),
+                ('910-900', 'annual_heating_MWh'),
+                ('910-900', 'annual_cooling_MWh')]),
+            self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+                ('620-600', 'annual_heating_MWh'),
+                ('620-600', 'annual_cooling_MWh'),
+                ('920-900', 'annual_heating_MWh'),
+                ('920-900', 'annual_cooling_MWh')]),
+            self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+                ('630-620', 'annual_heating_MWh'),
+                ('630-620', 'annual_cooling_MWh'),
+                ('930-920', 'annual_heating_MWh'),
+                ('930-920', 'annual_cooling_MWh')])]
+        programs = self._get_software_names()
         fig, ax = self._create_split_bar_plot(
             data=data_lists,
             programs=programs,
@@ -1494,103 +1404,23 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-18 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data_lists = [[] for _ in range(3)]
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            # Left chart data
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['610'][
-                        'peak_heating_kW'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'peak_heating_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['610'][
-                        'peak_cooling_kW'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'peak_cooling_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['910'][
-                        'peak_heating_kW'] - json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'peak_heating_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['910'][
-                        'peak_cooling_kW'] - json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'peak_cooling_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            data_lists[0].insert(idx, tmp_data)
-            # Mid chart data
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['620'][
-                        'peak_heating_kW'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'peak_heating_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['620'][
-                        'peak_cooling_kW'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'peak_cooling_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['920'][
-                        'peak_heating_kW'] - json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'peak_heating_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['920'][
-                        'peak_cooling_kW'] - json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'peak_cooling_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            data_lists[1].insert(idx, tmp_data)
-            # Right chart data
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['630'][
-                        'peak_heating_kW'] - json_obj['conditioned_zone_loads_non_free_float']['620'][
-                        'peak_heating_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['630'][
-                        'peak_cooling_kW'] - json_obj['conditioned_zone_loads_non_free_float']['620'][
-                        'peak_cooling_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['930'][
-                        'peak_heating_kW'] - json_obj['conditioned_zone_loads_non_free_float']['920'][
-                        'peak_heating_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['930'][
-                        'peak_cooling_kW'] - json_obj['conditioned_zone_loads_non_free_float']['920'][
-                        'peak_cooling_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            data_lists[2].insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data_lists = [
+            self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+                ('610-600', 'peak_heating_kW'),
+                ('610-600', 'peak_cooling_kW'),
+                ('910-900', 'peak_heating_kW'),
+                ('910-900', 'peak_cooling_kW')]),
+            self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+                ('620-600', 'peak_heating_kW'),
+                ('620-600', 'peak_cooling_kW'),
+                ('920-900', 'peak_heating_kW'),
+                ('920-900', 'peak_cooling_kW')]),
+            self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+                ('630-620', 'peak_heating_kW'),
+                ('630-620', 'peak_cooling_kW'),
+                ('930-920', 'peak_heating_kW'),
+                ('930-920', 'peak_cooling_kW')])]
+        programs = self._get_software_names()
         fig, ax = self._create_split_bar_plot(
             data=data_lists,
             programs=programs,
@@ -1632,61 +1462,17 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-19 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data_lists = [[] for _ in range(3)]
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            # Left chart data
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['640'][
-                        'annual_heating_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'annual_heating_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['940'][
-                        'annual_heating_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'annual_heating_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            data_lists[0].insert(idx, tmp_data)
-            # mid chart data
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['650'][
-                        'annual_cooling_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'annual_cooling_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['950'][
-                        'annual_cooling_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'annual_cooling_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            data_lists[1].insert(idx, tmp_data)
-            # right chart data
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['960'][
-                        'annual_heating_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'annual_heating_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['960'][
-                        'annual_cooling_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'annual_cooling_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            data_lists[2].insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data_lists = [
+            self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+                ('640-600', 'annual_heating_MWh'),
+                ('940-900', 'annual_heating_MWh')]),
+            self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+                ('650-600', 'annual_cooling_MWh'),
+                ('950-900', 'annual_cooling_MWh')]),
+            self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+                ('960-900', 'annual_heating_MWh'),
+                ('960-900', 'annual_cooling_MWh')])]
+        programs = self._get_software_names()
         fig, ax = self._create_split_bar_plot(
             data=data_lists,
             programs=programs,
@@ -1722,61 +1508,17 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-20 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data_lists = [[] for _ in range(3)]
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            # Left chart data
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['640'][
-                        'peak_heating_kW'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'peak_heating_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['940'][
-                        'peak_heating_kW'] - json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'peak_heating_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            data_lists[0].insert(idx, tmp_data)
-            # mid chart data
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['650'][
-                        'peak_cooling_kW'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'peak_cooling_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['950'][
-                        'peak_cooling_kW'] - json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'peak_cooling_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            data_lists[1].insert(idx, tmp_data)
-            # right chart data
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['960'][
-                        'peak_heating_kW'] - json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'peak_heating_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['960'][
-                        'peak_cooling_kW'] - json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'peak_cooling_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            data_lists[2].insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data_lists = [
+            self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+                ('640-600', 'peak_heating_kW'),
+                ('940-900', 'peak_heating_kW')]),
+            self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+                ('650-600', 'peak_cooling_kW'),
+                ('950-900', 'peak_cooling_kW')]),
+            self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+                ('960-900', 'peak_heating_kW'),
+                ('960-900', 'peak_cooling_kW')])]
+        programs = self._get_software_names()
         fig, ax = self._create_split_bar_plot(
             data=data_lists,
             programs=programs,
@@ -1811,54 +1553,14 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-21 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['800'][
-                        'annual_heating_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['430'][
-                        'annual_heating_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['800'][
-                        'annual_cooling_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['430'][
-                        'annual_cooling_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'annual_heating_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'annual_heating_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'annual_cooling_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'annual_cooling_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['940'][
-                        'annual_heating_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['640'][
-                        'annual_heating_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['950'][
-                        'annual_cooling_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['650'][
-                        'annual_cooling_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+            ('800-430', 'annual_heating_MWh'),
+            ('800-430', 'annual_cooling_MWh'),
+            ('900-600', 'annual_heating_MWh'),
+            ('900-600', 'annual_cooling_MWh'),
+            ('940-640', 'annual_heating_MWh'),
+            ('950-650', 'annual_cooling_MWh')])
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -1881,54 +1583,14 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-22 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['800'][
-                        'peak_heating_kW'] - json_obj['conditioned_zone_loads_non_free_float']['430'][
-                        'peak_heating_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['800'][
-                        'peak_cooling_kW'] - json_obj['conditioned_zone_loads_non_free_float']['430'][
-                        'peak_cooling_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'peak_heating_kW'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'peak_heating_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'peak_cooling_kW'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'peak_cooling_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['940'][
-                        'peak_heating_kW'] - json_obj['conditioned_zone_loads_non_free_float']['640'][
-                        'peak_heating_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['950'][
-                        'peak_cooling_kW'] - json_obj['conditioned_zone_loads_non_free_float']['650'][
-                        'peak_cooling_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+            ('800-430', 'peak_heating_kW'),
+            ('800-430', 'peak_cooling_kW'),
+            ('900-600', 'peak_heating_kW'),
+            ('900-600', 'peak_cooling_kW'),
+            ('940-640', 'peak_heating_kW'),
+            ('950-650', 'peak_cooling_kW')])
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -2283,44 +1945,14 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-27 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data_lists = [[] for _ in range(2)]
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            # Left chart data
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['660'][
-                        'annual_heating_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'annual_heating_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['660'][
-                        'annual_cooling_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'annual_cooling_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            data_lists[0].insert(idx, tmp_data)
-            # mid chart data
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['670'][
-                        'annual_heating_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'annual_heating_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['670'][
-                        'annual_cooling_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'annual_cooling_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            data_lists[1].insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data_lists = [
+            self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+                ('660-600', 'annual_heating_MWh'),
+                ('660-600', 'annual_cooling_MWh')]),
+            self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+                ('670-600', 'annual_heating_MWh'),
+                ('670-600', 'annual_cooling_MWh')])]
+        programs = self._get_software_names()
         fig, ax = self._create_split_bar_plot(
             data=data_lists,
             programs=programs,
@@ -2348,44 +1980,14 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-28 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data_lists = [[] for _ in range(2)]
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            # Left chart data
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['660'][
-                        'peak_heating_kW'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'peak_heating_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['660'][
-                        'peak_cooling_kW'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'peak_cooling_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            data_lists[0].insert(idx, tmp_data)
-            # mid chart data
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['670'][
-                        'peak_heating_kW'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'peak_heating_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['670'][
-                        'peak_cooling_kW'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'peak_cooling_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            data_lists[1].insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data_lists = [
+            self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+                ('660-600', 'peak_heating_kW'),
+                ('660-600', 'peak_cooling_kW')]),
+            self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+                ('670-600', 'peak_heating_kW'),
+                ('670-600', 'peak_cooling_kW')])]
+        programs = self._get_software_names()
         fig, ax = self._create_split_bar_plot(
             data=data_lists,
             programs=programs,
@@ -2413,100 +2015,22 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-29 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data_lists = [[] for _ in range(2)]
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            # Left chart data
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['680'][
-                        'annual_heating_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'annual_heating_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['680'][
-                        'annual_cooling_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'annual_cooling_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['685'][
-                        'annual_heating_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'annual_heating_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['685'][
-                        'annual_cooling_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'annual_cooling_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['695'][
-                        'annual_heating_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['685'][
-                        'annual_heating_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['695'][
-                        'annual_cooling_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['685'][
-                        'annual_cooling_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            data_lists[0].insert(idx, tmp_data)
-            # mid chart data
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['980'][
-                        'annual_heating_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'annual_heating_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['980'][
-                        'annual_cooling_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'annual_cooling_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['985'][
-                        'annual_heating_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'annual_heating_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['985'][
-                        'annual_cooling_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'annual_cooling_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['995'][
-                        'annual_heating_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['985'][
-                        'annual_heating_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['995'][
-                        'annual_cooling_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['985'][
-                        'annual_cooling_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            data_lists[1].insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data_lists = [
+            self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+                ('680-600', 'annual_heating_MWh'),
+                ('680-600', 'annual_cooling_MWh'),
+                ('685-600', 'annual_heating_MWh'),
+                ('685-600', 'annual_cooling_MWh'),
+                ('695-685', 'annual_heating_MWh'),
+                ('695-685', 'annual_cooling_MWh')]),
+            self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+                ('980-900', 'annual_heating_MWh'),
+                ('980-900', 'annual_cooling_MWh'),
+                ('985-900', 'annual_heating_MWh'),
+                ('985-900', 'annual_cooling_MWh'),
+                ('995-985', 'annual_heating_MWh'),
+                ('995-985', 'annual_cooling_MWh')])]
+        programs = self._get_software_names()
         fig, ax = self._create_split_bar_plot(
             data=data_lists,
             programs=programs,
@@ -2544,100 +2068,22 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-30 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data_lists = [[] for _ in range(2)]
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            # Left chart data
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['680'][
-                        'peak_heating_kW'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'peak_heating_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['680'][
-                        'peak_cooling_kW'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'peak_cooling_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['685'][
-                        'peak_heating_kW'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'peak_heating_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['685'][
-                        'peak_cooling_kW'] - json_obj['conditioned_zone_loads_non_free_float']['600'][
-                        'peak_cooling_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['695'][
-                        'peak_heating_kW'] - json_obj['conditioned_zone_loads_non_free_float']['685'][
-                        'peak_heating_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['695'][
-                        'peak_cooling_kW'] - json_obj['conditioned_zone_loads_non_free_float']['685'][
-                        'peak_cooling_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            data_lists[0].insert(idx, tmp_data)
-            # mid chart data
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['980'][
-                        'peak_heating_kW'] - json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'peak_heating_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['980'][
-                        'peak_cooling_kW'] - json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'peak_cooling_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['985'][
-                        'peak_heating_kW'] - json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'peak_heating_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['985'][
-                        'peak_cooling_kW'] - json_obj['conditioned_zone_loads_non_free_float']['900'][
-                        'peak_cooling_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['995'][
-                        'peak_heating_kW'] - json_obj['conditioned_zone_loads_non_free_float']['985'][
-                        'peak_heating_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['995'][
-                        'peak_cooling_kW'] - json_obj['conditioned_zone_loads_non_free_float']['985'][
-                        'peak_cooling_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            data_lists[1].insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data_lists = [
+            self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+                ('680-600', 'peak_heating_kW'),
+                ('680-600', 'peak_cooling_kW'),
+                ('685-600', 'peak_heating_kW'),
+                ('685-600', 'peak_cooling_kW'),
+                ('695-685', 'peak_heating_kW'),
+                ('695-685', 'peak_cooling_kW')]),
+            self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+                ('980-900', 'peak_heating_kW'),
+                ('980-900', 'peak_cooling_kW'),
+                ('985-900', 'peak_heating_kW'),
+                ('985-900', 'peak_cooling_kW'),
+                ('995-985', 'peak_heating_kW'),
+                ('995-985', 'peak_cooling_kW')])]
+        programs = self._get_software_names()
         fig, ax = self._create_split_bar_plot(
             data=data_lists,
             programs=programs,
@@ -2676,54 +2122,14 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-31 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['980'][
-                        'annual_heating_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['680'][
-                        'annual_heating_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['980'][
-                        'annual_cooling_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['680'][
-                        'annual_cooling_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['985'][
-                        'annual_heating_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['685'][
-                        'annual_heating_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['985'][
-                        'annual_cooling_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['685'][
-                        'annual_cooling_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['995'][
-                        'annual_heating_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['695'][
-                        'annual_heating_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['995'][
-                        'annual_cooling_MWh'] - json_obj['conditioned_zone_loads_non_free_float']['695'][
-                        'annual_cooling_MWh'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+            ('980-680', 'annual_heating_MWh'),
+            ('980-680', 'annual_cooling_MWh'),
+            ('985-685', 'annual_heating_MWh'),
+            ('985-685', 'annual_cooling_MWh'),
+            ('995-695', 'annual_heating_MWh'),
+            ('995-695', 'annual_cooling_MWh')])
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -2747,54 +2153,14 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-32 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['980'][
-                        'peak_heating_kW'] - json_obj['conditioned_zone_loads_non_free_float']['680'][
-                        'peak_heating_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['980'][
-                        'peak_cooling_kW'] - json_obj['conditioned_zone_loads_non_free_float']['680'][
-                        'peak_cooling_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['985'][
-                        'peak_heating_kW'] - json_obj['conditioned_zone_loads_non_free_float']['685'][
-                        'peak_heating_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['985'][
-                        'peak_cooling_kW'] - json_obj['conditioned_zone_loads_non_free_float']['685'][
-                        'peak_cooling_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['995'][
-                        'peak_heating_kW'] - json_obj['conditioned_zone_loads_non_free_float']['695'][
-                        'peak_heating_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['995'][
-                        'peak_cooling_kW'] - json_obj['conditioned_zone_loads_non_free_float']['695'][
-                        'peak_cooling_kW'])
-            except (KeyError, TypeError):
-                tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+            ('980-680', 'peak_heating_kW'),
+            ('980-680', 'peak_cooling_kW'),
+            ('985-685', 'peak_heating_kW'),
+            ('985-685', 'peak_cooling_kW'),
+            ('995-695', 'peak_heating_kW'),
+            ('995-695', 'peak_cooling_kW')])
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -2817,18 +2183,9 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-33 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data = []
-        programs = []
         cases = ['600FF', '900FF', '650FF', '950FF', '680FF', '980FF', '960']
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            for case in cases:
-                try:
-                    tmp_data.append(json_obj['free_float_case_zone_temperatures'][case]['average_temperature'])
-                except (KeyError, TypeError):
-                    tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_data('free_float_case_zone_temperatures', cases=cases, metric='average_temperature')
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -2844,18 +2201,9 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-34 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data = []
-        programs = []
         cases = ['600FF', '900FF', '650FF', '950FF', '680FF', '980FF', '960']
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            for case in cases:
-                try:
-                    tmp_data.append(json_obj['free_float_case_zone_temperatures'][case]['maximum_temperature'])
-                except (KeyError, TypeError):
-                    tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_data('free_float_case_zone_temperatures', cases=cases, metric='maximum_temperature')
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -2871,18 +2219,9 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-35 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data = []
-        programs = []
         cases = ['600FF', '900FF', '650FF', '950FF', '680FF', '980FF', '960']
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            for case in cases:
-                try:
-                    tmp_data.append(json_obj['free_float_case_zone_temperatures'][case]['minimum_temperature'])
-                except (KeyError, TypeError):
-                    tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_data('free_float_case_zone_temperatures', cases=cases, metric='minimum_temperature')
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -2899,18 +2238,8 @@ class GraphicsRenderer(Logger):
         :return: modified fig and ax objects from matplotlib.subplots()
         """
         cases = ['195', '200', '210', '215', '220', '230', '240', '250']
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            for case in cases:
-                try:
-                    tmp_data.append(
-                        json_obj['conditioned_zone_loads_non_free_float'][case]['annual_heating_MWh'])
-                except (KeyError, ValueError):
-                    tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_data('conditioned_zone_loads_non_free_float', cases=cases, metric='annual_heating_MWh')
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -2928,18 +2257,8 @@ class GraphicsRenderer(Logger):
         :return: modified fig and ax objects from matplotlib.subplots()
         """
         cases = ['195', '200', '210', '215', '220', '230', '240', '250']
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            for case in cases:
-                try:
-                    tmp_data.append(
-                        json_obj['conditioned_zone_loads_non_free_float'][case]['annual_cooling_MWh'])
-                except (KeyError, ValueError):
-                    tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_data('conditioned_zone_loads_non_free_float', cases=cases, metric='annual_cooling_MWh')
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -2957,18 +2276,8 @@ class GraphicsRenderer(Logger):
         :return: modified fig and ax objects from matplotlib.subplots()
         """
         cases = ['195', '200', '210', '215', '220', '230', '240', '250']
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            for case in cases:
-                try:
-                    tmp_data.append(
-                        json_obj['conditioned_zone_loads_non_free_float'][case]['peak_heating_kW'])
-                except (KeyError, ValueError):
-                    tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_data('conditioned_zone_loads_non_free_float', cases=cases, metric='peak_heating_kW')
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -2986,18 +2295,8 @@ class GraphicsRenderer(Logger):
         :return: modified fig and ax objects from matplotlib.subplots()
         """
         cases = ['195', '200', '210', '215', '220', '230', '240', '250']
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            for case in cases:
-                try:
-                    tmp_data.append(
-                        json_obj['conditioned_zone_loads_non_free_float'][case]['peak_cooling_kW'])
-                except (KeyError, ValueError):
-                    tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_data('conditioned_zone_loads_non_free_float', cases=cases, metric='peak_cooling_kW')
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -3015,18 +2314,8 @@ class GraphicsRenderer(Logger):
         :return: modified fig and ax objects from matplotlib.subplots()
         """
         cases = ['270', '280', '290', '300', '310', '320']
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            for case in cases:
-                try:
-                    tmp_data.append(
-                        json_obj['conditioned_zone_loads_non_free_float'][case]['annual_heating_MWh'])
-                except (KeyError, ValueError):
-                    tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_data('conditioned_zone_loads_non_free_float', cases=cases, metric='annual_heating_MWh')
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -3044,18 +2333,8 @@ class GraphicsRenderer(Logger):
         :return: modified fig and ax objects from matplotlib.subplots()
         """
         cases = ['270', '280', '290', '300', '310', '320']
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            for case in cases:
-                try:
-                    tmp_data.append(
-                        json_obj['conditioned_zone_loads_non_free_float'][case]['annual_cooling_MWh'])
-                except (KeyError, ValueError):
-                    tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_data('conditioned_zone_loads_non_free_float', cases=cases, metric='annual_cooling_MWh')
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -3073,18 +2352,8 @@ class GraphicsRenderer(Logger):
         :return: modified fig and ax objects from matplotlib.subplots()
         """
         cases = ['270', '280', '290', '300', '310', '320']
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            for case in cases:
-                try:
-                    tmp_data.append(
-                        json_obj['conditioned_zone_loads_non_free_float'][case]['peak_heating_kW'])
-                except (KeyError, ValueError):
-                    tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_data('conditioned_zone_loads_non_free_float', cases=cases, metric='peak_heating_kW')
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -3102,18 +2371,8 @@ class GraphicsRenderer(Logger):
         :return: modified fig and ax objects from matplotlib.subplots()
         """
         cases = ['270', '280', '290', '300', '310', '320']
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            for case in cases:
-                try:
-                    tmp_data.append(
-                        json_obj['conditioned_zone_loads_non_free_float'][case]['peak_cooling_kW'])
-                except (KeyError, ValueError):
-                    tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_data('conditioned_zone_loads_non_free_float', cases=cases, metric='peak_cooling_kW')
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -3130,60 +2389,16 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-44 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['200']['annual_heating_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['195']['annual_heating_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['200']['annual_cooling_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['195']['annual_cooling_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['210']['annual_heating_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['200']['annual_heating_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['210']['annual_cooling_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['200']['annual_cooling_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['220']['annual_heating_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['215']['annual_heating_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['220']['annual_cooling_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['215']['annual_cooling_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['215']['annual_heating_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['200']['annual_heating_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['220']['annual_heating_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['210']['annual_heating_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+            ('200-195', 'annual_heating_MWh'),
+            ('200-195', 'annual_cooling_MWh'),
+            ('210-200', 'annual_heating_MWh'),
+            ('210-200', 'annual_cooling_MWh'),
+            ('220-215', 'annual_heating_MWh'),
+            ('220-215', 'annual_cooling_MWh'),
+            ('215-200', 'annual_heating_MWh'),
+            ('220-210', 'annual_heating_MWh')])
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -3208,60 +2423,16 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-45 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['200']['peak_heating_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['195']['peak_heating_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['200']['peak_cooling_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['195']['peak_cooling_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['210']['peak_cooling_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['200']['peak_cooling_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['220']['peak_cooling_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['215']['peak_cooling_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['215']['peak_heating_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['200']['peak_heating_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['215']['peak_cooling_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['200']['peak_cooling_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['220']['peak_heating_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['210']['peak_heating_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['220']['peak_cooling_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['210']['peak_cooling_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+            ('200-195', 'peak_heating_kW'),
+            ('200-195', 'peak_cooling_kW'),
+            ('210-200', 'peak_cooling_kW'),
+            ('220-215', 'peak_cooling_kW'),
+            ('215-200', 'peak_heating_kW'),
+            ('215-200', 'peak_cooling_kW'),
+            ('220-210', 'peak_heating_kW'),
+            ('220-210', 'peak_cooling_kW')])
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -3287,60 +2458,16 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-46 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['230']['annual_heating_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['220']['annual_heating_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['230']['annual_cooling_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['220']['annual_cooling_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['240']['annual_heating_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['220']['annual_heating_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['240']['annual_cooling_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['220']['annual_cooling_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['250']['annual_heating_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['220']['annual_heating_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['250']['annual_cooling_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['220']['annual_cooling_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['270']['annual_heating_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['220']['annual_heating_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['270']['annual_cooling_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['220']['annual_cooling_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+            ('230-220', 'annual_heating_MWh'),
+            ('230-220', 'annual_cooling_MWh'),
+            ('240-220', 'annual_heating_MWh'),
+            ('240-220', 'annual_cooling_MWh'),
+            ('250-220', 'annual_heating_MWh'),
+            ('250-220', 'annual_cooling_MWh'),
+            ('270-220', 'annual_heating_MWh'),
+            ('270-220', 'annual_cooling_MWh')])
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -3366,48 +2493,14 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-47 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['230']['peak_heating_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['220']['peak_heating_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['230']['peak_cooling_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['220']['peak_cooling_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['240']['peak_heating_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['220']['peak_heating_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['240']['peak_cooling_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['220']['peak_cooling_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['250']['peak_cooling_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['220']['peak_cooling_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['270']['peak_cooling_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['220']['peak_cooling_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+            ('230-220', 'peak_heating_kW'),
+            ('230-220', 'peak_cooling_kW'),
+            ('240-220', 'peak_heating_kW'),
+            ('240-220', 'peak_cooling_kW'),
+            ('250-220', 'peak_cooling_kW'),
+            ('270-220', 'peak_cooling_kW')])
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -3431,54 +2524,15 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-48 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['280']['annual_cooling_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['270']['annual_cooling_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['320']['annual_heating_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['270']['annual_heating_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['320']['annual_heating_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['270']['annual_heating_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['290']['annual_cooling_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['270']['annual_cooling_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['300']['annual_cooling_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['270']['annual_cooling_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['310']['annual_heating_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['300']['annual_heating_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['310']['annual_cooling_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['300']['annual_cooling_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+            ('280-270', 'annual_cooling_MWh'),
+            ('320-270', 'annual_heating_MWh'),
+            ('320-270', 'annual_heating_MWh'),
+            ('290-270', 'annual_cooling_MWh'),
+            ('300-270', 'annual_cooling_MWh'),
+            ('310-300', 'annual_heating_MWh'),
+            ('310-300', 'annual_cooling_MWh')])
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -3503,42 +2557,13 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-49 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['280']['peak_cooling_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['270']['peak_cooling_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['320']['peak_cooling_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['270']['peak_cooling_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['290']['peak_cooling_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['270']['peak_cooling_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['300']['peak_cooling_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['270']['peak_cooling_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['310']['peak_cooling_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['300']['peak_cooling_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+            ('280-270', 'peak_cooling_kW'),
+            ('320-270', 'peak_cooling_kW'),
+            ('290-270', 'peak_cooling_kW'),
+            ('300-270', 'peak_cooling_kW'),
+            ('310-300', 'peak_cooling_kW')])
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -3559,19 +2584,9 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-50 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data = []
-        programs = []
         cases = ['395', '400', '410', '420', '430', '440', '800', '810']
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            for case in cases:
-                try:
-                    tmp_data.append(
-                        json_obj['conditioned_zone_loads_non_free_float'][case]['annual_heating_MWh'])
-                except (KeyError, ValueError):
-                    tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_data('conditioned_zone_loads_non_free_float', cases=cases, metric='annual_heating_MWh')
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -3588,19 +2603,9 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-51 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data = []
-        programs = []
         cases = ['395', '400', '410', '420', '430', '440', '800', '810']
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            for case in cases:
-                try:
-                    tmp_data.append(
-                        json_obj['conditioned_zone_loads_non_free_float'][case]['annual_cooling_MWh'])
-                except (KeyError, ValueError):
-                    tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_data('conditioned_zone_loads_non_free_float', cases=cases, metric='annual_cooling_MWh')
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -3617,19 +2622,9 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-52 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data = []
-        programs = []
         cases = ['395', '400', '410', '420', '430', '440', '800', '810']
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            for case in cases:
-                try:
-                    tmp_data.append(
-                        json_obj['conditioned_zone_loads_non_free_float'][case]['peak_heating_kW'])
-                except (KeyError, ValueError):
-                    tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_data('conditioned_zone_loads_non_free_float', cases=cases, metric='peak_heating_kW')
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -3646,19 +2641,9 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-53 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data = []
-        programs = []
         cases = ['395', '400', '410', '420', '430', '440', '800', '810']
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            for case in cases:
-                try:
-                    tmp_data.append(
-                        json_obj['conditioned_zone_loads_non_free_float'][case]['peak_cooling_kW'])
-                except (KeyError, ValueError):
-                    tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_data('conditioned_zone_loads_non_free_float', cases=cases, metric='peak_cooling_kW')
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -3675,78 +2660,19 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-54 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['400']['annual_heating_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['395']['annual_heating_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['410']['annual_heating_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['400']['annual_heating_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['420']['annual_heating_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['410']['annual_heating_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['430']['annual_heating_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['420']['annual_heating_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['430']['annual_cooling_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['420']['annual_cooling_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['600']['annual_heating_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['430']['annual_heating_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['600']['annual_cooling_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['430']['annual_cooling_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['440']['annual_heating_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['600']['annual_heating_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['440']['annual_cooling_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['600']['annual_cooling_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['810']['annual_heating_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['900']['annual_heating_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['810']['annual_cooling_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['900']['annual_cooling_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+            ('400-395', 'annual_heating_MWh'),
+            ('410-400', 'annual_heating_MWh'),
+            ('420-410', 'annual_heating_MWh'),
+            ('430-420', 'annual_heating_MWh'),
+            ('430-420', 'annual_cooling_MWh'),
+            ('600-430', 'annual_heating_MWh'),
+            ('600-430', 'annual_cooling_MWh'),
+            ('440-600', 'annual_heating_MWh'),
+            ('440-600', 'annual_cooling_MWh'),
+            ('810-900', 'annual_heating_MWh'),
+            ('810-900', 'annual_cooling_MWh')])
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -3775,72 +2701,18 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-55 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['400']['peak_heating_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['395']['peak_heating_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['400']['peak_cooling_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['395']['peak_cooling_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['410']['peak_heating_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['400']['peak_heating_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['410']['peak_cooling_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['400']['peak_cooling_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['420']['peak_heating_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['410']['peak_heating_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['420']['peak_cooling_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['410']['peak_cooling_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['430']['peak_cooling_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['420']['peak_cooling_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['600']['peak_cooling_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['430']['peak_cooling_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['440']['peak_cooling_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['600']['peak_cooling_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['810']['peak_cooling_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['900']['peak_cooling_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+            ('400-395', 'peak_heating_kW'),
+            ('400-395', 'peak_cooling_kW'),
+            ('410-400', 'peak_heating_kW'),
+            ('410-400', 'peak_cooling_kW'),
+            ('420-410', 'peak_heating_kW'),
+            ('420-410', 'peak_cooling_kW'),
+            ('430-420', 'peak_cooling_kW'),
+            ('600-430', 'peak_cooling_kW'),
+            ('440-600', 'peak_cooling_kW'),
+            ('810-900', 'peak_cooling_kW')])
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -3866,31 +2738,13 @@ class GraphicsRenderer(Logger):
     def render_section_tf_figure_b8_56(self):
         """
         Render Section Thermal Fabric Figure B8-56 by modifying fig an ax inputs from matplotlib
-        :return: modified fig and ax objects from matplotlib.subplots()
-        """
-        cases = ['600', '450', '460', '470']
-        data_lists = [[] for _ in range(2)]
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            # Left chart data
-            tmp_data = []
-            for case in cases:
-                try:
-                    tmp_data.append(
-                        json_obj['conditioned_zone_loads_non_free_float'][case]['annual_heating_MWh'])
-                except (KeyError, TypeError):
-                    tmp_data.append(float('NaN'))
-            data_lists[0].insert(idx, tmp_data)
-            # mid chart data
-            tmp_data = []
-            for case in cases:
-                try:
-                    tmp_data.append(
-                        json_obj['conditioned_zone_loads_non_free_float'][case]['annual_cooling_MWh'])
-                except (KeyError, TypeError):
-                    tmp_data.append(float('NaN'))
-            data_lists[1].insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        :return: modified fig and ax objects from matplotlib.subplots()
+        """
+        cases = ['600', '450', '460', '470']
+        data_lists = [
+            self._get_cube_data('conditioned_zone_loads_non_free_float', cases=cases, metric='annual_heating_MWh'),
+            self._get_cube_data('conditioned_zone_loads_non_free_float', cases=cases, metric='annual_cooling_MWh')]
+        programs = self._get_software_names()
         fig, ax = self._create_split_bar_plot(
             data=data_lists,
             programs=programs,
@@ -3915,28 +2769,10 @@ class GraphicsRenderer(Logger):
         :return: modified fig and ax objects from matplotlib.subplots()
         """
         cases = ['600', '450', '460', '470']
-        data_lists = [[] for _ in range(2)]
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            # Left chart data
-            tmp_data = []
-            for case in cases:
-                try:
-                    tmp_data.append(
-                        json_obj['conditioned_zone_loads_non_free_float'][case]['peak_heating_kW'])
-                except (KeyError, TypeError):
-                    tmp_data.append(float('NaN'))
-            data_lists[0].insert(idx, tmp_data)
-            # mid chart data
-            tmp_data = []
-            for case in cases:
-                try:
-                    tmp_data.append(
-                        json_obj['conditioned_zone_loads_non_free_float'][case]['peak_cooling_kW'])
-                except (KeyError, TypeError):
-                    tmp_data.append(float('NaN'))
-            data_lists[1].insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data_lists = [
+            self._get_cube_data('conditioned_zone_loads_non_free_float', cases=cases, metric='peak_heating_kW'),
+            self._get_cube_data('conditioned_zone_loads_non_free_float', cases=cases, metric='peak_cooling_kW')]
+        programs = self._get_software_names()
         fig, ax = self._create_split_bar_plot(
             data=data_lists,
             programs=programs,
@@ -3960,72 +2796,18 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-58 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['450']['annual_heating_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['600']['annual_heating_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['450']['annual_cooling_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['600']['annual_cooling_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['460']['annual_heating_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['600']['annual_heating_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['460']['annual_cooling_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['600']['annual_cooling_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['460']['annual_heating_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['450']['annual_heating_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['460']['annual_cooling_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['450']['annual_cooling_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['470']['annual_heating_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['600']['annual_heating_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['470']['annual_cooling_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['600']['annual_cooling_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['470']['annual_heating_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['450']['annual_heating_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['470']['annual_cooling_MWh'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['450']['annual_cooling_MWh'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+            ('450-600', 'annual_heating_MWh'),
+            ('450-600', 'annual_cooling_MWh'),
+            ('460-600', 'annual_heating_MWh'),
+            ('460-600', 'annual_cooling_MWh'),
+            ('460-450', 'annual_heating_MWh'),
+            ('460-450', 'annual_cooling_MWh'),
+            ('470-600', 'annual_heating_MWh'),
+            ('470-600', 'annual_cooling_MWh'),
+            ('470-450', 'annual_heating_MWh'),
+            ('470-450', 'annual_cooling_MWh')])
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -4054,72 +2836,18 @@ class GraphicsRenderer(Logger):
         Render Section Thermal Fabric Figure B8-59 by modifying fig an ax inputs from matplotlib
         :return: modified fig and ax objects from matplotlib.subplots()
         """
-        data = []
-        programs = []
-        for idx, (tst, json_obj) in enumerate(self.json_data.items()):
-            tmp_data = []
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['450']['peak_heating_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['600']['peak_heating_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['450']['peak_cooling_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['600']['peak_cooling_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['460']['peak_heating_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['600']['peak_heating_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['460']['peak_cooling_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['600']['peak_cooling_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['460']['peak_heating_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['450']['peak_heating_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['460']['peak_cooling_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['450']['peak_cooling_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['470']['peak_heating_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['600']['peak_heating_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['470']['peak_cooling_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['600']['peak_cooling_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['470']['peak_heating_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['450']['peak_heating_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            try:
-                tmp_data.append(
-                    json_obj['conditioned_zone_loads_non_free_float']['470']['peak_cooling_kW'] - json_obj[
-                        'conditioned_zone_loads_non_free_float']['450']['peak_cooling_kW'])
-            except (KeyError, ValueError):
-                tmp_data.append(float('NaN'))
-            data.insert(idx, tmp_data)
-            programs.insert(idx, json_obj['identifying_information']['software_name'])
+        data = self._get_cube_delta_data('conditioned_zone_loads_non_free_float', [
+            ('450-600', 'peak_heating_kW'),
+            ('450-600', 'peak_cooling_kW'),
+            ('460-600', 'peak_heating_kW'),
+            ('460-600', 'peak_cooling_kW'),
+            ('460-450', 'peak_heating_kW'),
+            ('460-450', 'peak_cooling_kW'),
+            ('470-600', 'peak_heating_kW'),
+            ('470-600', 'peak_cooling_kW'),
+            ('470-450', 'peak_heating_kW'),
+            ('470-450', 'peak_cooling_kW')])
+        programs = self._get_software_names()
         fig, ax = self._create_bar_plot(
             data=data,
             programs=programs,
@@ -6262,42 +4990,40 @@ class GraphicsRenderer(Logger):
     def render_section_tf_table_b8_1(self):
         figure_name = 'section_7_table_b8_01'
         caption = 'Table B8-1. Annual Heating Loads (kWh)'
-        data_table = []
         footnotes = ['$$ ABS[ (Max-Min) / (Mean of Example Simulation Results)]', ]
         row_headings = list(self.case_map.values())
         column_headings = ['Case']
         for _, json_obj in self.json_data.items():
             column_headings.append(json_obj['identifying_information']['software_name'])
-        for case in self.case_map.keys():
-            row = []
-            for tst, json_obj in self.json_data.items():
-                row.append(json_obj['conditioned_zone_loads_non_free_float'][case]['annual_heating_MWh'])
-            data_table.append(row)
+        data_table = self._get_result_cube('conditioned_zone_loads_non_free_float').select(
+            cases=self.case_map.keys(), metrics=['annual_heating_MWh', ])[:, :, 0].T.tolist()
+        reference_statistics = self._get_reference_statistics(
+            'conditioned_zone_loads_non_free_float', self.case_map.keys(), 'annual_heating_MWh')
         for blank_row in [44, 35, 21, 11]:
             data_table.insert(blank_row, [])  # add blank line as separator
             row_headings.insert(blank_row, '')
-        text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3)
+            reference_statistics.insert(blank_row, None)
+        text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3, reference_statistics=reference_statistics)
         self._make_markdown_from_table(figure_name, caption, text_table_with_stats, footnotes)
         return
 
     def render_section_tf_table_b8_2(self):
         figure_name = 'section_7_table_b8_02'
         caption = 'Table B8-2. Annual Sensible Cooling Loads (kWh)'
-        data_table = []
         footnotes = ['$$ ABS[ (Max-Min) / (Mean of Example Simulation Results)]', ]
         row_headings = list(self.case_map.values())
         column_headings = ['Case']
         for _, json_obj in self.json_data.items():
             column_headings.append(json_obj['identifying_information']['software_name'])
-        for case in self.case_map.keys():
-            row = []
-            for tst, json_obj in self.json_data.items():
-                row.append(json_obj['conditioned_zone_loads_non_free_float'][case]['annual_cooling_MWh'])
-            data_table.append(row)
+        data_table = self._get_result_cube('conditioned_zone_loads_non_free_float').select(
+            cases=self.case_map.keys(), metrics=['annual_cooling_MWh', ])[:, :, 0].T.tolist()
+        reference_statistics = self._get_reference_statistics(
+            'conditioned_zone_loads_non_free_float', self.case_map.keys(), 'annual_cooling_MWh')
         for blank_row in [44, 35, 21, 11]:
             data_table.insert(blank_row, [])  # add blank line as separator
             row_headings.insert(blank_row, '')
-        text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3)
+            reference_statistics.insert(blank_row, None)
+        text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3, reference_statistics=reference_statistics)
         self._make_markdown_from_table(figure_name, caption, text_table_with_stats, footnotes)
         return
 
@@ -6323,11 +5049,14 @@ class GraphicsRenderer(Logger):
                 time_stamp_row.append(f'{month} {day}-{hour}')
             data_table.append(row)
             time_stamp_table.append(time_stamp_row)
+        reference_statistics = self._get_reference_statistics(
+            'conditioned_zone_loads_non_free_float', self.case_map.keys(), 'peak_heating_kW')
         for blank_row in [44, 35, 21, 11]:
             data_table.insert(blank_row, [])  # add blank line as separator
             time_stamp_table.insert(blank_row, [])
             row_headings.insert(blank_row, '')
-        text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3, time_stamps=time_stamp_table)
+            reference_statistics.insert(blank_row, None)
+        text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3, time_stamps=time_stamp_table, reference_statistics=reference_statistics)
         self._make_markdown_from_table(figure_name, caption, text_table_with_stats, footnotes)
         return
 
@@ -6353,11 +5082,14 @@ class GraphicsRenderer(Logger):
                 time_stamp_row.append(f'{month} {day}-{hour}')
             data_table.append(row)
             time_stamp_table.append(time_stamp_row)
+        reference_statistics = self._get_reference_statistics(
+            'conditioned_zone_loads_non_free_float', self.case_map.keys(), 'peak_cooling_kW')
         for blank_row in [44, 35, 21, 11]:
             data_table.insert(blank_row, [])  # add blank line as separator
             time_stamp_table.insert(blank_row, [])
             row_headings.insert(blank_row, '')
-        text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3, time_stamps=time_stamp_table)
+            reference_statistics.insert(blank_row, None)
+        text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3, time_stamps=time_stamp_table, reference_statistics=reference_statistics)
         self._make_markdown_from_table(figure_name, caption, text_table_with_stats, footnotes)
         return
 
@@ -6391,7 +5123,9 @@ class GraphicsRenderer(Logger):
                 time_stamp_row.append(f'{month} {day}-{hour}')
             data_table.append(row)
             time_stamp_table.append(time_stamp_row)
-        text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=1, time_stamps=time_stamp_table)
+        reference_statistics = self._get_reference_statistics(
+            'free_float_case_zone_temperatures', free_float_cases.keys(), 'maximum_temperature')
+        text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=1, time_stamps=time_stamp_table, reference_statistics=reference_statistics)
         self._make_markdown_from_table(figure_name, caption, text_table_with_stats, footnotes)
         return
 
@@ -6425,7 +5159,9 @@ class GraphicsRenderer(Logger):
                 time_stamp_row.append(f'{month} {day}-{hour}')
             data_table.append(row)
             time_stamp_table.append(time_stamp_row)
-        text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=1, time_stamps=time_stamp_table)
+        reference_statistics = self._get_reference_statistics(
+            'free_float_case_zone_temperatures', free_float_cases.keys(), 'minimum_temperature')
+        text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=1, time_stamps=time_stamp_table, reference_statistics=reference_statistics)
         self._make_markdown_from_table(figure_name, caption, text_table_with_stats, footnotes)
         return
 
@@ -6440,19 +5176,16 @@ class GraphicsRenderer(Logger):
             '680FF': '680FF - Case 600FF with More Insulation',
             '980FF': '980FF - Case 900FF with More Insulation',
             '960': '960 - Sunspace'}
-        data_table = []
         footnotes = ['$$ ABS[ (Max-Min) / (Mean of Example Simulation Results)]', ]
         row_headings = list(free_float_cases.values())
         column_headings = ['Case']
         for _, json_obj in self.json_data.items():
             column_headings.append(json_obj['identifying_information']['software_name'])
-        for case in free_float_cases.keys():
-            row = []
-            for tst, json_obj in self.json_data.items():
-                case_json = json_obj['free_float_case_zone_temperatures'][case]
-                row.append(case_json['average_temperature'])
-            data_table.append(row)
-        text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=1)
+        data_table = self._get_result_cube('free_float_case_zone_temperatures').select(
+            cases=free_float_cases.keys(), metrics=['average_temperature', ])[:, :, 0].T.tolist()
+        reference_statistics = self._get_reference_statistics(
+            'free_float_case_zone_temperatures', free_float_cases.keys(), 'average_temperature')
+        text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=1, reference_statistics=reference_statistics)
         self._make_markdown_from_table(figure_name, caption, text_table_with_stats, footnotes)
         return
 
@@ -6460,31 +5193,22 @@ class GraphicsRenderer(Logger):
         figure_name = 'section_7_table_b8_06a'
         caption = 'Table B8-6a. Low Mass Basic Sensitivity Tests - Annual Heating (MWh)'
         sensitivity_cases = {
-            ('610', '600'): '610 - 600 Heat, S. Shade',
-            ('620', '600'): '620 - 600 Heat, E&W Orient',
-            ('630', '620'): '630 - 620 Heat, E&W Shade',
-            ('640', '600'): '640 - 600 Heat, Htg. Setback',
-            ('660', '600'): '660 - 600 Heat, Low-E Win.',
-            ('670', '600'): '670 - 600 Heat, 1-Pane Win.',
-            ('680', '600'): '680 - 600 Heat, > Ins. 20/27',
-            ('685', '600'): '685 - 600 Heat, 20/20 tstat',
-            ('695', '685'): '695 - 685 Heat, > Ins. 20/20'}
-        data_table = []
+            '610-600': '610 - 600 Heat, S. Shade',
+            '620-600': '620 - 600 Heat, E&W Orient',
+            '630-620': '630 - 620 Heat, E&W Shade',
+            '640-600': '640 - 600 Heat, Htg. Setback',
+            '660-600': '660 - 600 Heat, Low-E Win.',
+            '670-600': '670 - 600 Heat, 1-Pane Win.',
+            '680-600': '680 - 600 Heat, > Ins. 20/27',
+            '685-600': '685 - 600 Heat, 20/20 tstat',
+            '695-685': '695 - 685 Heat, > Ins. 20/20'}
         footnotes = ['$$ ABS[ (Max-Min) / (Mean of Example Simulation Results)]', ]
         row_headings = list(sensitivity_cases.values())
         column_headings = ['Case']
         for _, json_obj in self.json_data.items():
             column_headings.append(json_obj['identifying_information']['software_name'])
-        for (case_a, case_b) in sensitivity_cases.keys():
-            row = []
-            for tst, json_obj in self.json_data.items():
-                case_a_value = json_obj['conditioned_zone_loads_non_free_float'][case_a]['annual_heating_MWh']
-                case_b_value = json_obj['conditioned_zone_loads_non_free_float'][case_b]['annual_heating_MWh']
-                if math.isnan(case_a_value) or math.isnan(case_b_value):
-                    row.append(math.nan)
-                else:
-                    row.append(float(case_a_value) - float(case_b_value))
-            data_table.append(row)
+        data_table = self._get_result_cube('conditioned_zone_loads_non_free_float').select_deltas(
+            sensitivity_cases.keys(), metrics=['annual_heating_MWh', ])[:, :, 0].T.tolist()
         text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3)
         self._make_markdown_from_table(figure_name, caption, text_table_with_stats, footnotes)
         return
@@ -6493,32 +5217,23 @@ class GraphicsRenderer(Logger):
         figure_name = 'section_7_table_b8_06b'
         caption = 'Table B8-6b. Low Mass Basic Sensitivity Tests - Annual Sensible Cooling (MWh)'
         sensitivity_cases = {
-            ('610', '600'): '610 - 600 Cool, S. Shade',
-            ('620', '600'): '620 - 600 Cool, E&W Orient',
-            ('630', '620'): '630 - 620 Cool, E&W Shade',
-            ('640', '600'): '640 - 600 Cool, Htg. Setback',
-            ('650', '600'): '650 - 600 Cool, Night Vent',
-            ('660', '600'): '660 - 600 Heat, Low-E Win.',
-            ('670', '600'): '670 - 600 Heat, 1-Pane Win.',
-            ('680', '600'): '680 - 600 Heat, > Ins. 20/27',
-            ('685', '600'): '685 - 600 Heat, 20/20 tstat',
-            ('695', '685'): '695 - 685 Heat, > Ins. 20/20'}
-        data_table = []
+            '610-600': '610 - 600 Cool, S. Shade',
+            '620-600': '620 - 600 Cool, E&W Orient',
+            '630-620': '630 - 620 Cool, E&W Shade',
+            '640-600': '640 - 600 Cool, Htg. Setback',
+            '650-600': '650 - 600 Cool, Night Vent',
+            '660-600': '660 - 600 Heat, Low-E Win.',
+            '670-600': '670 - 600 Heat, 1-Pane Win.',
+            '680-600': '680 - 600 Heat, > Ins. 20/27',
+            '685-600': '685 - 600 Heat, 20/20 tstat',
+            '695-685': '695 - 685 Heat, > Ins. 20/20'}
         footnotes = ['$$ ABS[ (Max-Min) / (Mean of Example Simulation Results)]', ]
         row_headings = list(sensitivity_cases.values())
         column_headings = ['Case']
         for _, json_obj in self.json_data.items():
             column_headings.append(json_obj['identifying_information']['software_name'])
-        for (case_a, case_b) in sensitivity_cases.keys():
-            row = []
-            for tst, json_obj in self.json_data.items():
-                case_a_value = json_obj['conditioned_zone_loads_non_free_float'][case_a]['annual_cooling_MWh']
-                case_b_value = json_obj['conditioned_zone_loads_non_free_float'][case_b]['annual_cooling_MWh']
-                if math.isnan(case_a_value) or math.isnan(case_b_value):
-                    row.append(math.nan)
-                else:
-                    row.append(float(case_a_value) - float(case_b_value))
-            data_table.append(row)
+        data_table = self._get_result_cube('conditioned_zone_loads_non_free_float').select_deltas(
+            sensitivity_cases.keys(), metrics=['annual_cooling_MWh', ])[:, :, 0].T.tolist()
         text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3)
         self._make_markdown_from_table(figure_name, caption, text_table_with_stats, footnotes)
         return
@@ -6527,31 +5242,22 @@ class GraphicsRenderer(Logger):
         figure_name = 'section_7_table_b8_06c'
         caption = 'Table B8-6c. Low Mass Basic Sensitivity Tests - Peak Heating (kW)'
         sensitivity_cases = {
-            ('610', '600'): '610 - 600 Heat, S. Shade',
-            ('620', '600'): '620 - 600 Heat, E&W Orient',
-            ('630', '620'): '630 - 620 Heat, E&W Shade',
-            ('640', '600'): '640 - 600 Heat, Htg. Setback',
-            ('660', '600'): '660 - 600 Heat, Low-E Win.',
-            ('670', '600'): '670 - 600 Heat, 1-Pane Win.',
-            ('680', '600'): '680 - 600 Heat, > Ins. 20/27',
-            ('685', '600'): '685 - 600 Heat, 20/20 tstat',
-            ('695', '685'): '695 - 685 Heat, > Ins. 20/20'}
-        data_table = []
+            '610-600': '610 - 600 Heat, S. Shade',
+            '620-600': '620 - 600 Heat, E&W Orient',
+            '630-620': '630 - 620 Heat, E&W Shade',
+            '640-600': '640 - 600 Heat, Htg. Setback',
+            '660-600': '660 - 600 Heat, Low-E Win.',
+            '670-600': '670 - 600 Heat, 1-Pane Win.',
+            '680-600': '680 - 600 Heat, > Ins. 20/27',
+            '685-600': '685 - 600 Heat, 20/20 tstat',
+            '695-685': '695 - 685 Heat, > Ins. 20/20'}
         footnotes = ['$$ ABS[ (Max-Min) / (Mean of Example Simulation Results)]', ]
         row_headings = list(sensitivity_cases.values())
         column_headings = ['Case']
         for _, json_obj in self.json_data.items():
             column_headings.append(json_obj['identifying_information']['software_name'])
-        for (case_a, case_b) in sensitivity_cases.keys():
-            row = []
-            for tst, json_obj in self.json_data.items():
-                case_a_value = json_obj['conditioned_zone_loads_non_free_float'][case_a]['peak_heating_kW']
-                case_b_value = json_obj['conditioned_zone_loads_non_free_float'][case_b]['peak_heating_kW']
-                if math.isnan(case_a_value) or math.isnan(case_b_value):
-                    row.append(math.nan)
-                else:
-                    row.append(float(case_a_value) - float(case_b_value))
-            data_table.append(row)
+        data_table = self._get_result_cube('conditioned_zone_loads_non_free_float').select_deltas(
+            sensitivity_cases.keys(), metrics=['peak_heating_kW', ])[:, :, 0].T.tolist()
         text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3)
         self._make_markdown_from_table(figure_name, caption, text_table_with_stats, footnotes)
         return
@@ -6560,32 +5266,23 @@ class GraphicsRenderer(Logger):
         figure_name = 'section_7_table_b8_06d'
         caption = 'Table B8-6d. Low Mass Basic Sensitivity Tests - Peak Sensible Cooling (kW)'
         sensitivity_cases = {
-            ('610', '600'): '610 - 600 Cool, S. Shade',
-            ('620', '600'): '620 - 600 Cool, E&W Orient',
-            ('630', '620'): '630 - 620 Cool, E&W Shade',
-            ('640', '600'): '640 - 600 Cool, Htg. Setback',
-            ('650', '600'): '650 - 600 Cool, Night Vent',
-            ('660', '600'): '660 - 600 Heat, Low-E Win.',
-            ('670', '600'): '670 - 600 Heat, 1-Pane Win.',
-            ('680', '600'): '680 - 600 Heat, > Ins. 20/27',
-            ('685', '600'): '685 - 600 Heat, 20/20 tstat',
-            ('695', '685'): '695 - 685 Heat, > Ins. 20/20'}
-        data_table = []
+            '610-600': '610 - 600 Cool, S. Shade',
+            '620-600': '620 - 600 Cool, E&W Orient',
+            '630-620': '630 - 620 Cool, E&W Shade',
+            '640-600': '640 - 600 Cool, Htg. Setback',
+            '650-600': '650 - 600 Cool, Night Vent',
+            '660-600': '660 - 600 Heat, Low-E Win.',
+            '670-600': '670 - 600 Heat, 1-Pane Win.',
+            '680-600': '680 - 600 Heat, > Ins. 20/27',
+            '685-600': '685 - 600 Heat, 20/20 tstat',
+            '695-685': '695 - 685 Heat, > Ins. 20/20'}
         footnotes = ['$$ ABS[ (Max-Min) / (Mean of Example Simulation Results)]', ]
         row_headings = list(sensitivity_cases.values())
         column_headings = ['Case']
         for _, json_obj in self.json_data.items():
             column_headings.append(json_obj['identifying_information']['software_name'])
-        for (case_a, case_b) in sensitivity_cases.keys():
-            row = []
-            for tst, json_obj in self.json_data.items():
-                case_a_value = json_obj['conditioned_zone_loads_non_free_float'][case_a]['peak_cooling_kW']
-                case_b_value = json_obj['conditioned_zone_loads_non_free_float'][case_b]['peak_cooling_kW']
-                if math.isnan(case_a_value) or math.isnan(case_b_value):
-                    row.append(math.nan)
-                else:
-                    row.append(float(case_a_value) - float(case_b_value))
-            data_table.append(row)
+        data_table = self._get_result_cube('conditioned_zone_loads_non_free_float').select_deltas(
+            sensitivity_cases.keys(), metrics=['peak_cooling_kW', ])[:, :, 0].T.tolist()
         text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3)
         self._make_markdown_from_table(figure_name, caption, text_table_with_stats, footnotes)
         return
@@ -6594,31 +5291,22 @@ class GraphicsRenderer(Logger):
         figure_name = 'section_7_table_b8_07a'
         caption = 'Table B8-7a. High Mass Basic Sensitivity Tests - Annual Heating (MWh)'
         sensitivity_cases = {
-            ('900', '600'): '900 - 600 Mass, Heat',
-            ('910', '900'): '910 - 900 Heat, S.Shade',
-            ('920', '900'): '920 - 900 Heat, E&W Orient.',
-            ('930', '920'): '930 - 920 Heat, E&W Shade',
-            ('940', '900'): '940 - 900 Heat, Htg. Setback',
-            ('960', '900'): '960 - 900 Heat, Sunspace',
-            ('980', '900'): '980 - 900 Heat, > Ins. 20/27',
-            ('985', '900'): '985 - 900 Heat, > 20/20 tstat',
-            ('995', '985'): '995 - 985 Heat, > Ins. 20/20'}
-        data_table = []
+            '900-600': '900 - 600 Mass, Heat',
+            '910-900': '910 - 900 Heat, S.Shade',
+            '920-900': '920 - 900 Heat, E&W Orient.',
+            '930-920': '930 - 920 Heat, E&W Shade',
+            '940-900': '940 - 900 Heat, Htg. Setback',
+            '960-900': '960 - 900 Heat, Sunspace',
+            '980-900': '980 - 900 Heat, > Ins. 20/27',
+            '985-900': '985 - 900 Heat, > 20/20 tstat',
+            '995-985': '995 - 985 Heat, > Ins. 20/20'}
         footnotes = ['$$ ABS[ (Max-Min) / (Mean of Example Simulation Results)]', ]
         row_headings = list(sensitivity_cases.values())
         column_headings = ['Case']
         for _, json_obj in self.json_data.items():
             column_headings.append(json_obj['identifying_information']['software_name'])
-        for (case_a, case_b) in sensitivity_cases.keys():
-            row = []
-            for tst, json_obj in self.json_data.items():
-                case_a_value = json_obj['conditioned_zone_loads_non_free_float'][case_a]['annual_heating_MWh']
-                case_b_value = json_obj['conditioned_zone_loads_non_free_float'][case_b]['annual_heating_MWh']
-                if math.isnan(case_a_value) or math.isnan(case_b_value):
-                    row.append(math.nan)
-                else:
-                    row.append(float(case_a_value) - float(case_b_value))
-            data_table.append(row)
+        data_table = self._get_result_cube('conditioned_zone_loads_non_free_float').select_deltas(
+            sensitivity_cases.keys(), metrics=['annual_heating_MWh', ])[:, :, 0].T.tolist()
         text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3)
         self._make_markdown_from_table(figure_name, caption, text_table_with_stats, footnotes)
         return
@@ -6627,32 +5315,23 @@ class GraphicsRenderer(Logger):
         figure_name = 'section_7_table_b8_07b'
         caption = 'Table B8-7b. High Mass Basic Sensitivity Tests - Annual Sensible Cooling (MWh)'
         sensitivity_cases = {
-            ('900', '600'): '900 - 600 Mass, Cool',
-            ('910', '900'): '910 - 900 Cool, S.Shade',
-            ('920', '900'): '920 - 900 Cool, E&W Orient.',
-            ('930', '920'): '930 - 920 Cool, E&W Shade',
-            ('940', '900'): '940 - 900 Cool, Htg. Setback',
-            ('950', '900'): '950 - 900 Cool, Night Vent',
-            ('960', '900'): '960 - 900 Cool, Sunspace',
-            ('980', '900'): '980 - 900 Heat, > Ins. 20/27',
-            ('985', '900'): '985 - 900 Heat, > 20/20 tstat',
-            ('995', '985'): '995 - 985 Heat, > Ins. 20/20'}
-        data_table = []
+            '900-600': '900 - 600 Mass, Cool',
+            '910-900': '910 - 900 Cool, S.Shade',
+            '920-900': '920 - 900 Cool, E&W Orient.',
+            '930-920': '930 - 920 Cool, E&W Shade',
+            '940-900': '940 - 900 Cool, Htg. Setback',
+            '950-900': '950 - 900 Cool, Night Vent',
+            '960-900': '960 - 900 Cool, Sunspace',
+            '980-900': '980 - 900 Heat, > Ins. 20/27',
+            '985-900': '985 - 900 Heat, > 20/20 tstat',
+            '995-985': '995 - 985 Heat, > Ins. 20/20'}
         footnotes = ['$$ ABS[ (Max-Min) / (Mean of Example Simulation Results)]', ]
         row_headings = list(sensitivity_cases.values())
         column_headings = ['Case']
         for _, json_obj in self.json_data.items():
             column_headings.append(json_obj['identifying_information']['software_name'])
-        for (case_a, case_b) in sensitivity_cases.keys():
-            row = []
-            for tst, json_obj in self.json_data.items():
-                case_a_value = json_obj['conditioned_zone_loads_non_free_float'][case_a]['annual_cooling_MWh']
-                case_b_value = json_obj['conditioned_zone_loads_non_free_float'][case_b]['annual_cooling_MWh']
-                if math.isnan(case_a_value) or math.isnan(case_b_value):
-                    row.append(math.nan)
-                else:
-                    row.append(float(case_a_value) - float(case_b_value))
-            data_table.append(row)
+        data_table = self._get_result_cube('conditioned_zone_loads_non_free_float').select_deltas(
+            sensitivity_cases.keys(), metrics=['annual_cooling_MWh', ])[:, :, 0].T.tolist()
         text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3)
         self._make_markdown_from_table(figure_name, caption, text_table_with_stats, footnotes)
         return
@@ -6661,31 +5340,22 @@ class GraphicsRenderer(Logger):
         figure_name = 'section_7_table_b8_07c'
         caption = 'Table B8-7c. High Mass Basic Sensitivity Tests - Peak Heating (kW)'
         sensitivity_cases = {
-            ('900', '600'): '900 - 600 Mass, Heat',
-            ('910', '900'): '910 - 900 Heat, S.Shade',
-            ('920', '900'): '920 - 900 Heat, E&W Orient.',
-            ('930', '920'): '930 - 920 Heat, E&W Shade',
-            ('940', '900'): '940 - 900 Heat, Htg. Setback',
-            ('960', '900'): '960 - 900 Heat, Sunspace',
-            ('980', '900'): '980 - 900 Heat, > Ins. 20/27',
-            ('985', '900'): '985 - 900 Heat, > 20/20 tstat',
-            ('995', '985'): '995 - 985 Heat, > Ins. 20/20'}
-        data_table = []
+            '900-600': '900 - 600 Mass, Heat',
+            '910-900': '910 - 900 Heat, S.Shade',
+            '920-900': '920 - 900 Heat, E&W Orient.',
+            '930-920': '930 - 920 Heat, E&W Shade',
+            '940-900': '940 - 900 Heat, Htg. Setback',
+            '960-900': '960 - 900 Heat, Sunspace',
+            '980-900': '980 - 900 Heat, > Ins. 20/27',
+            '985-900': '985 - 900 Heat, > 20/20 tstat',
+            '995-985': '995 - 985 Heat, > Ins. 20/20'}
         footnotes = ['$$ ABS[ (Max-Min) / (Mean of Example Simulation Results)]', ]
         row_headings = list(sensitivity_cases.values())
         column_headings = ['Case']
         for _, json_obj in self.json_data.items():
             column_headings.append(json_obj['identifying_information']['software_name'])
-        for (case_a, case_b) in sensitivity_cases.keys():
-            row = []
-            for tst, json_obj in self.json_data.items():
-                case_a_value = json_obj['conditioned_zone_loads_non_free_float'][case_a]['peak_heating_kW']
-                case_b_value = json_obj['conditioned_zone_loads_non_free_float'][case_b]['peak_heating_kW']
-                if math.isnan(case_a_value) or math.isnan(case_b_value):
-                    row.append(math.nan)
-                else:
-                    row.append(float(case_a_value) - float(case_b_value))
-            data_table.append(row)
+        data_table = self._get_result_cube('conditioned_zone_loads_non_free_float').select_deltas(
+            sensitivity_cases.keys(), metrics=['peak_heating_kW', ])[:, :, 0].T.tolist()
         text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3)
         self._make_markdown_from_table(figure_name, caption, text_table_with_stats, footnotes)
         return
@@ -6694,32 +5364,23 @@ class GraphicsRenderer(Logger):
         figure_name = 'section_7_table_b8_07d'
         caption = 'Table B8-7d. High Mass Basic Sensitivity Tests - Peak Sensible Cooling (kW)'
         sensitivity_cases = {
-            ('900', '600'): '900 - 600 Mass, Cool',
-            ('910', '900'): '910 - 900 Cool, S.Shade',
-            ('920', '900'): '920 - 900 Cool, E&W Orient.',
-            ('930', '920'): '930 - 920 Cool, E&W Shade',
-            ('940', '900'): '940 - 900 Cool, Htg. Setback',
-            ('950', '900'): '950 - 900 Cool, Night Vent',
-            ('960', '900'): '960 - 900 Cool, Sunspace',
-            ('980', '900'): '980 - 900 Heat, > Ins. 20/27',
-            ('985', '900'): '985 - 900 Heat, > 20/20 tstat',
-            ('995', '985'): '995 - 985 Heat, > Ins. 20/20'}
-        data_table = []
+            '900-600': '900 - 600 Mass, Cool',
+            '910-900': '910 - 900 Cool, S.Shade',
+            '920-900': '920 - 900 Cool, E&W Orient.',
+            '930-920': '930 - 920 Cool, E&W Shade',
+            '940-900': '940 - 900 Cool, Htg. Setback',
+            '950-900': '950 - 900 Cool, Night Vent',
+            '960-900': '960 - 900 Cool, Sunspace',
+            '980-900': '980 - 900 Heat, > Ins. 20/27',
+            '985-900': '985 - 900 Heat, > 20/20 tstat',
+            '995-985': '995 - 985 Heat, > Ins. 20/20'}
         footnotes = ['$$ ABS[ (Max-Min) / (Mean of Example Simulation Results)]', ]
         row_headings = list(sensitivity_cases.values())
         column_headings = ['Case']
         for _, json_obj in self.json_data.items():
             column_headings.append(json_obj['identifying_information']['software_name'])
-        for (case_a, case_b) in sensitivity_cases.keys():
-            row = []
-            for tst, json_obj in self.json_data.items():
-                case_a_value = json_obj['conditioned_zone_loads_non_free_float'][case_a]['peak_cooling_kW']
-                case_b_value = json_obj['conditioned_zone_loads_non_free_float'][case_b]['peak_cooling_kW']
-                if math.isnan(case_a_value) or math.isnan(case_b_value):
-                    row.append(math.nan)
-                else:
-                    row.append(float(case_a_value) - float(case_b_value))
-            data_table.append(row)
+        data_table = self._get_result_cube('conditioned_zone_loads_non_free_float').select_deltas(
+            sensitivity_cases.keys(), metrics=['peak_cooling_kW', ])[:, :, 0].T.tolist()
         text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3)
         self._make_markdown_from_table(figure_name, caption, text_table_with_stats, footnotes)
         return
@@ -6728,36 +5389,27 @@ class GraphicsRenderer(Logger):
         figure_name = 'section_7_table_b8_08a'
         caption = 'Table B8-8a. Low Mass In-Depth (Cases 195 thru 320) Sensitivity Tests - Annual Heating (MWh)'
         sensitivity_cases = {
-            ('200', '195'): '200-195 Surface Convection',
-            ('210', '200'): '210-200 Ext IR (Int IR "off")',
-            ('220', '215'): '220-215 Ext IR (Int IR "on")',
-            ('215', '200'): '215-200 Int IR (Ext IR "off")',
-            ('220', '210'): '220-210 Int IR (Ext IR "on")',
-            ('230', '220'): '230-220 Infiltration',
-            ('240', '220'): '240-220 Internal Gains',
-            ('250', '220'): '250-220 Ext Solar Abs.',
-            ('270', '220'): '270-220 South Windows',
-            ('280', '270'): '280-270 Cavity Albedo',
-            ('320', '270'): '320-270 Thermostat',
-            ('290', '270'): '290-270 South Shading',
-            ('300', '270'): '300-270 E&W Windows',
-            ('310', '300'): '310-300 E&W Shading'}
-        data_table = []
+            '200-195': '200-195 Surface Convection',
+            '210-200': '210-200 Ext IR (Int IR "off")',
+            '220-215': '220-215 Ext IR (Int IR "on")',
+            '215-200': '215-200 Int IR (Ext IR "off")',
+            '220-210': '220-210 Int IR (Ext IR "on")',
+            '230-220': '230-220 Infiltration',
+            '240-220': '240-220 Internal Gains',
+            '250-220': '250-220 Ext Solar Abs.',
+            '270-220': '270-220 South Windows',
+            '280-270': '280-270 Cavity Albedo',
+            '320-270': '320-270 Thermostat',
+            '290-270': '290-270 South Shading',
+            '300-270': '300-270 E&W Windows',
+            '310-300': '310-300 E&W Shading'}
         footnotes = ['$$ ABS[ (Max-Min) / (Mean of Example Simulation Results)]', ]
         row_headings = list(sensitivity_cases.values())
         column_headings = ['Case']
         for _, json_obj in self.json_data.items():
             column_headings.append(json_obj['identifying_information']['software_name'])
-        for (case_a, case_b) in sensitivity_cases.keys():
-            row = []
-            for tst, json_obj in self.json_data.items():
-                case_a_value = json_obj['conditioned_zone_loads_non_free_float'][case_a]['annual_heating_MWh']
-                case_b_value = json_obj['conditioned_zone_loads_non_free_float'][case_b]['annual_heating_MWh']
-                if math.isnan(case_a_value) or math.isnan(case_b_value):
-                    row.append(math.nan)
-                else:
-                    row.append(float(case_a_value) - float(case_b_value))
-            data_table.append(row)
+        data_table = self._get_result_cube('conditioned_zone_loads_non_free_float').select_deltas(
+            sensitivity_cases.keys(), metrics=['annual_heating_MWh', ])[:, :, 0].T.tolist()
         text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3)
         self._make_markdown_from_table(figure_name, caption, text_table_with_stats, footnotes)
         return
@@ -6766,36 +5418,27 @@ class GraphicsRenderer(Logger):
         figure_name = 'section_7_table_b8_08b'
         caption = 'Table B8-8b. Low Mass In-Depth (Cases 195 thru 320) Sensitivity Tests - Annual Sensible Cooling (MWh)'
         sensitivity_cases = {
-            ('200', '195'): '200-195 Surface Convection',
-            ('210', '200'): '210-200 Ext IR (Int IR "off")',
-            ('220', '215'): '220-215 Ext IR (Int IR "on")',
-            ('215', '200'): '215-200 Int IR (Ext IR "off")',
-            ('220', '210'): '220-210 Int IR (Ext IR "on")',
-            ('230', '220'): '230-220 Infiltration',
-            ('240', '220'): '240-220 Internal Gains',
-            ('250', '220'): '250-220 Ext Solar Abs.',
-            ('270', '220'): '270-220 South Windows',
-            ('280', '270'): '280-270 Cavity Albedo',
-            ('320', '270'): '320-270 Thermostat',
-            ('290', '270'): '290-270 South Shading',
-            ('300', '270'): '300-270 E&W Windows',
-            ('310', '300'): '310-300 E&W Shading'}
-        data_table = []
+            '200-195': '200-195 Surface Convection',
+            '210-200': '210-200 Ext IR (Int IR "off")',
+            '220-215': '220-215 Ext IR (Int IR "on")',
+            '215-200': '215-200 Int IR (Ext IR "off")',
+            '220-210': '220-210 Int IR (Ext IR "on")',
+            '230-220': '230-220 Infiltration',
+            '240-220': '240-220 Internal Gains',
+            '250-220': '250-220 Ext Solar Abs.',
+            '270-220': '270-220 South Windows',
+            '280-270': '280-270 Cavity Albedo',
+            '320-270': '320-270 Thermostat',
+            '290-270': '290-270 South Shading',
+            '300-270': '300-270 E&W Windows',
+            '310-300': '310-300 E&W Shading'}
         footnotes = ['$$ ABS[ (Max-Min) / (Mean of Example Simulation Results)]', ]
         row_headings = list(sensitivity_cases.values())
         column_headings = ['Case']
         for _, json_obj in self.json_data.items():
             column_headings.append(json_obj['identifying_information']['software_name'])
-        for (case_a, case_b) in sensitivity_cases.keys():
-            row = []
-            for tst, json_obj in self.json_data.items():
-                case_a_value = json_obj['conditioned_zone_loads_non_free_float'][case_a]['annual_cooling_MWh']
-                case_b_value = json_obj['conditioned_zone_loads_non_free_float'][case_b]['annual_cooling_MWh']
-                if math.isnan(case_a_value) or math.isnan(case_b_value):
-                    row.append(math.nan)
-                else:
-                    row.append(float(case_a_value) - float(case_b_value))
-            data_table.append(row)
+        data_table = self._get_result_cube('conditioned_zone_loads_non_free_float').select_deltas(
+            sensitivity_cases.keys(), metrics=['annual_cooling_MWh', ])[:, :, 0].T.tolist()
         text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3)
         self._make_markdown_from_table(figure_name, caption, text_table_with_stats, footnotes)
         return
@@ -6804,36 +5447,27 @@ class GraphicsRenderer(Logger):
         figure_name = 'section_7_table_b8_08c'
         caption = 'Table B8-8c. Low Mass In-Depth (Cases 195 thru 320) Sensitivity Tests - Peak Heating (kW)'
         sensitivity_cases = {
-            ('200', '195'): '200-195 Surface Convection',
-            ('210', '200'): '210-200 Ext IR (Int IR "off")',
-            ('220', '215'): '220-215 Ext IR (Int IR "on")',
-            ('215', '200'): '215-200 Int IR (Ext IR "off")',
-            ('220', '210'): '220-210 Int IR (Ext IR "on")',
-            ('230', '220'): '230-220 Infiltration',
-            ('240', '220'): '240-220 Internal Gains',
-            ('250', '220'): '250-220 Ext Solar Abs.',
-            ('270', '220'): '270-220 South Windows',
-            ('280', '270'): '280-270 Cavity Albedo',
-            ('320', '270'): '320-270 Thermostat',
-            ('290', '270'): '290-270 South Shading',
-            ('300', '270'): '300-270 E&W Windows',
-            ('310', '300'): '310-300 E&W Shading'}
-        data_table = []
+            '200-195': '200-195 Surface Convection',
+            '210-200': '210-200 Ext IR (Int IR "off")',
+            '220-215': '220-215 Ext IR (Int IR "on")',
+            '215-200': '215-200 Int IR (Ext IR "off")',
+            '220-210': '220-210 Int IR (Ext IR "on")',
+            '230-220': '230-220 Infiltration',
+            '240-220': '240-220 Internal Gains',
+            '250-220': '250-220 Ext Solar Abs.',
+            '270-220': '270-220 South Windows',
+            '280-270': '280-270 Cavity Albedo',
+            '320-270': '320-270 Thermostat',
+            '290-270': '290-270 South Shading',
+            '300-270': '300-270 E&W Windows',
+            '310-300': '310-300 E&W Shading'}
         footnotes = ['$$ ABS[ (Max-Min) / (Mean of Example Simulation Results)]', ]
         row_headings = list(sensitivity_cases.values())
         column_headings = ['Case']
         for _, json_obj in self.json_data.items():
             column_headings.append(json_obj['identifying_information']['software_name'])
-        for (case_a, case_b) in sensitivity_cases.keys():
-            row = []
-            for tst, json_obj in self.json_data.items():
-                case_a_value = json_obj['conditioned_zone_loads_non_free_float'][case_a]['peak_heating_kW']
-                case_b_value = json_obj['conditioned_zone_loads_non_free_float'][case_b]['peak_heating_kW']
-                if math.isnan(case_a_value) or math.isnan(case_b_value):
-                    row.append(math.nan)
-                else:
-                    row.append(float(case_a_value) - float(case_b_value))
-            data_table.append(row)
+        data_table = self._get_result_cube('conditioned_zone_loads_non_free_float').select_deltas(
+            sensitivity_cases.keys(), metrics=['peak_heating_kW', ])[:, :, 0].T.tolist()
         text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3)
         self._make_markdown_from_table(figure_name, caption, text_table_with_stats, footnotes)
         return
@@ -6842,36 +5476,27 @@ class GraphicsRenderer(Logger):
         figure_name = 'section_7_table_b8_08d'
         caption = 'Table B8-8d. Low Mass In-Depth (Cases 195 thru 320) Sensitivity Tests - Peak Sensible Cooling (kW)'
         sensitivity_cases = {
-            ('200', '195'): '200-195 Surface Convection',
-            ('210', '200'): '210-200 Ext IR (Int IR "off")',
-            ('220', '215'): '220-215 Ext IR (Int IR "on")',
-            ('215', '200'): '215-200 Int IR (Ext IR "off")',
-            ('220', '210'): '220-210 Int IR (Ext IR "on")',
-            ('230', '220'): '230-220 Infiltration',
-            ('240', '220'): '240-220 Internal Gains',
-            ('250', '220'): '250-220 Ext Solar Abs.',
-            ('270', '220'): '270-220 South Windows',
-            ('280', '270'): '280-270 Cavity Albedo',
-            ('320', '270'): '320-270 Thermostat',
-            ('290', '270'): '290-270 South Shading',
-            ('300', '270'): '300-270 E&W Windows',
-            ('310', '300'): '310-300 E&W Shading'}
-        data_table = []
+            '200-195': '200-195 Surface Convection',
+            '210-200': '210-200 Ext IR (Int IR "off")',
+            '220-215': '220-215 Ext IR (Int IR "on")',
+            '215-200': '215-200 Int IR (Ext IR "off")',
+            '220-210': '220-210 Int IR (Ext IR "on")',
+            '230-220': '230-220 Infiltration',
+            '240-220': '240-220 Internal Gains',
+            '250-220': '250-220 Ext Solar Abs.',
+            '270-220': '270-220 South Windows',
+            '280-270': '280-270 Cavity Albedo',
+            '320-270': '320-270 Thermostat',
+            '290-270': '290-270 South Shading',
+            '300-270': '300-270 E&W Windows',
+            '310-300': '310-300 E&W Shading'}
         footnotes = ['$$ ABS[ (Max-Min) / (Mean of Example Simulation Results)]', ]
         row_headings = list(sensitivity_cases.values())
         column_headings = ['Case']
         for _, json_obj in self.json_data.items():
             column_headings.append(json_obj['identifying_information']['software_name'])
-        for (case_a, case_b) in sensitivity_cases.keys():
-            row = []
-            for tst, json_obj in self.json_data.items():
-                case_a_value = json_obj['conditioned_zone_loads_non_free_float'][case_a]['peak_cooling_kW']
-                case_b_value = json_obj['conditioned_zone_loads_non_free_float'][case_b]['peak_cooling_kW']
-                if math.isnan(case_a_value) or math.isnan(case_b_value):
-                    row.append(math.nan)
-                else:
-                    row.append(float(case_a_value) - float(case_b_value))
-            data_table.append(row)
+        data_table = self._get_result_cube('conditioned_zone_loads_non_free_float').select_deltas(
+            sensitivity_cases.keys(), metrics=['peak_cooling_kW', ])[:, :, 0].T.tolist()
         text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3)
         self._make_markdown_from_table(figure_name, caption, text_table_with_stats, footnotes)
         return
@@ -6880,33 +5505,24 @@ class GraphicsRenderer(Logger):
         figure_name = 'section_7_table_b8_09a'
         caption = 'Table B8-9a. Low Mass In-Depth (Cases 395 thru 440) sensitivity Tests - Annual Heating (MWh)'
         sensitivity_cases = {
-            ('400', '395'): '400-395 Surf. Conv. & IR',
-            ('410', '400'): '410-400 Infiltration',
-            ('420', '410'): '420-410 Internal Gains',
-            ('430', '420'): '430-420 Ext Solar Abs.',
-            ('600', '430'): '600-430 South Windows',
-            ('440', '600'): '440-600 Cavity Albedo',
-            ('450', '600'): '450-600 Const Int&Ext Surf Coefs',
-            ('460', '600'): '460-600 Const Int Surf Coefs',
-            ('460', '450'): '460-450 Auto Ext Surf Heat Transf',
-            ('470', '600'): '470-600 Const Ext Surf Coefs',
-            ('470', '450'): '470-450 Auto Int Surf Heat Transf'}
-        data_table = []
+            '400-395': '400-395 Surf. Conv. & IR',
+            '410-400': '410-400 Infiltration',
+            '420-410': '420-410 Internal Gains',
+            '430-420': '430-420 Ext Solar Abs.',
+            '600-430': '600-430 South Windows',
+            '440-600': '440-600 Cavity Albedo',
+            '450-600': '450-600 Const Int&Ext Surf Coefs',
+            '460-600': '460-600 Const Int Surf Coefs',
+            '460-450': '460-450 Auto Ext Surf Heat Transf',
+            '470-600': '470-600 Const Ext Surf Coefs',
+            '470-450': '470-450 Auto Int Surf Heat Transf'}
         footnotes = ['$$ ABS[ (Max-Min) / (Mean of Example Simulation Results)]', ]
         row_headings = list(sensitivity_cases.values())
         column_headings = ['Case']
         for _, json_obj in self.json_data.items():
             column_headings.append(json_obj['identifying_information']['software_name'])
-        for (case_a, case_b) in sensitivity_cases.keys():
-            row = []
-            for tst, json_obj in self.json_data.items():
-                case_a_value = json_obj['conditioned_zone_loads_non_free_float'][case_a]['annual_heating_MWh']
-                case_b_value = json_obj['conditioned_zone_loads_non_free_float'][case_b]['annual_heating_MWh']
-                if math.isnan(case_a_value) or math.isnan(case_b_value):
-                    row.append(math.nan)
-                else:
-                    row.append(float(case_a_value) - float(case_b_value))
-            data_table.append(row)
+        data_table = self._get_result_cube('conditioned_zone_loads_non_free_float').select_deltas(
+            sensitivity_cases.keys(), metrics=['annual_heating_MWh', ])[:, :, 0].T.tolist()
         text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3)
         self._make_markdown_from_table(figure_name, caption, text_table_with_stats, footnotes)
         return
@@ -6915,33 +5531,24 @@ class GraphicsRenderer(Logger):
         figure_name = 'section_7_table_b8_09b'
         caption = 'Table B8-9b. Low Mass In-Depth (Cases 395 thru 440) Sensitivity Tests - Annual Sensible Cooling (MWh)'
         sensitivity_cases = {
-            ('400', '395'): '400-395 Surf. Conv. & IR',
-            ('410', '400'): '410-400 Infiltration',
-            ('420', '410'): '420-410 Internal Gains',
-            ('430', '420'): '430-420 Ext Solar Abs.',
-            ('600', '430'): '600-430 South Windows',
-            ('440', '600'): '440-600 Cavity Albedo',
-            ('450', '600'): '450-600 Const Int&Ext Surf Coefs',
-            ('460', '600'): '460-600 Const Int Surf Coefs',
-            ('460', '450'): '460-450 Auto Ext Surf Heat Transf',
-            ('470', '600'): '470-600 Const Ext Surf Coefs',
-            ('470', '450'): '470-450 Auto Int Surf Heat Transf'}
-        data_table = []
+            '400-395': '400-395 Surf. Conv. & IR',
+            '410-400': '410-400 Infiltration',
+            '420-410': '420-410 Internal Gains',
+            '430-420': '430-420 Ext Solar Abs.',
+            '600-430': '600-430 South Windows',
+            '440-600': '440-600 Cavity Albedo',
+            '450-600': '450-600 Const Int&Ext Surf Coefs',
+            '460-600': '460-600 Const Int Surf Coefs',
+            '460-450': '460-450 Auto Ext Surf Heat Transf',
+            '470-600': '470-600 Const Ext Surf Coefs',
+            '470-450': '470-450 Auto Int Surf Heat Transf'}
         footnotes = ['$$ ABS[ (Max-Min) / (Mean of Example Simulation Results)]', ]
         row_headings = list(sensitivity_cases.values())
         column_headings = ['Case']
         for _, json_obj in self.json_data.items():
             column_headings.append(json_obj['identifying_information']['software_name'])
-        for (case_a, case_b) in sensitivity_cases.keys():
-            row = []
-            for tst, json_obj in self.json_data.items():
-                case_a_value = json_obj['conditioned_zone_loads_non_free_float'][case_a]['annual_cooling_MWh']
-                case_b_value = json_obj['conditioned_zone_loads_non_free_float'][case_b]['annual_cooling_MWh']
-                if math.isnan(case_a_value) or math.isnan(case_b_value):
-                    row.append(math.nan)
-                else:
-                    row.append(float(case_a_value) - float(case_b_value))
-            data_table.append(row)
+        data_table = self._get_result_cube('conditioned_zone_loads_non_free_float').select_deltas(
+            sensitivity_cases.keys(), metrics=['annual_cooling_MWh', ])[:, :, 0].T.tolist()
         text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3)
         self._make_markdown_from_table(figure_name, caption, text_table_with_stats, footnotes)
         return
@@ -6950,33 +5557,24 @@ class GraphicsRenderer(Logger):
         figure_name = 'section_7_table_b8_09c'
         caption = 'Table B8-9c. Low Mass In-Depth (Cases 395 thru 440) Sensitivity Tests - Peak Heating (kW)'
         sensitivity_cases = {
-            ('400', '395'): '400-395 Surf. Conv. & IR',
-            ('410', '400'): '410-400 Infiltration',
-            ('420', '410'): '420-410 Internal Gains',
-            ('430', '420'): '430-420 Ext Solar Abs.',
-            ('600', '430'): '600-430 South Windows',
-            ('440', '600'): '440-600 Cavity Albedo',
-            ('450', '600'): '450-600 Const Int&Ext Surf Coefs',
-            ('460', '600'): '460-600 Const Int Surf Coefs',
-            ('460', '450'): '460-450 Auto Ext Surf Heat Transf',
-            ('470', '600'): '470-600 Const Ext Surf Coefs',
-            ('470', '450'): '470-450 Auto Int Surf Heat Transf'}
-        data_table = []
+            '400-395': '400-395 Surf. Conv. & IR',
+            '410-400': '410-400 Infiltration',
+            '420-410': '420-410 Internal Gains',
+            '430-420': '430-420 Ext Solar Abs.',
+            '600-430': '600-430 South Windows',
+            '440-600': '440-600 Cavity Albedo',
+            '450-600': '450-600 Const Int&Ext Surf Coefs',
+            '460-600': '460-600 Const Int Surf Coefs',
+            '460-450': '460-450 Auto Ext Surf Heat Transf',
+            '470-600': '470-600 Const Ext Surf Coefs',
+            '470-450': '470-450 Auto Int Surf Heat Transf'}
         footnotes = ['$$ ABS[ (Max-Min) / (Mean of Example Simulation Results)]', ]
         row_headings = list(sensitivity_cases.values())
         column_headings = ['Case']
         for _, json_obj in self.json_data.items():
             column_headings.append(json_obj['identifying_information']['software_name'])
-        for (case_a, case_b) in sensitivity_cases.keys():
-            row = []
-            for tst, json_obj in self.json_data.items():
-                case_a_value = json_obj['conditioned_zone_loads_non_free_float'][case_a]['peak_heating_kW']
-                case_b_value = json_obj['conditioned_zone_loads_non_free_float'][case_b]['peak_heating_kW']
-                if math.isnan(case_a_value) or math.isnan(case_b_value):
-                    row.append(math.nan)
-                else:
-                    row.append(float(case_a_value) - float(case_b_value))
-            data_table.append(row)
+        data_table = self._get_result_cube('conditioned_zone_loads_non_free_float').select_deltas(
+            sensitivity_cases.keys(), metrics=['peak_heating_kW', ])[:, :, 0].T.tolist()
         text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3)
         self._make_markdown_from_table(figure_name, caption, text_table_with_stats, footnotes)
         return
@@ -6985,33 +5583,24 @@ class GraphicsRenderer(Logger):
         figure_name = 'section_7_table_b8_09d'
         caption = 'Table B8-9d. Low Mass In-Depth (Cases 395 thru 440) Sensitivity Tests - Peak Sensible Cooling (kW)'
         sensitivity_cases = {
-            ('400', '395'): '400-395 Surf. Conv. & IR',
-            ('410', '400'): '410-400 Infiltration',
-            ('420', '410'): '420-410 Internal Gains',
-            ('430', '420'): '430-420 Ext Solar Abs.',
-            ('600', '430'): '600-430 South Windows',
-            ('440', '600'): '440-600 Cavity Albedo',
-            ('450', '600'): '450-600 Const Int&Ext Surf Coefs',
-            ('460', '600'): '460-600 Const Int Surf Coefs',
-            ('460', '450'): '460-450 Auto Ext Surf Heat Transf',
-            ('470', '600'): '470-600 Const Ext Surf Coefs',
-            ('470', '450'): '470-450 Auto Int Surf Heat Transf'}
-        data_table = []
+            '400-395': '400-395 Surf. Conv. & IR',
+            '410-400': '410-400 Infiltration',
+            '420-410': '420-410 Internal Gains',
+            '430-420': '430-420 Ext Solar Abs.',
+            '600-430': '600-430 South Windows',
+            '440-600': '440-600 Cavity Albedo',
+            '450-600': '450-600 Const Int&Ext Surf Coefs',
+            '460-600': '460-600 Const Int Surf Coefs',
+            '460-450': '460-450 Auto Ext Surf Heat Transf',
+            '470-600': '470-600 Const Ext Surf Coefs',
+            '470-450': '470-450 Auto Int Surf Heat Transf'}
         footnotes = ['$$ ABS[ (Max-Min) / (Mean of Example Simulation Results)]', ]
         row_headings = list(sensitivity_cases.values())
         column_headings = ['Case']
         for _, json_obj in self.json_data.items():
             column_headings.append(json_obj['identifying_information']['software_name'])
-        for (case_a, case_b) in sensitivity_cases.keys():
-            row = []
-            for tst, json_obj in self.json_data.items():
-                case_a_value = json_obj['conditioned_zone_loads_non_free_float'][case_a]['peak_cooling_kW']
-                case_b_value = json_obj['conditioned_zone_loads_non_free_float'][case_b]['peak_cooling_kW']
-                if math.isnan(case_a_value) or math.isnan(case_b_value):
-                    row.append(math.nan)
-                else:
-                    row.append(float(case_a_value) - float(case_b_value))
-            data_table.append(row)
+        data_table = self._get_result_cube('conditioned_zone_loads_non_free_float').select_deltas(
+            sensitivity_cases.keys(), metrics=['peak_cooling_kW', ])[:, :, 0].T.tolist()
         text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3)
         self._make_markdown_from_table(figure_name, caption, text_table_with_stats, footnotes)
         return
@@ -7020,32 +5609,23 @@ class GraphicsRenderer(Logger):
         figure_name = 'section_7_table_b8_10a'
         caption = 'Table B8-10a. High Mass Basic and In-Depth Sensitivity Tests - Annual Heating (MWh)'
         sensitivity_cases = {
-            ('800', '430'): '800-430 Mass, w/ High Cond. Wall',
-            ('900', '800'): '900-800 Himass, S. Win.',
-            ('900', '810'): '900-810 Himass, Int. Solar Abs.',
-            ('910', '610'): '910-610 Mass, w/ S. Shade',
-            ('920', '620'): '920-620 Mass, w/ E&W Win.',
-            ('930', '630'): '930-630 Mass, w/ E&W Shade',
-            ('940', '640'): '940-640 Mass, w/ Htg. Setback',
-            ('980', '680'): '980-680 Mass, w/ Insulation 20/27',
-            ('985', '685'): '985-685 Mass, w/ 20/20 Tstat',
-            ('995', '695'): '995-695 Mass, w/ Insulation 20/20'}
-        data_table = []
+            '800-430': '800-430 Mass, w/ High Cond. Wall',
+            '900-800': '900-800 Himass, S. Win.',
+            '900-810': '900-810 Himass, Int. Solar Abs.',
+            '910-610': '910-610 Mass, w/ S. Shade',
+            '920-620': '920-620 Mass, w/ E&W Win.',
+            '930-630': '930-630 Mass, w/ E&W Shade',
+            '940-640': '940-640 Mass, w/ Htg. Setback',
+            '980-680': '980-680 Mass, w/ Insulation 20/27',
+            '985-685': '985-685 Mass, w/ 20/20 Tstat',
+            '995-695': '995-695 Mass, w/ Insulation 20/20'}
         footnotes = ['$$ ABS[ (Max-Min) / (Mean of Example Simulation Results)]', ]
         row_headings = list(sensitivity_cases.values())
         column_headings = ['Case']
         for _, json_obj in self.json_data.items():
             column_headings.append(json_obj['identifying_information']['software_name'])
-        for (case_a, case_b) in sensitivity_cases.keys():
-            row = []
-            for tst, json_obj in self.json_data.items():
-                case_a_value = json_obj['conditioned_zone_loads_non_free_float'][case_a]['annual_heating_MWh']
-                case_b_value = json_obj['conditioned_zone_loads_non_free_float'][case_b]['annual_heating_MWh']
-                if math.isnan(case_a_value) or math.isnan(case_b_value):
-                    row.append(math.nan)
-                else:
-                    row.append(float(case_a_value) - float(case_b_value))
-            data_table.append(row)
+        data_table = self._get_result_cube('conditioned_zone_loads_non_free_float').select_deltas(
+            sensitivity_cases.keys(), metrics=['annual_heating_MWh', ])[:, :, 0].T.tolist()
         text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3)
         self._make_markdown_from_table(figure_name, caption, text_table_with_stats, footnotes)
         return
@@ -7054,33 +5634,24 @@ class GraphicsRenderer(Logger):
         figure_name = 'section_7_table_b8_10b'
         caption = 'Table B8-10b. High Mass Basic and In-Depth Sensitivity Tests - Annual Sensible Cooling (MWh)'
         sensitivity_cases = {
-            ('800', '430'): '800-430 Mass, w/ High Cond. Wall',
-            ('900', '800'): '900-800 Himass, S. Win.',
-            ('900', '810'): '900-810 Himass, Int. Solar Abs.',
-            ('910', '610'): '910-610 Mass, w/ S. Shade',
-            ('920', '620'): '920-620 Mass, w/ E&W Win.',
-            ('930', '630'): '930-630 Mass, w/ E&W Shade',
-            ('940', '640'): '940-640 Mass, w/ Htg. Setback',
-            ('950', '650'): '940-640 Mass, w/ Night Vent',
-            ('980', '680'): '980-680 Mass, w/ Insulation 20/27',
-            ('985', '685'): '985-685 Mass, w/ 20/20 Tstat',
-            ('995', '695'): '995-695 Mass, w/ Insulation 20/20'}
-        data_table = []
+            '800-430': '800-430 Mass, w/ High Cond. Wall',
+            '900-800': '900-800 Himass, S. Win.',
+            '900-810': '900-810 Himass, Int. Solar Abs.',
+            '910-610': '910-610 Mass, w/ S. Shade',
+            '920-620': '920-620 Mass, w/ E&W Win.',
+            '930-630': '930-630 Mass, w/ E&W Shade',
+            '940-640': '940-640 Mass, w/ Htg. Setback',
+            '950-650': '940-640 Mass, w/ Night Vent',
+            '980-680': '980-680 Mass, w/ Insulation 20/27',
+            '985-685': '985-685 Mass, w/ 20/20 Tstat',
+            '995-695': '995-695 Mass, w/ Insulation 20/20'}
         footnotes = ['$$ ABS[ (Max-Min) / (Mean of Example Simulation Results)]', ]
         row_headings = list(sensitivity_cases.values())
         column_headings = ['Case']
         for _, json_obj in self.json_data.items():
             column_headings.append(json_obj['identifying_information']['software_name'])
-        for (case_a, case_b) in sensitivity_cases.keys():
-            row = []
-            for tst, json_obj in self.json_data.items():
-                case_a_value = json_obj['conditioned_zone_loads_non_free_float'][case_a]['annual_cooling_MWh']
-                case_b_value = json_obj['conditioned_zone_loads_non_free_float'][case_b]['annual_cooling_MWh']
-                if math.isnan(case_a_value) or math.isnan(case_b_value):
-                    row.append(math.nan)
-                else:
-                    row.append(float(case_a_value) - float(case_b_value))
-            data_table.append(row)
+        data_table = self._get_result_cube('conditioned_zone_loads_non_free_float').select_deltas(
+            sensitivity_cases.keys(), metrics=['annual_cooling_MWh', ])[:, :, 0].T.tolist()
         text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3)
         self._make_markdown_from_table(figure_name, caption, text_table_with_stats, footnotes)
         return
@@ -7089,32 +5660,23 @@ class GraphicsRenderer(Logger):
         figure_name = 'section_7_table_b8_10c'
         caption = 'Table B8-10c. High Mass Basic and In-Depth Sensitivity Tests - Peak Heating (kW)'
         sensitivity_cases = {
-            ('800', '430'): '800-430 Mass, w/ High Cond. Wall',
-            ('900', '800'): '900-800 Himass, S. Win.',
-            ('900', '810'): '900-810 Himass, Int. Solar Abs.',
-            ('910', '610'): '910-610 Mass, w/ S. Shade',
-            ('920', '620'): '920-620 Mass, w/ E&W Win.',
-            ('930', '630'): '930-630 Mass, w/ E&W Shade',
-            ('940', '640'): '940-640 Mass, w/ Htg. Setback',
-            ('980', '680'): '980-680 Mass, w/ Insulation 20/27',
-            ('985', '685'): '985-685 Mass, w/ 20/20 Tstat',
-            ('995', '695'): '995-695 Mass, w/ Insulation 20/20'}
-        data_table = []
+            '800-430': '800-430 Mass, w/ High Cond. Wall',
+            '900-800': '900-800 Himass, S. Win.',
+            '900-810': '900-810 Himass, Int. Solar Abs.',
+            '910-610': '910-610 Mass, w/ S. Shade',
+            '920-620': '920-620 Mass, w/ E&W Win.',
+            '930-630': '930-630 Mass, w/ E&W Shade',
+            '940-640': '940-640 Mass, w/ Htg. Setback',
+            '980-680': '980-680 Mass, w/ Insulation 20/27',
+            '985-685': '985-685 Mass, w/ 20/20 Tstat',
+            '995-695': '995-695 Mass, w/ Insulation 20/20'}
         footnotes = ['$$ ABS[ (Max-Min) / (Mean of Example Simulation Results)]', ]
         row_headings = list(sensitivity_cases.values())
         column_headings = ['Case']
         for _, json_obj in self.json_data.items():
             column_headings.append(json_obj['identifying_information']['software_name'])
-        for (case_a, case_b) in sensitivity_cases.keys():
-            row = []
-            for tst, json_obj in self.json_data.items():
-                case_a_value = json_obj['conditioned_zone_loads_non_free_float'][case_a]['peak_heating_kW']
-                case_b_value = json_obj['conditioned_zone_loads_non_free_float'][case_b]['peak_heating_kW']
-                if math.isnan(case_a_value) or math.isnan(case_b_value):
-                    row.append(math.nan)
-                else:
-                    row.append(float(case_a_value) - float(case_b_value))
-            data_table.append(row)
+        data_table = self._get_result_cube('conditioned_zone_loads_non_free_float').select_deltas(
+            sensitivity_cases.keys(), metrics=['peak_heating_kW', ])[:, :, 0].T.tolist()
         text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3)
         self._make_markdown_from_table(figure_name, caption, text_table_with_stats, footnotes)
         return
@@ -7123,33 +5685,24 @@ class GraphicsRenderer(Logger):
         figure_name = 'section_7_table_b8_10d'
         caption = 'Table B8-10d. High Mass Basic and In-Depth Sensitivity Tests - Peak Sensible Cooling (kW)'
         sensitivity_cases = {
-            ('800', '430'): '800-430 Mass, w/ High Cond. Wall',
-            ('900', '800'): '900-800 Himass, S. Win.',
-            ('900', '810'): '900-810 Himass, Int. Solar Abs.',
-            ('910', '610'): '910-610 Mass, w/ S. Shade',
-            ('920', '620'): '920-620 Mass, w/ E&W Win.',
-            ('930', '630'): '930-630 Mass, w/ E&W Shade',
-            ('940', '640'): '940-640 Mass, w/ Htg. Setback',
-            ('950', '650'): '940-640 Mass, w/ Night Vent',
-            ('980', '680'): '980-680 Mass, w/ Insulation 20/27',
-            ('985', '685'): '985-685 Mass, w/ 20/20 Tstat',
-            ('995', '695'): '995-695 Mass, w/ Insulation 20/20'}
-        data_table = []
+            '800-430': '800-430 Mass, w/ High Cond. Wall',
+            '900-800': '900-800 Himass, S. Win.',
+            '900-810': '900-810 Himass, Int. Solar Abs.',
+            '910-610': '910-610 Mass, w/ S. Shade',
+            '920-620': '920-620 Mass, w/ E&W Win.',
+            '930-630': '930-630 Mass, w/ E&W Shade',
+            '940-640': '940-640 Mass, w/ Htg. Setback',
+            '950-650': '940-640 Mass, w/ Night Vent',
+            '980-680': '980-680 Mass, w/ Insulation 20/27',
+            '985-685': '985-685 Mass, w/ 20/20 Tstat',
+            '995-695': '995-695 Mass, w/ Insulation 20/20'}
         footnotes = ['$$ ABS[ (Max-Min) / (Mean of Example Simulation Results)]', ]
         row_headings = list(sensitivity_cases.values())
         column_headings = ['Case']
         for _, json_obj in self.json_data.items():
             column_headings.append(json_obj['identifying_information']['software_name'])
-        for (case_a, case_b) in sensitivity_cases.keys():
-            row = []
-            for tst, json_obj in self.json_data.items():
-                case_a_value = json_obj['conditioned_zone_loads_non_free_float'][case_a]['peak_cooling_kW']
-                case_b_value = json_obj['conditioned_zone_loads_non_free_float'][case_b]['peak_cooling_kW']
-                if math.isnan(case_a_value) or math.isnan(case_b_value):
-                    row.append(math.nan)
-                else:
-                    row.append(float(case_a_value) - float(case_b_value))
-            data_table.append(row)
+        data_table = self._get_result_cube('conditioned_zone_loads_non_free_float').select_deltas(
+            sensitivity_cases.keys(), metrics=['peak_cooling_kW', ])[:, :, 0].T.tolist()
         text_table_with_stats = self._add_stats_to_table(row_headings, column_headings, data_table, digits=3)
         self._make_markdown_from_table(figure_name, caption, text_table_with_stats, footnotes)
         return
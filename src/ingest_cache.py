@@ -0,0 +1,107 @@
+import hashlib
+import json
+import os
+import pathlib
+import pickle
+from src import __version__
+
+root_directory = pathlib.Path(__file__).parent.parent.resolve()
+
+# modules and schema files whose source determines how raw workbook rows are read, and how they are cleansed into
+# test_data
+grid_code_files = ['workbook_session.py', ]
+test_data_code_files = [
+    'excel_processor.py', 'data_cleanser.py', 'frame_converter.py', 'validation_schema.py', 'validation_schema.json',
+    'validation_events.py']
+
+
+def _get_code_fingerprint(file_names) -> str:
+    """
+    Hash the source of processing modules so that cached objects are invalidated when the code that made them changes.
+
+    :param file_names: module and schema file names in the src directory
+    :return: hex digest
+    """
+    code_hash = hashlib.sha256(__version__.encode())
+    for file_name in file_names:
+        code_hash.update(pathlib.Path(__file__).parent.joinpath(file_name).read_bytes())
+    return code_hash.hexdigest()
+
+
+class IngestCache:
+    """
+    Content-addressed cache of workbook ingestion results.
+
+    Two objects are stored for each workbook:
+        grid - raw sheet rows from which the data source regions are sliced.  The key is a hash of the workbook
+            bytes, the data_sources layout, and the code version.
+        test_data - extracted and cleansed tables.  The key also includes a fingerprint of the extraction and
+            cleansing code, so that a rule change re-runs the cleansing from the cached raw rows without reading
+            the workbook again.
+
+    :param cache_directory: location of the cache files.  Defaults to .cache/ingest in the root directory.
+    """
+
+    def __init__(self, cache_directory=None):
+        if cache_directory is None:
+            cache_directory = root_directory.joinpath('.cache', 'ingest')
+        self.cache_directory = pathlib.Path(cache_directory)
+        self._test_data_fingerprint = _get_code_fingerprint(test_data_code_files)
+        self._grid_fingerprint = _get_code_fingerprint(grid_code_files)
+        return
+
+    def __repr__(self):
+        rep = 'IngestCache(cache_directory=' + str(self.cache_directory) + ')'
+        return rep
+
+    def get_keys(self, file_location, data_sources) -> dict:
+        """
+        Get the cache keys for a workbook
+
+        :param file_location: location of the workbook
+        :param data_sources: data extraction instructions
+        :return: dictionary of cache keys for the grid and test_data objects
+        """
+        workbook_hash = hashlib.sha256(pathlib.Path(file_location).read_bytes())
+        workbook_hash.update(json.dumps(data_sources, sort_keys=True, default=str).encode())
+        grid_key = hashlib.sha256((workbook_hash.hexdigest() + self._grid_fingerprint).encode()).hexdigest()
+        test_data_key = hashlib.sha256((grid_key + self._test_data_fingerprint).encode()).hexdigest()
+        return {'grid': grid_key, 'test_data': test_data_key}
+
+    def _get_file_location(self, key, object_name) -> pathlib.Path:
+        return self.cache_directory.joinpath(key[:2], '.'.join([key, object_name, 'pickle']))
+
+    def load(self, key, object_name):
+        """
+        Load a cached object
+
+        :param key: cache key
+        :param object_name: name of the cached object (e.g. grid or test_data)
+        :return: cached object, or None if it is not in the cache or cannot be read
+        """
+        file_location = self._get_file_location(key, object_name)
+        if not file_location.is_file():
+            return None
+        try:
+            with open(file_location, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def save(self, key, object_name, obj):
+        """
+        Save an object to the cache.  The file is written to a temporary location and then moved into place so that
+        a concurrent reader never sees a partial file.
+
+        :param key: cache key
+        :param object_name: name of the cached object (e.g. grid or test_data)
+        :param obj: object to store
+        :return: location of the cache file
+        """
+        file_location = self._get_file_location(key, object_name)
+        file_location.parent.mkdir(parents=True, exist_ok=True)
+        temporary_file_location = file_location.with_name('.'.join([file_location.name, str(os.getpid()), 'tmp']))
+        with open(temporary_file_location, 'wb') as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        temporary_file_location.replace(file_location)
+        return file_location
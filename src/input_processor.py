@@ -4,6 +4,7 @@ import json
 from logger import Logger
 from src.descriptors import VerifyInputFile
 from src.excel_processor import ExcelProcessor
+from src.processed_sidecar import read_sidecar, write_sidecar
 from custom_exceptions import ASHRAE140TypeError, ASHRAE140ProcessingError
 
 root_directory = pathlib.Path(__file__).parent.parent.resolve()
@@ -38,18 +39,30 @@ class InputProcessor(Logger):
     def __init__(
             self,
             input_file_location,
+            tables=None,
+            ingest_cache=None,
+            write_sidecar=False,
             logger_level="WARNING",
             logger_name="console_only_logger"):
         """
         :param logger_level: Logging level
         :param logger_name: Specified logger to use
         :param input_file_location: input file to verify and process
+        :param tables: table keys to extract.  All tables are extracted if not provided, otherwise the extracted tables
+            are merged into the existing processed file.
+        :param ingest_cache: IngestCache object used to skip re-parsing input files that have not changed
+        :param write_sidecar: write a compact binary .npz sidecar next to the processed json file
         """
         super().__init__(logger_level=logger_level, logger_name=logger_name)
         self.input_processing_map = {
             'excel': ExcelProcessor}
         self.input_file_location = input_file_location
+        self.tables = tables
+        self.ingest_cache = ingest_cache
+        self.write_sidecar = write_sidecar
         self.processing_pipeline = str(self.input_file_location)
+        # validation failures found while cleansing the input file, set by run()
+        self.validation_events = None
         return
 
     def __repr__(self):
@@ -74,23 +87,44 @@ class InputProcessor(Logger):
                                      .format(self.processing_pipeline))
         # execute pipeline class which will return a cleansed data object
         try:
-            data_object = processor_class(file_location=self.input_file_location)
+            data_object = processor_class(
+                file_location=self.input_file_location,
+                tables=self.tables,
+                ingest_cache=self.ingest_cache)
             data_object.run()
         except ASHRAE140TypeError:
             raise ASHRAE140ProcessingError('Input file processing failed: {}'.format(self.input_file_location))
-        if getattr(data_object, 'test_data'):
-            program_name = self.input_file_location.parts[-3].lower()
-            version = self.input_file_location.parts[-2].lower()
-            section = self.input_file_location.stem.lower()
-            program_directory = root_directory.joinpath(
-                'processed',
-                program_name,
-                version
-            )
-            pathlib.Path(program_directory).mkdir(parents=True, exist_ok=True)
-            output_file_location = root_directory.joinpath(
-                program_directory,
-                '.'.join(['-'.join([section, ]), 'json']))
+        self.validation_events = data_object.validation_events
+        # the report renders the failed rows to text, which is only done when debug logging is enabled
+        if self.validation_events:
+            self.logger.debug('Validation report for %s\n%s', str(self.input_file_location), self.validation_events)
+        if not getattr(data_object, 'test_data'):
+            raise ASHRAE140ProcessingError('No tables were extracted from the input file: {}'.format(
+                self.input_file_location))
+        program_name = self.input_file_location.parts[-3].lower()
+        version = self.input_file_location.parts[-2].lower()
+        section = self.input_file_location.stem.lower()
+        program_directory = root_directory.joinpath(
+            'processed',
+            program_name,
+            version
+        )
+        pathlib.Path(program_directory).mkdir(parents=True, exist_ok=True)
+        output_file_location = root_directory.joinpath(
+            program_directory,
+            '.'.join(['-'.join([section, ]), 'json']))
+        test_data = data_object.test_data
+        # when only some tables were extracted, keep the remaining tables of the existing processed file
+        if self.tables and output_file_location.is_file():
+            with open(output_file_location, 'r') as f:
+                test_data = {**json.load(f), **data_object.test_data}
+        output = json.dumps(test_data, indent=4, sort_keys=True)
+        # leave an unchanged processed file untouched so its modification time is kept
+        if output_file_location.is_file() and output_file_location.read_text() == output:
+            self.logger.info('Processed file is unchanged: %s', str(output_file_location))
+        else:
             with open(output_file_location, 'w') as f:
-                json.dump(data_object.test_data, f, indent=4, sort_keys=True)
+                f.write(output)
+        if self.write_sidecar and read_sidecar(output_file_location, data_keys=[]) is None:
+            write_sidecar(output_file_location)
         return output_file_location
@@ -1,5 +1,9 @@
+import atexit
 import logging
+import logging.handlers
+import multiprocessing.util
 import os
+import queue
 import sys
 from pathlib import Path
 from logging.config import fileConfig
@@ -7,10 +11,130 @@ from io import StringIO
 
 loggers = {}
 stream = StringIO()
+# file handlers of the logging configuration, each written by a QueueListener thread.  The configuration is read once
+# per process.
+queue_listeners = []
+logging_configuration = {}
 
 this_script_path = Path(__file__).resolve()
 
 
+def _start_queue_listeners(file_handlers):
+    """
+    Move file handlers behind queues, so that loggers put records on a queue and a listener thread writes them to
+    disk.
+
+    :param file_handlers: dictionary of file handler to the loggers that use it
+    """
+    for file_handler, file_loggers in file_handlers.items():
+        queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+        queue_handler.setLevel(file_handler.level)
+        for file_logger in file_loggers:
+            file_logger.removeHandler(file_handler)
+            file_logger.addHandler(queue_handler)
+        queue_listener = logging.handlers.QueueListener(queue_handler.queue, file_handler, respect_handler_level=True)
+        queue_listener.start()
+        queue_listeners.append((queue_handler, queue_listener))
+    return
+
+
+def stop_queue_listeners():
+    """
+    Write the queued records and stop the listener threads.  This is run when the process exits.
+    """
+    while queue_listeners:
+        _, queue_listener = queue_listeners.pop()
+        queue_listener.stop()
+    return
+
+
+def _restart_queue_listeners_in_child():
+    """
+    Start new listener threads in a forked worker process, which does not inherit the threads of its parent.  The
+    queues are replaced so that records queued by the parent before the fork are not written twice.
+    """
+    if logging_configuration.get('process_id') in (None, os.getpid()):
+        return
+    for listener_index, (queue_handler, queue_listener) in enumerate(queue_listeners):
+        queue_handler.queue = queue.SimpleQueue()
+        queue_listener = logging.handlers.QueueListener(
+            queue_handler.queue, *queue_listener.handlers, respect_handler_level=True)
+        queue_listener.start()
+        queue_listeners[listener_index] = (queue_handler, queue_listener)
+    logging_configuration['process_id'] = os.getpid()
+    return
+
+
+def _prepare_worker_process(_):
+    """
+    Prepare the queue listeners of a multiprocessing worker process.  Worker processes exit without running atexit
+    functions, so the listeners are stopped by a multiprocessing finalizer instead.
+    """
+    _restart_queue_listeners_in_child()
+    multiprocessing.util.Finalize(None, stop_queue_listeners, exitpriority=10)
+    return
+
+
+def configure_logging(logging_file_name='logging.conf', log_file_name='base'):
+    """
+    Read the logging configuration file once per process.  The log files are created if they do not exist, and the
+    file handlers of the configuration are moved behind queue listeners.  Later calls return without changes.
+
+    :param logging_file_name: logging configuration file in the logs directory
+    :param log_file_name: name of the base log file in the logs directory
+    :return: dictionary of the configuration file and log file locations
+    """
+    if logging_configuration:
+        return logging_configuration
+    # Use a different file for testing logger
+    # When packaged, the logs file is under the src/ directorey, so change the directory based on mode
+    if getattr(sys, 'frozen', False):
+        logging_dir = os.path.join(os.path.dirname(this_script_path), 'logs')
+    else:
+        logging_dir = str(this_script_path.parent.parent / 'logs')
+    log_file_location = os.path.join(
+        logging_dir,
+        r'{}.log'.format(log_file_name)
+    )
+    testing_log_file_location = os.path.join(
+        logging_dir,
+        r'{}.log'.format('test')
+    )
+    for log_file in [log_file_location, testing_log_file_location]:
+        if not os.path.isfile(log_file):  # pragma: no cover
+            with open(log_file, 'w'):
+                pass
+    fileConfig(
+        os.path.join(
+            logging_dir,
+            logging_file_name
+        ),
+        defaults={
+            "base_log_filename": log_file_location,
+            "testing_log_filename": testing_log_file_location
+        }
+    )
+    file_handlers = {}
+    for configured_logger in [logging.root, ] + [
+            i for i in logging.root.manager.loggerDict.values() if isinstance(i, logging.Logger)]:
+        for handler in configured_logger.handlers:
+            if isinstance(handler, logging.FileHandler):
+                file_handlers.setdefault(handler, []).append(configured_logger)
+    _start_queue_listeners(file_handlers)
+    multiprocessing.util.register_after_fork(logging.root, _prepare_worker_process)
+    logging_configuration.update({
+        'process_id': os.getpid(),
+        'logging_file_location': os.path.join(logging_dir, logging_file_name),
+        'log_file_location': log_file_location,
+        'testing_log_file_location': testing_log_file_location})
+    return logging_configuration
+
+
+atexit.register(stop_queue_listeners)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_restart_queue_listeners_in_child)
+
+
 class Logger:
     """
     General logger
@@ -30,35 +154,8 @@ class Logger:
         # global loggers
         # global stream
 
-        # noinspection PyBroadException
-        # Use a different file for testing logger
-        # When packaged, the logs file is under the src/ directorey, so change the directory based on mode
-        if getattr(sys, 'frozen', False):
-            logging_dir = os.path.join(os.path.dirname(this_script_path), 'logs')
-        else:
-            logging_dir = str(this_script_path.parent.parent / 'logs')
-        log_file_location = os.path.join(
-            logging_dir,
-            r'{}.log'.format(log_file_name)
-        )
-        testing_log_file_location = os.path.join(
-            logging_dir,
-            r'{}.log'.format('test')
-        )
-        for log_file in [log_file_location, testing_log_file_location]:
-            if not os.path.isfile(log_file):  # pragma: no cover
-                with open(log_file, 'w'):
-                    pass
-        fileConfig(
-            os.path.join(
-                logging_dir,
-                logging_file_name
-            ),
-            defaults={
-                "base_log_filename": log_file_location,
-                "testing_log_filename": testing_log_file_location
-            }
-        )
+        # the configuration is only read by the first logger of the process
+        configure_logging(logging_file_name=logging_file_name, log_file_name=log_file_name)
         # if the code fails, fall back to root logger
         try:
             # if the logger exists, use it instead of creating a new one
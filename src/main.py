@@ -5,17 +5,42 @@ import os
 import sys
 import pathlib
 import inspect
-import matplotlib.pyplot as plt
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
 
 root_directory = pathlib.Path(__file__).parent.parent.resolve()
 
 if str(root_directory) not in sys.path:
     sys.path.append(str(root_directory))
 
-# imports below the system path append operation above are necessary for github workflow
-from input_processor import InputProcessor  # noqa: E402
-from graphics_renderer import GraphicsRenderer  # noqa: E402
-from custom_exceptions import ASHRAE140TypeError  # noqa: E402
+# imports below the system path append operation above are necessary for github workflow.  Modules that import
+# pandas, numpy, or matplotlib are imported by the pipeline stages that use them, so that the command line starts
+# without them, e.g. for --version.
+from ingest_cache import IngestCache  # noqa: E402
+from render_dependencies import get_data_keys  # noqa: E402
+from processed_catalog import ProcessedCatalog, get_file_identity  # noqa: E402
+from change_planner import get_changed_files, plan_render_jobs  # noqa: E402
+from logger import Logger  # noqa: E402
+from custom_exceptions import ASHRAE140TypeError, ASHRAE140ProcessingError, ASHRAE140FileNotFoundError  # noqa: E402
+
+
+def load_renderer():
+    """
+    Import the rendering stage.  matplotlib is set to the non-interactive Agg backend, unless a backend is set with
+    the MPLBACKEND environment variable, and its font cache is loaded before the renderer module so that the first
+    rendering function does not pay for it.
+
+    :return: GraphicsRenderer class
+    """
+    if 'graphics_renderer' not in sys.modules:
+        import matplotlib
+        if not os.environ.get('MPLBACKEND'):
+            matplotlib.use('Agg')
+        # importing the font manager loads the font cache, or builds it on the first run after an install
+        import matplotlib.font_manager  # noqa: F401
+    from graphics_renderer import GraphicsRenderer
+    return GraphicsRenderer
 
 
 def get_property(prop):
@@ -64,6 +89,46 @@ def build_parser():  # pragma: no cover
         '-rg',
         nargs='+',
         help='Graphic name to render.')
+    parser.add_argument(
+        '--tables',
+        '-t',
+        nargs='+',
+        help='Table name to extract from input files.  Other tables in an existing processed file are kept.')
+    parser.add_argument(
+        '--no_cache',
+        '-nc',
+        action='store_true',
+        help='Re-parse input files instead of using the ingest cache, and re-render every graphic instead of only '
+             'those whose data or code changed.')
+    parser.add_argument(
+        '--jobs',
+        '-j',
+        type=int,
+        default=1,
+        help='Number of processes used to ingest input files and render graphics.')
+    parser.add_argument(
+        '--sidecar',
+        '-sc',
+        action='store_true',
+        help='Write a compact binary .npz sidecar next to each processed file, which is loaded instead of the json '
+             'file when rendering.')
+    parser.add_argument(
+        '--results_store',
+        '-rs',
+        action='store_true',
+        help='Add processed files to the SQLite results store in .cache/results.sqlite, and query the rendered '
+             'results from it.')
+    parser.add_argument(
+        '--changed_since',
+        '-cs',
+        help='Git reference (e.g. origin/main).  Input and processed files changed since the reference are found '
+             'with git, and only the ingestion and renders they affect are run, in one process.')
+    parser.add_argument(
+        '--screen',
+        '-s',
+        action='store_true',
+        help='Compare each table cell of the processed files with the range of the reference programs, and write a '
+             'json and markdown summary instead of rendering graphics.')
     parser.add_argument(
         "--files",
         '-f',
@@ -72,44 +137,383 @@ def build_parser():  # pragma: no cover
     return parser
 
 
-def create_images(input_file, args, logger_name):
+def process_input_file(input_file, logger_level, logger_name, tables=None, ingest_cache=None, write_sidecar=False):
+    """
+    Process a single input file into a processed JSON file.  Errors are contained to the file so that one bad
+    input does not stop a batch.
+
+    :param input_file: input file path
+    :param logger_level: Logging level
+    :param logger_name: Specified logger to use
+    :param tables: table keys to extract
+    :param ingest_cache: IngestCache object
+    :param write_sidecar: write a binary sidecar next to the processed file
+    :return: processed file path, or None if the file failed to process
+    """
+    from input_processor import InputProcessor
+    try:
+        ip = InputProcessor(
+            logger_level=logger_level,
+            logger_name=logger_name,
+            input_file_location=str(input_file),
+            tables=tables,
+            ingest_cache=ingest_cache,
+            write_sidecar=write_sidecar)
+        try:
+            if ip.input_file_location:
+                ip.logger.info('Processing file: {}'.format(ip.input_file_location))
+                return ip.run()
+        except (ASHRAE140TypeError, ASHRAE140ProcessingError):
+            ip.logger.error('Failed to process file: {}'.format(str(input_file)))
+    except (ASHRAE140TypeError, ASHRAE140FileNotFoundError):
+        print('failed to process file: {}'.format(str(input_file)))
+    return None
+
+
+def process_input_files(input_files, args, logger_name, ingest_cache=None, results_store=None, catalog=None):
+    """
+    Process a batch of input files.  When the 'jobs' option is greater than one, the files are distributed to a
+    process pool.  The output file paths are returned in the same order as the input files.
+
+    :param input_files: list of input file paths
+    :param args: parsed command line arguments
+    :param logger_name: Specified logger to use
+    :param ingest_cache: IngestCache object
+    :param results_store: ResultsStore object to which the processed files are added
+    :param catalog: ProcessedCatalog object to which the processed files are added
+    :return: batch summary dictionary of input files, output files (None for failures), and failed files
+    """
+    jobs = getattr(args, 'jobs', None) or 1
+    process_kwargs = {
+        'logger_level': args.logger_level,
+        'logger_name': logger_name,
+        'tables': getattr(args, 'tables', None),
+        'ingest_cache': ingest_cache,
+        'write_sidecar': getattr(args, 'sidecar', False)}
+    start_time = time.perf_counter()
+    if jobs > 1 and len(input_files) > 1:
+        output_files = []
+        with ProcessPoolExecutor(max_workers=min(jobs, len(input_files))) as executor:
+            futures = [executor.submit(process_input_file, input_file, **process_kwargs) for input_file in input_files]
+            for input_file, future in zip(input_files, futures):
+                try:
+                    output_files.append(future.result())
+                except Exception as e:
+                    Logger(logger_level=args.logger_level, logger_name=logger_name).logger.error(
+                        'Failed to process file: %s, error message: %s', str(input_file), str(e))
+                    output_files.append(None)
+    else:
+        output_files = [process_input_file(input_file, **process_kwargs) for input_file in input_files]
+    # the store and catalog are written from this process only, after the pool has finished
+    if results_store:
+        results_store.update_files([i for i in output_files if i])
+    if catalog:
+        catalog.update_files([i for i in output_files if i])
+    batch_summary = {
+        'input_files': input_files,
+        'output_files': output_files,
+        'failed_files': [i for i, j in zip(input_files, output_files) if j is None],
+        'jobs': jobs,
+        'elapsed_seconds': time.perf_counter() - start_time}
+    if input_files:
+        Logger(logger_level=args.logger_level, logger_name=logger_name).logger.info(
+            'Batch ingestion: %s of %s files processed in %.2f seconds with %s job(s)',
+            len(input_files) - len(batch_summary['failed_files']), len(input_files),
+            batch_summary['elapsed_seconds'], jobs)
+    return batch_summary
+
+
+# renderer loaded once by each rendering worker process
+_worker_renderer = None
+
+
+def _initialize_render_worker(
+        input_file, logger_level, logger_name, baseline_cache=None, data_keys=None, results_store=None,
+        catalog=None):
+    """
+    Load the renderer data once for a rendering worker process.
+
+    :param input_file: processed file to render
+    :param logger_level: Logging level
+    :param logger_name: Specified logger to use
+    :param baseline_cache: BaselineCache object
+    :param data_keys: top level json keys to load
+    :param results_store: ResultsStore object
+    :param catalog: ProcessedCatalog object
+    """
+    global _worker_renderer
+    GraphicsRenderer = load_renderer()
+    _worker_renderer = GraphicsRenderer(
+        input_file,
+        baseline_cache=baseline_cache,
+        data_keys=data_keys,
+        results_store=results_store,
+        catalog=catalog,
+        logger_level=logger_level,
+        logger_name=logger_name)
+    return
+
+
+def _run_worker_render_function(render_function_name):
+    """
+    Run a rendering function with the renderer loaded by the worker process.
+
+    :param render_function_name: name of the GraphicsRenderer rendering function
+    :return: tuple of the error message, which is None if the function rendered successfully, and the render record
+    """
+    return run_render_function(_worker_renderer, render_function_name)
+
+
+def _load_graphics_renderer(
+        GraphicsRenderer, input_file, args, logger_name, baseline_cache=None, data_keys=None, results_store=None,
+        catalog=None):
+    """
+    Load the renderer data of a processed file for the rendering functions run in this process.
+
+    :param GraphicsRenderer: GraphicsRenderer class, see load_renderer
+    :param input_file: processed file to render
+    :param args: parsed command line arguments
+    :param logger_name: Specified logger to use
+    :param baseline_cache: BaselineCache object
+    :param data_keys: top level json keys to load
+    :param results_store: ResultsStore object
+    :param catalog: ProcessedCatalog object
+    :return: GraphicsRenderer object, or None if the file could not be loaded
+    """
     try:
-        gr = GraphicsRenderer(
+        return GraphicsRenderer(
             input_file,
+            baseline_cache=baseline_cache,
+            data_keys=data_keys,
+            results_store=results_store,
+            catalog=catalog,
             logger_level=args.logger_level,
             logger_name=logger_name)
-        # get rendering functions from class.  If the 'render_graphics' option was provided then only
-        # render the referenced graphic.  Otherwise, render all graphics
-        if getattr(args, 'render_graphics'):
-            render_function_names = ['_'.join(['render', i]) for i in getattr(args, 'render_graphics')]
-            bad_function_names = [i for i in render_function_names if not hasattr(gr, i)]
-            # print bad function references
-            for bad_function_name in bad_function_names:
-                gr.logger.warning('WARNING: Rendering function (%s) does not exist in GraphicsRenderer',
-                                  bad_function_name)
-            render_functions = [(i, getattr(gr, i)) for i in render_function_names if hasattr(gr, i)]
-        else:
-            render_functions = [
-                (i, j) for i, j in
-                inspect.getmembers(gr, predicate=inspect.ismethod)
-                if i.startswith('render') and gr.section_type.lower().replace('-', '_') in i]
-        try:
-            for render_function_name, render_function in render_functions:
-                render_function()
-                plt.close('all')
-                gr.logger.info('%s rendered for %s', render_function_name, str(input_file))
-        except (ValueError, ASHRAE140TypeError):
-            import traceback
-            print(traceback.print_exc())
-            gr.logger.error('Error: failed to render images: %s', str(input_file))
-            return
     except ASHRAE140TypeError:
         print('failed to render images: {}'.format(str(input_file)))
-        return
-    return
+    return None
+
+
+def _get_manifest_json_data(input_file, section_type, data_keys=None, catalog=None) -> dict:
+    """
+    Read the json objects of a processed file and the baseline files of its section, keyed and ordered as the
+    GraphicsRenderer json_data, so that the render manifest can be checked without loading the renderer data.
+
+    :param input_file: processed file to render
+    :param section_type: section type (e.g. TF, GC, HE)
+    :param data_keys: top level json keys to read.  All keys are read if not provided.
+    :param catalog: ProcessedCatalog object used to select the baseline files
+    :return: dictionary of model name to processed json object
+    """
+    from baseline_cache import read_processed_json
+    catalog = catalog or ProcessedCatalog()
+    if data_keys is not None:
+        data_keys = set(data_keys).union(['identifying_information', ])
+    return {
+        '-'.join([i.parts[-3], i.parts[-2]]): read_processed_json(i, data_keys=data_keys)
+        for i in catalog.get_baseline_files(section_type) + [input_file, ]}
+
+
+def run_render_function(gr, render_function_name):
+    """
+    Run a single rendering function and close the figures it opened.  The data keys read and the files written by the
+    function are recorded for the render manifest.
+
+    :param gr: GraphicsRenderer object
+    :param render_function_name: name of the rendering function
+    :return: tuple of the error message, which is None if the function rendered successfully, and the render record
+        dictionary of data keys ('data_keys') and output files ('output_files')
+    """
+    import matplotlib.pyplot as plt
+    gr.accessed_data_keys.clear()
+    gr.rendered_files.clear()
+    error_message = None
+    try:
+        getattr(gr, render_function_name)()
+    except Exception:
+        # a failing function is reported and skipped, as it is when run in a process pool
+        error_message = traceback.format_exc()
+    finally:
+        plt.close('all')
+    render_record = {
+        'data_keys': sorted(gr.accessed_data_keys, key=str),
+        'output_files': [str(i) for i in gr.rendered_files]}
+    return error_message, render_record
+
+
+def create_images(
+        input_file, args, logger_name, baseline_cache=None, results_store=None, catalog=None,
+        render_function_names=None):
+    """
+    Render the graphics for a processed file.  When the 'jobs' option is greater than one, the rendering functions
+    are distributed to a process pool in which each worker loads the renderer data once.
+
+    A render manifest in the rendered output directory records the data each rendering function read and a
+    fingerprint of its code.  Functions whose data and code are unchanged, and whose outputs exist, are skipped
+    unless the 'no_cache' option is set.  When a catalog is provided, the render status of the file is recorded in
+    it, and a file whose contents, baselines, and renderer code are unchanged since it was last rendered without
+    errors is skipped without loading its data.
+
+    :param input_file: processed file to render
+    :param args: parsed command line arguments
+    :param logger_name: Specified logger to use
+    :param baseline_cache: BaselineCache object shared by the renderers of a batch
+    :param results_store: ResultsStore object
+    :param catalog: ProcessedCatalog object
+    :param render_function_names: rendering functions to run.  If not provided, the functions referenced by the
+        'render_graphics' option are run, or every function of the file section.
+    :return: dictionary of rendering function name to error message, which is None for rendered and skipped
+        functions
+    """
+    from render_manifest import RenderManifest, get_code_fingerprints
+    GraphicsRenderer = load_renderer()
+    # get rendering functions from class.  If the 'render_graphics' option was provided then only
+    # render the referenced graphic, and only load the data it depends on.  Otherwise, render all graphics
+    if render_function_names or getattr(args, 'render_graphics'):
+        requested_function_names = render_function_names or [
+            '_'.join(['render', i]) for i in getattr(args, 'render_graphics')]
+        render_function_names = [i for i in requested_function_names if hasattr(GraphicsRenderer, i)]
+        data_keys = get_data_keys(GraphicsRenderer, render_function_names)
+    else:
+        requested_function_names = []
+        render_function_names = None
+        data_keys = None
+    render_hash = None
+    if catalog:
+        catalog.update_file(input_file)
+        render_hash = catalog.get_render_hash(
+            input_file, ''.join(sorted(get_code_fingerprints(GraphicsRenderer).values())))
+        render_file_directory = root_directory.joinpath(
+            'rendered', 'images', input_file.parts[-3].lower(), input_file.parts[-2].lower())
+        if render_function_names is None and not getattr(args, 'no_cache', False) and \
+                catalog.is_rendered(input_file, render_hash) and all(
+                    render_file_directory.joinpath(i).is_file()
+                    for i in catalog.get_entry(input_file)['rendered']['output_files']):
+            Logger(logger_level=args.logger_level, logger_name=logger_name).logger.info(
+                'Rendered files are up to date for %s', str(input_file))
+            section = catalog.get_entry(input_file)['section'].lower().replace('-', '_')
+            return {
+                i: None for i, _ in inspect.getmembers(GraphicsRenderer, predicate=inspect.isfunction)
+                if i.startswith('render') and section in i}
+    logger = Logger(logger_level=args.logger_level, logger_name=logger_name).logger
+    # print bad function references
+    for bad_function_name in [i for i in requested_function_names if not hasattr(GraphicsRenderer, i)]:
+        logger.warning('WARNING: Rendering function (%s) does not exist in GraphicsRenderer', bad_function_name)
+    jobs = getattr(args, 'jobs', None) or 1
+    gr = None
+    if jobs > 1:
+        # the pool workers load the renderer data, so only the json objects hashed by the render manifest are read here
+        section_type = get_file_identity(input_file)[0]
+        json_data = _get_manifest_json_data(input_file, section_type, data_keys, catalog)
+    else:
+        gr = _load_graphics_renderer(
+            GraphicsRenderer, input_file, args, logger_name, baseline_cache, data_keys, results_store, catalog)
+        if gr is None:
+            return {}
+        section_type = gr.section_type
+        json_data = gr.json_data
+    if render_function_names is None:
+        render_function_names = [
+            i for i, _ in inspect.getmembers(GraphicsRenderer, predicate=inspect.isfunction)
+            if i.startswith('render') and section_type.lower().replace('-', '_') in i]
+    render_manifest = RenderManifest(
+        manifest_location=root_directory.joinpath(
+            'rendered',
+            'images',
+            input_file.parts[-3].lower(),
+            input_file.parts[-2].lower(),
+            'render_manifest.json'),
+        renderer_class=GraphicsRenderer)
+    render_results = {}
+    if not getattr(args, 'no_cache', False):
+        for render_function_name in render_function_names:
+            if render_manifest.is_current(render_function_name, json_data):
+                render_results[render_function_name] = None
+                logger.info('%s is up to date for %s', render_function_name, str(input_file))
+        render_function_names = [i for i in render_function_names if i not in render_results]
+    render_records = {}
+    if jobs > 1 and len(render_function_names) > 1:
+        with ProcessPoolExecutor(
+                max_workers=min(jobs, len(render_function_names)),
+                initializer=_initialize_render_worker,
+                initargs=(
+                    input_file, args.logger_level, logger_name, baseline_cache, data_keys, results_store,
+                    catalog)) as executor:
+            futures = [executor.submit(_run_worker_render_function, i) for i in render_function_names]
+            for render_function_name, future in zip(render_function_names, futures):
+                try:
+                    render_results[render_function_name], render_records[render_function_name] = future.result()
+                except Exception:
+                    render_results[render_function_name] = traceback.format_exc()
+    elif render_function_names:
+        if gr is None:
+            gr = _load_graphics_renderer(
+                GraphicsRenderer, input_file, args, logger_name, baseline_cache, data_keys, results_store, catalog)
+            if gr is None:
+                return render_results
+        for render_function_name in render_function_names:
+            render_results[render_function_name], render_records[render_function_name] = run_render_function(
+                gr, render_function_name)
+    for render_function_name in render_function_names:
+        error_message = render_results[render_function_name]
+        if error_message:
+            render_manifest.entries.pop(render_function_name, None)
+            logger.error('Error: %s failed to render images: %s\n%s',
+                         render_function_name, str(input_file), error_message)
+        else:
+            render_manifest.update(
+                render_function_name,
+                json_data,
+                render_records[render_function_name]['data_keys'],
+                render_records[render_function_name]['output_files'])
+            logger.info('%s rendered for %s', render_function_name, str(input_file))
+    if render_function_names:
+        render_manifest.save()
+    if catalog:
+        # a render of selected graphics keeps the status of an earlier full render from the same inputs
+        if any(render_results.values()) or (
+                requested_function_names and not catalog.is_rendered(input_file, render_hash)):
+            render_hash = None
+        catalog.set_rendered(
+            input_file,
+            [j for i in render_results.keys() for j in render_manifest.entries.get(i, {}).get('output_files', [])],
+            render_hash)
+    return render_results
+
+
+def screen_file(input_file, args, logger_name, baseline_cache=None, catalog=None):
+    """
+    Screen a processed file against the reference programs of its section without rendering, and write the json and
+    markdown summaries to its rendered directory.
 
+    :param input_file: processed file to screen
+    :param args: parsed command line arguments
+    :param logger_name: Specified logger to use
+    :param baseline_cache: BaselineCache object used to read the baseline files
+    :param catalog: ProcessedCatalog object used to select the baseline files
+    :return: screening result dictionary, see screening.screen_processed_file
+    """
+    from screening import screen_processed_file, write_screen_summary
+    screen_result = screen_processed_file(input_file, catalog=catalog, baseline_cache=baseline_cache)
+    _, markdown_file_location = write_screen_summary(screen_result)
+    Logger(logger_level=args.logger_level, logger_name=logger_name).logger.info(
+        'Screening summary written for %s: %s', str(input_file), str(markdown_file_location))
+    print('{} ({}): {} of {} cells outside the reference range, see {}'.format(
+        screen_result['model_name'], screen_result['section'], screen_result['summary']['outside'],
+        screen_result['summary']['cells'], str(markdown_file_location)))
+    return screen_result
+
+
+def create_markdown(input_file, catalog=None):
+    """
+    Write the markdown file that lists the figures and tables rendered for a section.  The rendered files are taken
+    from the catalog when it records a render of the processed file, and are otherwise found in the rendered output
+    directory.
 
-def create_markdown(input_file):
+    :param input_file: processed file of the section
+    :param catalog: ProcessedCatalog object
+    :return: markdown file name
+    """
     # get markdown file directory
     input_file_path_parts = input_file.parts
     folder_parts = input_file_path_parts[-3:-1]
@@ -122,7 +526,15 @@ def create_markdown(input_file):
     destination_directory = root_directory.joinpath('rendered', 'images', folder_parts[0], folder_parts[1])
     img_file_directory = destination_directory.joinpath('images')
 
-    if img_file_directory.exists():
+    # rendered files are recorded in the catalog once the file has been rendered without errors
+    rendered = ((catalog.get_entry(input_file) if catalog else None) or {}).get('rendered') or {}
+    if rendered.get('hash'):
+        rendered_files = [
+            pathlib.PurePosixPath(i).name for i in rendered['output_files']
+            if destination_directory.joinpath(i).is_file() and pathlib.PurePosixPath(i).parent.name == 'images']
+        img_files = [i for i in rendered_files if i.endswith('.png') and section_string in i]
+        md_table_files = [i for i in rendered_files if i.endswith('.md') and section_string in i]
+    elif img_file_directory.exists():
         if img_file_directory.is_dir():
             img_files = [i.name for i in img_file_directory.glob('*') if i.is_file() and i.suffix == '.png' and section_string in i.name]
             md_table_files = [i.name for i in img_file_directory.glob('*') if i.is_file() and i.suffix == '.md' and section_string in i.name]
@@ -171,6 +583,76 @@ def create_markdown(input_file):
     return md_file.name
 
 
+def process_changed_files(git_ref, args, logger_name, ingest_cache=None, baseline_cache=None, results_store=None,
+                          catalog=None):
+    """
+    Ingest and render the files changed since a git reference in a single process.  Changed input files are
+    processed, and the renders are planned from the processed files that changed, either directly or through
+    ingestion: only the graphics that depend on the changed json keys are rendered, and a changed baseline file
+    renders those graphics for every tested file of its section.  In screening mode, the same tested files are
+    screened against the reference programs instead of rendered.
+
+    :param git_ref: git reference to compare against, e.g. origin/main
+    :param args: parsed command line arguments
+    :param logger_name: Specified logger to use
+    :param ingest_cache: IngestCache object
+    :param baseline_cache: BaselineCache object
+    :param results_store: ResultsStore object
+    :param catalog: ProcessedCatalog object
+    :return: batch summary dictionary of the ingestion, with the render jobs that were run, or the screening results
+    """
+    catalog = catalog or ProcessedCatalog()
+    changed_files = get_changed_files(git_ref, repository_directory=root_directory)
+    input_files = [
+        i for i in changed_files
+        if i.relative_to(root_directory).parts[0] == 'input' and i.suffix not in ['.py', '.pyc']]
+    processed_files = [
+        i for i in changed_files
+        if i.relative_to(root_directory).parts[0] == 'processed' and i.suffix == '.json']
+    processed_files = [i for i in processed_files if i != catalog.catalog_location]
+    batch_summary = process_input_files(
+        input_files=input_files,
+        args=args,
+        logger_name=logger_name,
+        ingest_cache=ingest_cache,
+        results_store=results_store,
+        catalog=catalog)
+    catalog.update_files(processed_files)
+    processed_files.extend([i for i in batch_summary['output_files'] if i and i not in processed_files])
+    if getattr(args, 'screen', False):
+        # a changed baseline file changes the reference range of every tested file of its section
+        screen_files = [i for i in processed_files if not catalog.is_baseline(i)]
+        for baseline_file in [i for i in processed_files if catalog.is_baseline(i)]:
+            screen_files.extend([
+                i for i in catalog.get_files(section=catalog.get_entry(baseline_file)['section'], baseline=False)
+                if i not in screen_files])
+        batch_summary['screen_results'] = [
+            screen_file(
+                input_file=i,
+                args=args,
+                logger_name=logger_name,
+                baseline_cache=baseline_cache,
+                catalog=catalog)
+            for i in screen_files]
+        return batch_summary
+    render_jobs = plan_render_jobs(processed_files, git_ref, catalog, load_renderer(), root_directory)
+    Logger(logger_level=args.logger_level, logger_name=logger_name).logger.info(
+        'Changed since %s: %s input file(s), %s processed file(s), %s file(s) to render',
+        git_ref, len(input_files), len(processed_files), len(render_jobs))
+    for input_file, render_function_names in render_jobs.items():
+        create_images(
+            input_file=input_file,
+            args=args,
+            logger_name=logger_name,
+            baseline_cache=baseline_cache,
+            results_store=results_store,
+            catalog=catalog,
+            render_function_names=render_function_names)
+        create_markdown(input_file=input_file, catalog=catalog)
+    batch_summary['render_jobs'] = render_jobs
+    return batch_summary
+
+
 def main(args=None):
     if hasattr(args, 'version') and args.version:
         version = get_property('__version__')
@@ -187,61 +669,83 @@ def main(args=None):
         render_from_input = True
     else:
         render_from_input = False
+    # screening compares the processed files with the reference programs instead of rendering them
+    screen = getattr(args, 'screen', False)
+    from baseline_cache import BaselineCache
+    if getattr(args, 'no_cache', False):
+        ingest_cache = None
+        baseline_cache = BaselineCache()
+    else:
+        ingest_cache = IngestCache()
+        baseline_cache = BaselineCache(cache_directory=root_directory.joinpath('.cache', 'baseline'))
+    results_store = None
+    if getattr(args, 'results_store', False):
+        from results_store import ResultsStore
+        results_store = ResultsStore()
+    catalog = ProcessedCatalog()
+    if getattr(args, 'changed_since', None):
+        batch_summary = process_changed_files(
+            git_ref=args.changed_since,
+            args=args,
+            logger_name=logger_name,
+            ingest_cache=ingest_cache,
+            baseline_cache=baseline_cache,
+            results_store=results_store,
+            catalog=catalog)
+        catalog.save()
+        return [batch_summary, ]
     processed_files = []
+    batch_summaries = []
     for f in args.files:
         # Check files argument input.  If it's a directory then make a list of all files contained within.
         f = pathlib.Path(f).joinpath(root_directory, f)
         if pathlib.Path(f).exists():
-            if pathlib.Path(f).is_dir():
+            if pathlib.Path(f).is_dir() and 'processed' in f.parts:
+                # processed files are found from the catalog, which is rebuilt if it has none for the directory
+                input_files = [i for i in catalog.get_files(directory=f) if i.is_file()]
+                if not input_files:
+                    catalog.rebuild()
+                    input_files = catalog.get_files(directory=f)
+            elif pathlib.Path(f).is_dir():
                 input_files = [i for i in f.rglob('*') if i.is_file() and i.suffix not in ['.py', '.pyc']]
             else:
                 input_files = [f, ]
         else:
             input_files = []
-        for input_file in input_files:
-            if 'input' in input_file.parts:
-                try:
-                    ip = InputProcessor(
-                        logger_level=args.logger_level,
-                        logger_name=logger_name,
-                        input_file_location=str(input_file))
-                    try:
-                        if ip.input_file_location:
-                            ip.logger.info('Processing file: {}'.format(ip.input_file_location))
-                            output_file = ip.run()
-                            if render_from_input:
-                                processed_files.append(output_file)
-                    except ASHRAE140TypeError:
-                        ip.logger.error('Failed to process file: {}'.format(str(input_file)))
-                        continue
-                except ASHRAE140TypeError:
-                    print('failed to process file: {}'.format(str(input_file)))
-                    continue
+        batch_summary = process_input_files(
+            input_files=[i for i in input_files if 'input' in i.parts],
+            args=args,
+            logger_name=logger_name,
+            ingest_cache=ingest_cache,
+            results_store=results_store,
+            catalog=catalog)
+        batch_summaries.append(batch_summary)
+        if render_from_input or screen:
+            processed_files.extend([i for i in batch_summary['output_files'] if i])
         for input_file in input_files + processed_files:
             # Ignore base files used as comparisons for renderings
-            if 'processed' in input_file.parts and '-'.join([input_file.parts[-3], input_file.parts[-2]]) not in [
-                'basecalc-v1.0e',
-                'bsimac-9.9.0.7.4',
-                'cse-0.861.1',
-                'dest-2.0.20190401',
-                'energyplus-9.0.1',
-                'energyplus-9.0.1',
-                'esp-r-13.3',
-                'esp-r-13.3',
-                'fluent-6.1',
-                'ght-2.02',
-                'matlab-7.0.4.365-r14-sp2',
-                'sunrel-gc-1.14.02',
-                'trnsys-18.00.0001',
-                'trnsys-18.00.0001',
-                'va114-2.20'
-            ]:
-                create_images(input_file=input_file, args=args, logger_name=logger_name)
+            if 'processed' in input_file.parts and not catalog.is_baseline(input_file):
+                if screen:
+                    batch_summary.setdefault('screen_results', []).append(screen_file(
+                        input_file=input_file,
+                        args=args,
+                        logger_name=logger_name,
+                        baseline_cache=baseline_cache,
+                        catalog=catalog))
+                    continue
+                create_images(
+                    input_file=input_file,
+                    args=args,
+                    logger_name=logger_name,
+                    baseline_cache=baseline_cache,
+                    results_store=results_store,
+                    catalog=catalog)
 
         # create a markdown file to list all figures and tables in the rendered folder
-        if 'processed' in f.parts:
-            create_markdown(input_file=f)
-    return
+        if 'processed' in f.parts and not screen:
+            create_markdown(input_file=f, catalog=catalog)
+    catalog.save()
+    return batch_summaries
 
 
 if __name__ == "__main__":
@@ -251,7 +755,7 @@ if __name__ == "__main__":
     #  in the file namespace.
     if not ip_parser_args.files and unknown_args:
         ip_parser_args.files = unknown_args
-    if not ip_parser_args.files:
+    if not ip_parser_args.files and not ip_parser_args.changed_since and not ip_parser_args.version:
         ip_parser.print_help()
         raise FileNotFoundError('No Files specified for processing')
     main(ip_parser_args)
@@ -0,0 +1,280 @@
+import hashlib
+import json
+import os
+import pathlib
+import re
+
+root_directory = pathlib.Path(__file__).parent.parent.resolve()
+
+# baseline (reference program) files of each section, in the order they are rendered.  These seed the baseline flags
+# of a new catalog; afterwards the catalog file is the record of which files are baselines.
+default_baseline_files = {
+    'TF': [
+        'bsimac/9.9.0.7.4/std140_tf_output.json',
+        'cse/0.861.1/std140_tf_output.json',
+        'dest/2.0.20190401/std140_tf_output.json',
+        'energyplus/9.0.1/std140_tf_output.json',
+        'esp-r/13.3/std140_tf_output.json',
+        'trnsys/18.00.0001/std140_tf_output.json'],
+    'GC': [
+        'basecalc/v1.0e/std140_gc_output.json',
+        'energyplus/9.0.1/std140_gc_output.json',
+        'esp-r/13.3/std140_gc_output.json',
+        'fluent/6.1/std140_gc_output.json',
+        'ght/2.02/std140_gc_output.json',
+        'matlab/7.0.4.365-r14-sp2/std140_gc_output.json',
+        'sunrel-gc/1.14.02/std140_gc_output.json',
+        'trnsys/18.00.0001/std140_gc_output.json',
+        'va114/2.20/std140_gc_output.json'],
+    'HE': [
+        'esp-r-hot3000/1.7/std140_he_output.json',
+        'energyplus/1.0.2/std140_he_output.json',
+        'doe21e/c133/std140_he_output.json',
+        'analytical/0/std140_he_output.json']}
+
+
+def get_file_identity(file_location) -> tuple:
+    """
+    Get the section, program, and version of a processed file from its location, which is formatted as
+    processed/<program>/<version>/std140_<section>_output.json
+
+    :param file_location: processed json file
+    :return: tuple of section (e.g. TF), program, and version
+    """
+    file_location = pathlib.Path(file_location)
+    section_match = re.match(r'std140_(.+)_output$', file_location.stem, re.IGNORECASE)
+    section = section_match.group(1).upper() if section_match else file_location.stem
+    return section, file_location.parts[-3].lower(), file_location.parts[-2].lower()
+
+
+class ProcessedCatalog:
+    """
+    Catalog of every processed result file, stored as a json file keyed by the file location relative to the
+    processed directory.  Each entry records:
+        section, program, version - identity of the file, see get_file_identity
+        hash - sha256 hash of the file contents when it was last cataloged
+        baseline - True for reference program files, which are compared against and are not rendered themselves
+        baseline_order - position of a baseline file in the comparisons of its section
+        rendered - hash of the render inputs (see get_render_hash) when the file was last rendered without errors,
+            and the files written relative to the rendered output directory
+
+    The catalog is loaded into a dictionary so that each lookup is a single key access.  It is built from one walk
+    of the processed directory when the catalog file does not exist, and is kept current by update_file() after
+    files are processed.
+
+    :param catalog_location: location of the catalog file.  Defaults to catalog.json in the processed directory.
+    :param processed_file_directory: directory of the processed files.  Defaults to the parent of the catalog file.
+    """
+
+    def __init__(self, catalog_location=None, processed_file_directory=None):
+        if catalog_location is None:
+            catalog_location = root_directory.joinpath('processed', 'catalog.json')
+        self.catalog_location = pathlib.Path(catalog_location)
+        self.processed_file_directory = pathlib.Path(
+            processed_file_directory or self.catalog_location.parent).resolve()
+        self.entries = {}
+        self.modified = False
+        if self.catalog_location.is_file():
+            with open(self.catalog_location, 'r') as f:
+                self.entries = json.load(f)
+        else:
+            self.rebuild()
+        return
+
+    def __repr__(self):
+        rep = 'ProcessedCatalog(catalog_location=' + str(self.catalog_location) + ')'
+        return rep
+
+    def get_key(self, file_location) -> str:
+        """
+        Get the catalog key of a processed file
+
+        :param file_location: processed json file, absolute or relative to the processed directory
+        :return: file location relative to the processed directory, with forward slashes
+        """
+        file_location = pathlib.Path(file_location)
+        if not file_location.is_absolute():
+            file_location = self.processed_file_directory.joinpath(file_location)
+        try:
+            return file_location.resolve().relative_to(self.processed_file_directory).as_posix()
+        except ValueError:
+            return file_location.resolve().as_posix()
+
+    def get_file_location(self, key) -> pathlib.Path:
+        """
+        Get the location of a cataloged file
+
+        :param key: catalog key
+        :return: file location
+        """
+        return self.processed_file_directory.joinpath(key)
+
+    def rebuild(self):
+        """
+        Catalog every processed file by walking the processed directory.  Baseline flags and render status of files
+        that are already cataloged are kept, and new catalogs take their baseline flags from default_baseline_files.
+
+        :return: dictionary of catalog entries
+        """
+        existing_entries = self.entries
+        self.entries = {}
+        baseline_orders = {
+            file_key: file_order
+            for file_keys in default_baseline_files.values() for file_order, file_key in enumerate(file_keys)}
+        for file_location in sorted(self.processed_file_directory.rglob('*.json')):
+            key = self.get_key(file_location)
+            if key == self.get_key(self.catalog_location):
+                continue
+            if key in existing_entries:
+                self.entries[key] = existing_entries[key]
+            elif key in baseline_orders:
+                self.entries[key] = {'baseline': True, 'baseline_order': baseline_orders[key]}
+            self.update_file(file_location)
+        self.modified = True
+        return self.entries
+
+    def update_file(self, file_location) -> bool:
+        """
+        Add a processed file to the catalog, or update the hash of a cataloged file.
+
+        :param file_location: processed json file
+        :return: True if the file is new or its contents changed since it was cataloged
+        """
+        key = self.get_key(file_location)
+        section, program, version = get_file_identity(self.get_file_location(key))
+        file_hash = hashlib.sha256(self.get_file_location(key).read_bytes()).hexdigest()
+        entry = self.entries.setdefault(key, {})
+        changed = entry.get('hash') != file_hash
+        if changed or entry.get('section') != section:
+            entry.update({'section': section, 'program': program, 'version': version, 'hash': file_hash})
+            entry.setdefault('baseline', False)
+            self.modified = True
+        return changed
+
+    def update_files(self, file_locations) -> list:
+        """
+        Add processed files to the catalog
+
+        :param file_locations: processed json files
+        :return: list of the files that are new or changed
+        """
+        return [i for i in file_locations if self.update_file(i)]
+
+    def get_entry(self, file_location) -> dict:
+        """
+        Get the catalog entry of a processed file
+
+        :param file_location: processed json file
+        :return: catalog entry, or None if the file is not cataloged
+        """
+        return self.entries.get(self.get_key(file_location))
+
+    def is_baseline(self, file_location) -> bool:
+        """
+        Check if a processed file is a baseline file
+
+        :param file_location: processed json file
+        :return: boolean
+        """
+        return bool((self.get_entry(file_location) or {}).get('baseline'))
+
+    def get_files(self, directory=None, section=None, baseline=None) -> list:
+        """
+        Get the cataloged files, optionally filtered by directory, section, and baseline flag.
+
+        :param directory: directory that contains the files
+        :param section: section type (e.g. TF, GC, HE)
+        :param baseline: True for baseline files only, False for tested files only
+        :return: list of file locations
+        """
+        key_prefix = None
+        if directory is not None:
+            key_prefix = self.get_key(directory)
+            key_prefix = '' if key_prefix == '.' else key_prefix.rstrip('/') + '/'
+        file_locations = []
+        for key, entry in self.entries.items():
+            if key_prefix is not None and not key.startswith(key_prefix):
+                continue
+            if section is not None and entry.get('section') != section:
+                continue
+            if baseline is not None and bool(entry.get('baseline')) != baseline:
+                continue
+            file_locations.append(self.get_file_location(key))
+        return file_locations
+
+    def get_baseline_files(self, section) -> list:
+        """
+        Get the baseline files of a section in their comparison order
+
+        :param section: section type (e.g. TF, GC, HE)
+        :return: list of file locations
+        """
+        baseline_keys = [
+            key for key, entry in self.entries.items() if entry.get('baseline') and entry.get('section') == section]
+        baseline_keys.sort(key=lambda x: (self.entries[x].get('baseline_order', len(baseline_keys)), x))
+        return [self.get_file_location(key) for key in baseline_keys]
+
+    def get_render_hash(self, file_location, code_fingerprint='') -> str:
+        """
+        Hash the inputs of a render of a processed file, which are the contents of the file, the contents of the
+        baseline files of its section, and the code of the renderer.
+
+        :param file_location: processed json file
+        :param code_fingerprint: fingerprint of the renderer code
+        :return: hex digest
+        """
+        entry = self.get_entry(file_location) or {}
+        render_hash = hashlib.sha256(code_fingerprint.encode())
+        render_hash.update(entry.get('hash', '').encode())
+        for baseline_file_location in self.get_baseline_files(entry.get('section')):
+            render_hash.update(self.get_key(baseline_file_location).encode())
+            render_hash.update(self.get_entry(baseline_file_location).get('hash', '').encode())
+        return render_hash.hexdigest()
+
+    def is_rendered(self, file_location, render_hash) -> bool:
+        """
+        Check if a processed file was rendered without errors from the same inputs
+
+        :param file_location: processed json file
+        :param render_hash: hash of the render inputs, see get_render_hash
+        :return: boolean
+        """
+        rendered = (self.get_entry(file_location) or {}).get('rendered') or {}
+        return bool(rendered.get('output_files')) and rendered.get('hash') == render_hash
+
+    def set_rendered(self, file_location, output_files, render_hash=None):
+        """
+        Record the render status of a processed file.  The output files are merged with those of earlier renders of
+        the file, so that rendering a subset of graphics keeps the others.
+
+        :param file_location: processed json file
+        :param output_files: files written, relative to the rendered output directory of the file
+        :param render_hash: hash of the render inputs if every rendering function completed without errors, otherwise
+            None
+        :return: catalog entry
+        """
+        if self.get_entry(file_location) is None:
+            self.update_file(file_location)
+        entry = self.get_entry(file_location)
+        previous_output_files = (entry.get('rendered') or {}).get('output_files', [])
+        rendered = {'hash': render_hash, 'output_files': sorted(set(previous_output_files).union(output_files))}
+        if entry.get('rendered') != rendered:
+            entry['rendered'] = rendered
+            self.modified = True
+        return entry
+
+    def save(self):
+        """
+        Write the catalog file if it was modified
+
+        :return: location of the catalog file
+        """
+        if self.modified:
+            self.catalog_location.parent.mkdir(parents=True, exist_ok=True)
+            temporary_file_location = self.catalog_location.with_name(
+                '.'.join([self.catalog_location.name, str(os.getpid()), 'tmp']))
+            with open(temporary_file_location, 'w') as f:
+                f.write(json.dumps(self.entries, indent=4, sort_keys=True))
+            temporary_file_location.replace(self.catalog_location)
+            self.modified = False
+        return self.catalog_location
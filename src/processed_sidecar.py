@@ -0,0 +1,201 @@
+import hashlib
+import json
+import pathlib
+import zipfile
+import numpy as np
+import pandas as pd
+
+# version of the sidecar layout.  Sidecars written with another version are ignored.
+sidecar_format_version = 1
+
+# kinds of the leaf values of a table
+FLOAT_KIND = 0
+INTEGER_KIND = 1
+STRING_KIND = 2
+NULL_KIND = 3
+# any other value, e.g. a list, boolean, or empty object, stored as json text
+JSON_KIND = 4
+
+
+def get_sidecar_location(file_location) -> pathlib.Path:
+    """
+    Get the location of the binary sidecar of a processed json file
+
+    :param file_location: processed json file
+    :return: sidecar file location, which is the json file location with an .npz suffix
+    """
+    return pathlib.Path(file_location).with_suffix('.npz')
+
+
+def _get_source_hash(source_bytes) -> str:
+    source_hash = hashlib.sha256(source_bytes)
+    source_hash.update(str(sidecar_format_version).encode())
+    return source_hash.hexdigest()
+
+
+def flatten_table(table, path=()) -> list:
+    """
+    Flatten a processed json table into a list of (key path, value) leaves in depth first order, which is the column
+    order of pandas.json_normalize.
+
+    :param table: processed json table
+    :param path: key path of the table
+    :return: list of (key path, value) tuples
+    """
+    if isinstance(table, dict) and table:
+        leaves = []
+        for key, value in table.items():
+            leaves.extend(flatten_table(value, path + (key, )))
+        return leaves
+    return [(path, table), ]
+
+
+def write_sidecar(file_location, source_bytes=None) -> pathlib.Path:
+    """
+    Write a compressed .npz sidecar next to a processed json file.  The leaves of every table are stored as columnar
+    arrays of key paths, value kinds, and values, with an index of the number of each in every table, so that the
+    tables can be loaded without parsing the json text.  The sidecar records a hash of the json file so that a stale
+    sidecar is not used.
+
+    :param file_location: processed json file
+    :param source_bytes: contents of the processed json file, read from the file if not provided
+    :return: sidecar file location
+    """
+    if source_bytes is None:
+        source_bytes = pathlib.Path(file_location).read_bytes()
+    data = json.loads(source_bytes)
+    index = []
+    paths = []
+    kinds = []
+    floats = []
+    integers = []
+    strings = []
+    for tbl, tbl_data in data.items():
+        leaves = flatten_table(tbl_data)
+        counts = [len(floats), len(integers), len(strings)]
+        for path, value in leaves:
+            paths.append(path)
+            if isinstance(value, float):
+                kinds.append(FLOAT_KIND)
+                floats.append(value)
+            elif isinstance(value, int) and not isinstance(value, bool):
+                kinds.append(INTEGER_KIND)
+                integers.append(value)
+            elif isinstance(value, str):
+                kinds.append(STRING_KIND)
+                strings.append(value)
+            elif value is None:
+                kinds.append(NULL_KIND)
+            else:
+                kinds.append(JSON_KIND)
+                strings.append(json.dumps(value))
+        index.append([tbl, len(leaves), len(floats) - counts[0], len(integers) - counts[1], len(strings) - counts[2]])
+    sidecar_location = get_sidecar_location(file_location)
+    # np.savez_compressed appends .npz to names without it, so write through a file object
+    temporary_file_location = sidecar_location.with_name(sidecar_location.name + '.tmp')
+    with open(temporary_file_location, 'wb') as f:
+        np.savez_compressed(
+            f,
+            source_hash=np.array(_get_source_hash(source_bytes)),
+            index=np.array(json.dumps(index)),
+            paths=np.array(json.dumps(paths)),
+            kinds=np.array(kinds, dtype=np.int8),
+            floats=np.array(floats, dtype=np.float64),
+            integers=np.array(integers, dtype=np.int64),
+            strings=np.array(json.dumps(strings)))
+    temporary_file_location.replace(sidecar_location)
+    return sidecar_location
+
+
+def read_sidecar(file_location, data_keys=None):
+    """
+    Read the tables of a processed json file from its sidecar.
+
+    :param file_location: processed json file
+    :param data_keys: top level json keys to read.  All keys are read if not provided.
+    :return: dictionary of table name to a list of (key path, value) leaves, or None if the sidecar is missing or
+        does not match the json file
+    """
+    sidecar_location = get_sidecar_location(file_location)
+    if not sidecar_location.is_file():
+        return None
+    try:
+        with np.load(sidecar_location, allow_pickle=False) as sidecar:
+            if str(sidecar['source_hash']) != _get_source_hash(pathlib.Path(file_location).read_bytes()):
+                return None
+            index = json.loads(str(sidecar['index']))
+            if data_keys is not None and not any(tbl in data_keys for tbl, *_ in index):
+                return {}
+            paths = json.loads(str(sidecar['paths']))
+            kinds = sidecar['kinds'].tolist()
+            values = [sidecar['floats'].tolist(), sidecar['integers'].tolist(), json.loads(str(sidecar['strings']))]
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        return None
+    tables = {}
+    # positions of the first leaf, float, integer, and string of each table
+    positions = [0, 0, 0, 0]
+    for tbl, *counts in index:
+        if data_keys is None or tbl in data_keys:
+            value_positions = positions[1:]
+            leaves = []
+            for path, kind in zip(
+                    paths[positions[0]:positions[0] + counts[0]], kinds[positions[0]:positions[0] + counts[0]]):
+                if kind == NULL_KIND:
+                    value = None
+                elif kind == JSON_KIND:
+                    value = json.loads(values[STRING_KIND][value_positions[STRING_KIND]])
+                    value_positions[STRING_KIND] += 1
+                else:
+                    value = values[kind][value_positions[kind]]
+                    value_positions[kind] += 1
+                leaves.append((tuple(path), value))
+            tables[tbl] = leaves
+        positions = [i + j for i, j in zip(positions, counts)]
+    return tables
+
+
+def leaves_to_json(leaves):
+    """
+    Rebuild a processed json table from its (key path, value) leaves
+
+    :param leaves: list of (key path, value) tuples
+    :return: processed json table
+    """
+    if len(leaves) == 1 and not leaves[0][0]:
+        return leaves[0][1]
+    table = {}
+    for path, value in leaves:
+        node = table
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        node[path[-1]] = value
+    return table
+
+
+def leaves_to_frame(leaves, sep='>') -> pd.DataFrame:
+    """
+    Make the single row dataframe that pandas.json_normalize makes from a processed json table.  The columns are
+    built as one block for each value kind instead of being inferred one value at a time.
+
+    :param leaves: list of (key path, value) tuples
+    :param sep: separator used to join the key paths into column names
+    :return: pandas dataframe
+    """
+    columns = [sep.join(path) for path, _ in leaves]
+    blocks = {float: ([], []), int: ([], []), object: ([], [])}
+    for column, (_, value) in zip(columns, leaves):
+        if isinstance(value, float):
+            block = blocks[float]
+        elif isinstance(value, int) and not isinstance(value, bool):
+            block = blocks[int]
+        else:
+            block = blocks[object]
+        block[0].append(column)
+        block[1].append(value)
+    frames = [
+        pd.DataFrame(np.array([block_values], dtype=dtype), columns=block_columns)
+        for dtype, (block_columns, block_values) in blocks.items() if block_columns]
+    frame = pd.concat(frames, axis=1) if len(frames) > 1 else frames[0]
+    if blocks[object][0]:
+        frame = frame.infer_objects()
+    return frame[columns]
@@ -0,0 +1,97 @@
+import ast
+import functools
+import inspect
+import re
+import textwrap
+
+# processed json keys are lower case snake case names, which excludes captions, labels, and format strings
+data_key_pattern = re.compile(r'[a-z][a-z0-9]*(_[a-z0-9]+)+')
+
+
+def _get_method_references(renderer_class, method_name, method_names) -> tuple:
+    """
+    Find the candidate data keys and the renderer methods referenced by a method.  String constants in the method
+    body and in its argument defaults are candidate data keys.
+
+    :param renderer_class: renderer class, e.g. GraphicsRenderer
+    :param method_name: name of the method to inspect
+    :param method_names: names of every method of the renderer class
+    :return: tuple of the candidate data keys and the referenced method names
+    """
+    method_node = ast.parse(textwrap.dedent(inspect.getsource(getattr(renderer_class, method_name)))).body[0]
+    data_keys = set()
+    referenced_methods = set()
+    for node in ast.walk(method_node):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str) and data_key_pattern.fullmatch(node.value):
+            data_keys.add(node.value)
+        elif isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == 'self' and \
+                node.attr in method_names and node.attr != method_name:
+            referenced_methods.add(node.attr)
+    return data_keys, referenced_methods
+
+
+@functools.lru_cache(maxsize=None)
+def get_render_dependencies(renderer_class, function_prefix='render') -> dict:
+    """
+    Build the registry of processed json keys that each rendering function depends on.  The registry is traced from
+    the renderer source, and includes the keys read by the helper methods each rendering function calls.  A key in
+    the registry is not necessarily present in a processed file, so the registry is a superset of the keys read.
+
+    :param renderer_class: renderer class, e.g. GraphicsRenderer
+    :param function_prefix: prefix of the rendering function names
+    :return: dictionary of rendering function name to a frozenset of top level json keys
+    """
+    method_names = {name for name, _ in inspect.getmembers(renderer_class, predicate=inspect.isfunction)}
+    method_references = {}
+    for method_name in method_names:
+        try:
+            method_references[method_name] = _get_method_references(renderer_class, method_name, method_names)
+        except (OSError, TypeError):
+            # methods without source, e.g. inherited from compiled classes
+            method_references[method_name] = (set(), set())
+    render_dependencies = {}
+    for method_name in sorted(i for i in method_names if i.startswith(function_prefix)):
+        data_keys = set()
+        visited = set()
+        unvisited = [method_name, ]
+        while unvisited:
+            visited_method_name = unvisited.pop()
+            if visited_method_name in visited:
+                continue
+            visited.add(visited_method_name)
+            method_data_keys, referenced_methods = method_references[visited_method_name]
+            data_keys.update(method_data_keys)
+            unvisited.extend(referenced_methods - visited)
+        render_dependencies[method_name] = frozenset(data_keys)
+    return render_dependencies
+
+
+def get_data_keys(renderer_class, render_function_names) -> set:
+    """
+    Get the processed json keys needed to run a set of rendering functions.
+
+    :param renderer_class: renderer class, e.g. GraphicsRenderer
+    :param render_function_names: rendering function names
+    :return: set of top level json keys
+    """
+    render_dependencies = get_render_dependencies(renderer_class)
+    data_keys = set()
+    for render_function_name in render_function_names:
+        data_keys.update(render_dependencies.get(render_function_name, ()))
+    return data_keys
+
+
+def get_affected_render_functions(renderer_class, changed_data_keys) -> list:
+    """
+    Get the rendering functions that depend on any of a set of changed processed json keys, so that unaffected
+    graphics can be skipped.
+
+    :param renderer_class: renderer class, e.g. GraphicsRenderer
+    :param changed_data_keys: top level json keys whose values changed
+    :return: sorted list of rendering function names
+    """
+    changed_data_keys = set(changed_data_keys)
+    return [
+        render_function_name
+        for render_function_name, data_keys in get_render_dependencies(renderer_class).items()
+        if data_keys & changed_data_keys]
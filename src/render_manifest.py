@@ -0,0 +1,200 @@
+import hashlib
+import inspect
+import json
+import os
+import pathlib
+import sys
+import matplotlib
+
+
+class AccessRecordingDict(dict):
+    """
+    Dictionary that records which of its keys are read.  Reading every key, e.g. by iterating over the dictionary, is
+    recorded as '*'.
+
+    :param data: dictionary to copy
+    :param accessed_keys: set that the read keys are added to
+    """
+
+    def __init__(self, data, accessed_keys):
+        super().__init__(data)
+        self.accessed_keys = accessed_keys
+        return
+
+    def __getitem__(self, key):
+        self.accessed_keys.add(key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        self.accessed_keys.add(key)
+        return super().__contains__(key)
+
+    def get(self, key, default=None):
+        self.accessed_keys.add(key)
+        return super().get(key, default)
+
+    def __iter__(self):
+        self.accessed_keys.add('*')
+        return super().__iter__()
+
+    def keys(self):
+        self.accessed_keys.add('*')
+        return super().keys()
+
+    def values(self):
+        self.accessed_keys.add('*')
+        return super().values()
+
+    def items(self):
+        self.accessed_keys.add('*')
+        return super().items()
+
+
+def get_code_fingerprints(renderer_class, function_prefix='render') -> dict:
+    """
+    Make a fingerprint of the code behind each rendering function.  Each fingerprint combines the source of the
+    function with the source shared by all rendering functions (the rest of the renderer module and the modules of
+    its helper classes) and the plotting library version, so that a change to one rendering function only affects
+    that function.
+
+    :param renderer_class: renderer class, e.g. GraphicsRenderer
+    :param function_prefix: prefix of the rendering function names
+    :return: dictionary of rendering function name to fingerprint
+    """
+    module = sys.modules[renderer_class.__module__]
+    shared_source = inspect.getsource(module)
+    function_sources = {
+        name: inspect.getsource(function)
+        for name, function in inspect.getmembers(renderer_class, predicate=inspect.isfunction)
+        if name.startswith(function_prefix)}
+    for function_source in function_sources.values():
+        shared_source = shared_source.replace(function_source, '')
+    shared_hash = hashlib.sha256(shared_source.encode())
+    shared_hash.update(matplotlib.__version__.encode())
+    # include helper modules imported by the renderer module from the src directory
+    src_directory = pathlib.Path(module.__file__).parent.resolve()
+    helper_files = set()
+    for obj in vars(module).values():
+        helper_module = sys.modules.get(getattr(obj, '__module__', None) or '')
+        helper_file = getattr(helper_module, '__file__', None)
+        if helper_module is not module and helper_file and pathlib.Path(helper_file).parent.resolve() == src_directory:
+            helper_files.add(pathlib.Path(helper_file).resolve())
+    for helper_file in sorted(helper_files):
+        shared_hash.update(helper_file.read_bytes())
+    return {
+        name: hashlib.sha256((shared_hash.hexdigest() + function_source).encode()).hexdigest()
+        for name, function_source in function_sources.items()}
+
+
+class RenderManifest:
+    """
+    Record of the inputs used to render each graphic of a program, so that a rendering function is only run again
+    when the data it reads or its code has changed.
+
+    Each entry records:
+        data_keys - top level keys of the processed json objects read by the function
+        data_hash - hash of the values of those keys for every program that was rendered
+        code_fingerprint - fingerprint of the rendering function code, see get_code_fingerprints
+        output_files - files written by the function, relative to the manifest directory
+
+    :param manifest_location: location of the manifest json file
+    :param renderer_class: renderer class used to make the code fingerprints
+    """
+
+    def __init__(self, manifest_location, renderer_class):
+        self.manifest_location = pathlib.Path(manifest_location)
+        self.entries = {}
+        if self.manifest_location.is_file():
+            try:
+                with open(self.manifest_location, 'r') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError):
+                self.entries = {}
+        self.code_fingerprints = get_code_fingerprints(renderer_class)
+        # hash of each data key, which assumes that the json data is not modified while the manifest is in use
+        self._data_key_hashes = {}
+        return
+
+    def __repr__(self):
+        rep = 'RenderManifest(manifest_location=' + str(self.manifest_location) + ')'
+        return rep
+
+    def _get_data_key_hash(self, json_data, data_key) -> str:
+        if data_key not in self._data_key_hashes:
+            key_hash = hashlib.sha256(json.dumps(data_key).encode())
+            for model_name, json_obj in json_data.items():
+                # read through dict so that hashing is not recorded as a data access
+                key_hash.update(json.dumps(
+                    [model_name, dict.get(json_obj, data_key)], sort_keys=True, default=str).encode())
+            self._data_key_hashes[data_key] = key_hash.hexdigest()
+        return self._data_key_hashes[data_key]
+
+    def get_data_hash(self, json_data, data_keys) -> str:
+        """
+        Hash the values of the data keys for every program.
+
+        :param json_data: dictionary of model name to processed json object
+        :param data_keys: top level keys of the processed json objects.  '*' selects every key.
+        :return: hex digest
+        """
+        if '*' in data_keys:
+            data_keys = set(data_keys).union(*[dict.keys(json_obj) for json_obj in json_data.values()])
+        data_hash = hashlib.sha256(json.dumps(list(json_data.keys())).encode())
+        for data_key in sorted(data_keys, key=str):
+            data_hash.update(self._get_data_key_hash(json_data, data_key).encode())
+        return data_hash.hexdigest()
+
+    def is_current(self, function_name, json_data) -> bool:
+        """
+        Check if the outputs of a rendering function are up to date with its data and code.
+
+        :param function_name: name of the rendering function
+        :param json_data: dictionary of model name to processed json object
+        :return: boolean
+        """
+        entry = self.entries.get(function_name)
+        if not entry or entry.get('code_fingerprint') != self.code_fingerprints.get(function_name):
+            return False
+        if not entry.get('output_files') or not all(
+                self.manifest_location.parent.joinpath(i).is_file() for i in entry['output_files']):
+            return False
+        return entry.get('data_hash') == self.get_data_hash(json_data, entry.get('data_keys', ['*', ]))
+
+    def update(self, function_name, json_data, data_keys, output_files):
+        """
+        Record the inputs and outputs of a rendering function run.
+
+        :param function_name: name of the rendering function
+        :param json_data: dictionary of model name to processed json object
+        :param data_keys: top level keys of the processed json objects read by the function
+        :param output_files: files written by the function
+        :return: manifest entry
+        """
+        relative_output_files = []
+        for output_file in output_files:
+            try:
+                relative_output_files.append(
+                    pathlib.Path(output_file).resolve().relative_to(self.manifest_location.parent.resolve()).as_posix())
+            except ValueError:
+                relative_output_files.append(str(output_file))
+        data_keys = sorted(set(data_keys), key=str)
+        self.entries[function_name] = {
+            'data_keys': data_keys,
+            'data_hash': self.get_data_hash(json_data, data_keys),
+            'code_fingerprint': self.code_fingerprints.get(function_name),
+            'output_files': sorted(set(relative_output_files))}
+        return self.entries[function_name]
+
+    def save(self):
+        """
+        Write the manifest file
+
+        :return: location of the manifest file
+        """
+        self.manifest_location.parent.mkdir(parents=True, exist_ok=True)
+        temporary_file_location = self.manifest_location.with_name(
+            '.'.join([self.manifest_location.name, str(os.getpid()), 'tmp']))
+        with open(temporary_file_location, 'w') as f:
+            json.dump(self.entries, f, indent=4, sort_keys=True)
+        temporary_file_location.replace(self.manifest_location)
+        return self.manifest_location
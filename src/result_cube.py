@@ -0,0 +1,109 @@
+import numbers
+import numpy as np
+
+
+class ResultCube:
+    """
+    Numeric results of one table for every program, stored as a program x case x metric array with labelled axes.
+
+    Labels that are not in the cube, and values that are missing or not numeric, are returned as NaN from select().
+
+    :param values: 3-dimensional array of values (program, case, metric)
+    :param programs: program (model name) labels
+    :param cases: case labels
+    :param metrics: metric labels
+    """
+
+    def __init__(self, values, programs, cases, metrics):
+        self.programs = list(programs)
+        self.cases = list(cases)
+        self.metrics = list(metrics)
+        self.values = np.asarray(values, dtype=float).reshape(len(self.programs), len(self.cases), len(self.metrics))
+        # pad each axis with a trailing NaN slot so that missing labels can be selected with index -1
+        self._padded_values = np.pad(self.values, ((0, 1), (0, 1), (0, 1)), constant_values=np.nan)
+        self._label_positions = [
+            {label: position for position, label in enumerate(labels)}
+            for labels in (self.programs, self.cases, self.metrics)]
+        return
+
+    def __repr__(self):
+        rep = 'ResultCube(' \
+              'programs=' + str(len(self.programs)) + \
+              ', cases=' + str(len(self.cases)) + \
+              ', metrics=' + str(len(self.metrics)) + \
+              ')'
+        return rep
+
+    @classmethod
+    def from_json_data(cls, json_data, table_name):
+        """
+        Build a cube from a table of processed json objects that is formatted as {case: {metric: value}}.
+
+        :param json_data: dictionary of model name to processed json object
+        :param table_name: table key in the processed json objects
+        :return: ResultCube object
+        """
+        programs = list(json_data.keys())
+        cases = {}
+        metrics = {}
+        for json_obj in json_data.values():
+            for case, case_d in (json_obj.get(table_name) or {}).items():
+                cases.setdefault(case, len(cases))
+                for metric in case_d.keys():
+                    metrics.setdefault(metric, len(metrics))
+        values = np.full((len(programs), len(cases), len(metrics)), np.nan)
+        for program_index, json_obj in enumerate(json_data.values()):
+            for case, case_d in (json_obj.get(table_name) or {}).items():
+                for metric, value in case_d.items():
+                    if isinstance(value, numbers.Number) and not isinstance(value, bool):
+                        values[program_index, cases[case], metrics[metric]] = value
+        return cls(values=values, programs=programs, cases=cases.keys(), metrics=metrics.keys())
+
+    @staticmethod
+    def is_case_metric_table(table) -> bool:
+        """
+        Check if a processed json table is formatted as {case: {metric: value}} and can be stored in a cube.
+
+        :param table: processed json table
+        :return: boolean
+        """
+        return isinstance(table, dict) and bool(table) and all(
+            isinstance(case_d, dict) and not any(isinstance(value, dict) for value in case_d.values())
+            for case_d in table.values())
+
+    def _get_positions(self, axis, labels):
+        if labels is None:
+            return np.arange(self.values.shape[axis])
+        return np.array([self._label_positions[axis].get(label, -1) for label in labels], dtype=int)
+
+    def select(self, programs=None, cases=None, metrics=None) -> np.ndarray:
+        """
+        Select a sub-array of values by label.  All labels of an axis are selected if it is not provided.
+
+        :param programs: program labels
+        :param cases: case labels
+        :param metrics: metric labels
+        :return: 3-dimensional array of values (program, case, metric)
+        """
+        return self._padded_values[np.ix_(
+            self._get_positions(0, programs),
+            self._get_positions(1, cases),
+            self._get_positions(2, metrics))]
+
+    def select_deltas(self, expressions, programs=None, metrics=None) -> np.ndarray:
+        """
+        Evaluate case difference expressions, such as '610-600', for the selected programs and metrics in one
+        array operation.
+
+        :param expressions: list of case difference expressions formatted as '<case>-<reference case>'
+        :param programs: program labels
+        :param metrics: metric labels
+        :return: 3-dimensional array of differences (program, expression, metric)
+        """
+        case_pairs = [expression.split('-') for expression in expressions]
+        if any(len(case_pair) != 2 for case_pair in case_pairs):
+            raise ValueError('Case difference expressions must be formatted as <case>-<reference case>: {}'
+                             .format(expressions))
+        cases, reference_cases = zip(*case_pairs) if case_pairs else ((), ())
+        return self.select(programs=programs, cases=[i.strip() for i in cases], metrics=metrics) - \
+            self.select(programs=programs, cases=[i.strip() for i in reference_cases], metrics=metrics)
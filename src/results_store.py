@@ -0,0 +1,176 @@
+import hashlib
+import json
+import numbers
+import pathlib
+import sqlite3
+import numpy as np
+from src.result_cube import ResultCube
+from src.processed_catalog import get_file_identity
+from src.processed_sidecar import flatten_table
+
+root_directory = pathlib.Path(__file__).parent.parent.resolve()
+
+results_store_schema = """
+CREATE TABLE IF NOT EXISTS processed_files (
+    file_id INTEGER PRIMARY KEY,
+    section TEXT NOT NULL,
+    program TEXT NOT NULL,
+    version TEXT NOT NULL,
+    file_location TEXT NOT NULL,
+    source_hash TEXT NOT NULL,
+    UNIQUE (section, program, version));
+CREATE TABLE IF NOT EXISTS results (
+    file_id INTEGER NOT NULL REFERENCES processed_files (file_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    section TEXT NOT NULL,
+    program TEXT NOT NULL,
+    version TEXT NOT NULL,
+    table_name TEXT NOT NULL,
+    case_name TEXT,
+    metric TEXT,
+    value REAL,
+    text_value TEXT);
+CREATE INDEX IF NOT EXISTS results_lookup ON results (section, table_name, case_name, metric, program, version);
+CREATE INDEX IF NOT EXISTS results_file ON results (file_id, table_name, position);
+"""
+
+
+class ResultsStore:
+    """
+    SQLite store of the results of every processed file, with one indexed row for each (section, program, version,
+    table, case, metric) value.  For tables nested deeper than case and metric, the metric is the remaining key path
+    joined with '>'.  Numeric values are stored in the value column, and other values in the text_value column.
+
+    Files are added incrementally: a file is only re-read when its contents changed since it was stored.  A
+    connection is opened for each operation so that the object can be shared with worker processes.
+
+    :param database_location: location of the SQLite database.  Defaults to .cache/results.sqlite in the root
+        directory.
+    """
+
+    def __init__(self, database_location=None):
+        if database_location is None:
+            database_location = root_directory.joinpath('.cache', 'results.sqlite')
+        self.database_location = pathlib.Path(database_location)
+        self.database_location.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.executescript(results_store_schema)
+        return
+
+    def __repr__(self):
+        rep = 'ResultsStore(database_location=' + str(self.database_location) + ')'
+        return rep
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.database_location, timeout=30)
+        connection.execute('PRAGMA foreign_keys = ON')
+        return connection
+
+    def update_file(self, file_location) -> bool:
+        """
+        Add a processed file to the store, replacing the rows of an earlier version of the file.
+
+        :param file_location: processed json file
+        :return: True if the rows of the file were written, False if the stored rows were already current
+        """
+        file_location = pathlib.Path(file_location)
+        source_bytes = file_location.read_bytes()
+        source_hash = hashlib.sha256(source_bytes).hexdigest()
+        section, program, version = get_file_identity(file_location)
+        with self._connect() as connection:
+            stored_file = connection.execute(
+                'SELECT file_id, source_hash FROM processed_files WHERE section = ? AND program = ? AND version = ?',
+                (section, program, version)).fetchone()
+            if stored_file and stored_file[1] == source_hash:
+                return False
+            if stored_file:
+                connection.execute('DELETE FROM processed_files WHERE file_id = ?', (stored_file[0], ))
+            file_id = connection.execute(
+                'INSERT INTO processed_files (section, program, version, file_location, source_hash) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (section, program, version, str(file_location), source_hash)).lastrowid
+            rows = []
+            for table_name, table in json.loads(source_bytes).items():
+                for path, value in flatten_table(table):
+                    if isinstance(value, numbers.Number) and not isinstance(value, bool):
+                        numeric_value, text_value = value, None
+                    elif value is None or isinstance(value, str):
+                        numeric_value, text_value = None, value
+                    else:
+                        numeric_value, text_value = None, json.dumps(value)
+                    rows.append((
+                        file_id, len(rows), section, program, version, table_name,
+                        path[0] if path else None, '>'.join(path[1:]) if len(path) > 1 else None,
+                        numeric_value, text_value))
+            connection.executemany('INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+        return True
+
+    def update_files(self, file_locations) -> list:
+        """
+        Add processed files to the store
+
+        :param file_locations: processed json files
+        :return: list of the files whose rows were written
+        """
+        return [i for i in file_locations if self.update_file(i)]
+
+    def query(self, section=None, table_name=None, case=None, metric=None, program=None, version=None) -> list:
+        """
+        Query values across programs and versions, e.g. the annual heating of case 600 for every program with
+        query(section='TF', table_name='conditioned_zone_loads_non_free_float', case='600',
+        metric='annual_heating_MWh').  Filters that are not provided match every row.
+
+        :param section: section type (e.g. TF, GC, HE)
+        :param table_name: table key of the processed files
+        :param case: case key
+        :param metric: metric key
+        :param program: program name
+        :param version: program version
+        :return: list of dictionaries with the section, program, version, table, case, metric, and value of each row
+        """
+        filters = {
+            'section': section, 'table_name': table_name, 'case_name': case, 'metric': metric, 'program': program,
+            'version': version}
+        filters = {k: v for k, v in filters.items() if v is not None}
+        sql = 'SELECT section, program, version, table_name, case_name, metric, value, text_value FROM results'
+        if filters:
+            sql += ' WHERE ' + ' AND '.join('{} = ?'.format(k) for k in filters.keys())
+        sql += ' ORDER BY section, program, version, file_id, position'
+        with self._connect() as connection:
+            rows = connection.execute(sql, list(filters.values())).fetchall()
+        return [
+            {
+                'section': row[0], 'program': row[1], 'version': row[2], 'table_name': row[3], 'case': row[4],
+                'metric': row[5], 'value': row[6] if row[7] is None else row[7]}
+            for row in rows]
+
+    def get_result_cube(self, table_name, file_locations, programs) -> ResultCube:
+        """
+        Build the result cube of a {case: {metric: value}} table for a list of processed files from the stored rows.
+        Case and metric labels are ordered by their first appearance, as in ResultCube.from_json_data.
+
+        :param table_name: table key of the processed files
+        :param file_locations: processed json files, which must be in the store
+        :param programs: program labels of the files
+        :return: ResultCube object
+        """
+        cases = {}
+        metrics = {}
+        file_values = []
+        with self._connect() as connection:
+            for file_location in file_locations:
+                rows = connection.execute(
+                    'SELECT case_name, metric, value FROM results JOIN processed_files USING (file_id) '
+                    'WHERE processed_files.section = ? AND processed_files.program = ? '
+                    'AND processed_files.version = ? AND table_name = ? ORDER BY position',
+                    (*get_file_identity(file_location), table_name)).fetchall()
+                for case, metric, _ in rows:
+                    cases.setdefault(case, len(cases))
+                    metrics.setdefault(metric, len(metrics))
+                file_values.append(rows)
+        values = np.full((len(file_values), len(cases), len(metrics)), np.nan)
+        for program_index, rows in enumerate(file_values):
+            for case, metric, value in rows:
+                if value is not None:
+                    values[program_index, cases[case], metrics[metric]] = value
+        return ResultCube(values=values, programs=programs, cases=cases.keys(), metrics=metrics.keys())
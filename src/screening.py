@@ -0,0 +1,180 @@
+import json
+import numbers
+import os
+import pathlib
+import numpy as np
+from src.baseline_cache import read_processed_json
+from src.processed_catalog import ProcessedCatalog, get_file_identity
+from src.processed_sidecar import flatten_table
+
+root_directory = pathlib.Path(__file__).parent.parent.resolve()
+
+# tables that hold descriptions of the program rather than results
+screen_excluded_tables = ('identifying_information', )
+
+
+def _get_numeric_cells(data) -> dict:
+    """
+    Flatten the numeric values of processed json data to cells keyed by table, case, and metric.  The case is the
+    first key of a table, and the metric is the remaining key path joined with '>', or None for {case: value}
+    tables.
+
+    :param data: processed json data
+    :return: dictionary of (table, case, metric) to value
+    """
+    return {
+        (table_name, path[0], '>'.join(path[1:]) or None): value
+        for table_name, table in data.items() if table_name not in screen_excluded_tables
+        for path, value in flatten_table(table)
+        if path and isinstance(value, numbers.Number) and not isinstance(value, bool)}
+
+
+def screen_processed_file(file_location, catalog=None, baseline_cache=None) -> dict:
+    """
+    Compare every numeric cell of a processed file with the range of the baseline (reference program) files of its
+    section, without rendering.  The values of all baselines are gathered into one baselines x cells array, and the
+    minimum, maximum, and mean of every cell are calculated in one pass.
+
+    Cells are classed as inside the reference range, above or below it, or without a reference value.  The deviation
+    of a cell is its distance outside the range (0 inside the range), and is also given as a percentage of the
+    reference mean.
+
+    :param file_location: processed json file of the tested program
+    :param catalog: ProcessedCatalog object used to select the baseline files.  The catalog in the processed
+        directory is used if not provided.
+    :param baseline_cache: BaselineCache object used to read the baseline files.  The files are read directly if not
+        provided.
+    :return: dictionary of the file, section, baseline model names, a summary of the cell counts, and the counts and
+        cells outside the reference range of each table
+    """
+    file_location = pathlib.Path(file_location)
+    catalog = catalog or ProcessedCatalog()
+    section_type, _, _ = get_file_identity(file_location)
+    baseline_files = catalog.get_baseline_files(section_type)
+    baseline_model_names = ['-'.join([i.parts[-3], i.parts[-2]]) for i in baseline_files]
+    tested_cells = _get_numeric_cells(read_processed_json(file_location))
+    cell_keys = list(tested_cells.keys())
+    tested_values = np.array([tested_cells[i] for i in cell_keys], dtype=float)
+    baseline_values = np.full((len(baseline_files), len(cell_keys)), np.nan)
+    for baseline_index, (baseline_file, baseline_model_name) in enumerate(zip(baseline_files, baseline_model_names)):
+        if baseline_cache is None:
+            baseline_data = read_processed_json(baseline_file)
+        else:
+            baseline_data = baseline_cache.load(baseline_file, baseline_model_name, [])['json']
+        baseline_cells = _get_numeric_cells(baseline_data)
+        baseline_values[baseline_index] = [baseline_cells.get(i, np.nan) for i in cell_keys]
+    reference_counts = np.sum(~np.isnan(baseline_values), axis=0)
+    no_reference = reference_counts == 0
+    # missing values are left out of the reductions, and cells without any reference value are set to NaN
+    reference_minimums = np.fmin.reduce(baseline_values, axis=0, initial=np.inf, where=~np.isnan(baseline_values))
+    reference_maximums = np.fmax.reduce(baseline_values, axis=0, initial=-np.inf, where=~np.isnan(baseline_values))
+    reference_minimums[no_reference] = np.nan
+    reference_maximums[no_reference] = np.nan
+    with np.errstate(invalid='ignore', divide='ignore'):
+        reference_means = np.nansum(baseline_values, axis=0) / reference_counts
+        below_range = tested_values < reference_minimums
+        above_range = tested_values > reference_maximums
+        deviations = np.where(
+            below_range, tested_values - reference_minimums,
+            np.where(above_range, tested_values - reference_maximums, 0.0))
+        deviation_percents = 100 * deviations / np.abs(reference_means)
+    outside_range = below_range | above_range
+    tables = {}
+    for cell_index, (table_name, case, metric) in enumerate(cell_keys):
+        table_summary = tables.setdefault(
+            table_name, {'cells': 0, 'inside': 0, 'outside': 0, 'no_reference': 0, 'outside_cells': []})
+        table_summary['cells'] += 1
+        if no_reference[cell_index]:
+            table_summary['no_reference'] += 1
+        elif outside_range[cell_index]:
+            table_summary['outside'] += 1
+            table_summary['outside_cells'].append({
+                'case': case,
+                'metric': metric,
+                'value': tested_values[cell_index].item(),
+                'min': reference_minimums[cell_index].item(),
+                'max': reference_maximums[cell_index].item(),
+                'deviation': deviations[cell_index].item(),
+                'deviation_percent': (
+                    deviation_percents[cell_index].item() if np.isfinite(deviation_percents[cell_index]) else None)})
+        else:
+            table_summary['inside'] += 1
+    try:
+        file_key = file_location.resolve().relative_to(root_directory).as_posix()
+    except ValueError:
+        file_key = file_location.as_posix()
+    return {
+        'file': file_key,
+        'section': section_type,
+        'model_name': '-'.join([file_location.parts[-3], file_location.parts[-2]]),
+        'baselines': baseline_model_names,
+        'summary': {
+            'cells': len(cell_keys),
+            'inside': int(np.sum(~outside_range & ~no_reference)),
+            'outside': int(np.sum(outside_range)),
+            'no_reference': int(np.sum(no_reference))},
+        'tables': tables}
+
+
+def get_screen_markdown(screen_result) -> str:
+    """
+    Format a screening result as markdown, with the cell counts of each table and a table of the cells outside the
+    reference range.
+
+    :param screen_result: dictionary returned by screen_processed_file
+    :return: markdown text
+    """
+    lines = [
+        '# Screening summary: {} ({})'.format(screen_result['model_name'], screen_result['section']),
+        '',
+        'Reference programs: {}'.format(', '.join(screen_result['baselines']) or 'none'),
+        '',
+        '| Table | Cells | Inside | Outside | No reference |',
+        '| --- | ---: | ---: | ---: | ---: |']
+    for table_name, table_summary in list(screen_result['tables'].items()) + [('Total', screen_result['summary'])]:
+        lines.append('| {} | {} | {} | {} | {} |'.format(
+            table_name, table_summary['cells'], table_summary['inside'], table_summary['outside'],
+            table_summary['no_reference']))
+    outside_cells = [
+        (table_name, i) for table_name, table_summary in screen_result['tables'].items()
+        for i in table_summary['outside_cells']]
+    if outside_cells:
+        lines.extend([
+            '',
+            '## Cells outside the reference range',
+            '',
+            '| Table | Case | Metric | Value | Min | Max | Deviation | Deviation (% of mean) |',
+            '| --- | --- | --- | ---: | ---: | ---: | ---: | ---: |'])
+        for table_name, cell in outside_cells:
+            lines.append('| {} | {} | {} | {:.4g} | {:.4g} | {:.4g} | {:+.4g} | {} |'.format(
+                table_name, cell['case'], cell['metric'] or '', cell['value'], cell['min'], cell['max'],
+                cell['deviation'],
+                '' if cell['deviation_percent'] is None else '{:+.1f}'.format(cell['deviation_percent'])))
+    return '\n'.join(lines) + '\n'
+
+
+def write_screen_summary(screen_result, output_directory=None) -> tuple:
+    """
+    Write a screening result as json and markdown files, named screen_<section>.json and screen_<section>.md.
+
+    :param screen_result: dictionary returned by screen_processed_file
+    :param output_directory: directory of the summary files.  Defaults to the rendered directory of the file,
+        rendered/images/<software-name>/<version>.
+    :return: tuple of the json and markdown file locations
+    """
+    if output_directory is None:
+        file_parts = pathlib.PurePosixPath(screen_result['file']).parts
+        output_directory = root_directory.joinpath('rendered', 'images', file_parts[-3].lower(), file_parts[-2].lower())
+    output_directory = pathlib.Path(output_directory)
+    output_directory.mkdir(parents=True, exist_ok=True)
+    file_stem = '_'.join(['screen', screen_result['section'].lower()])
+    json_file_location = output_directory.joinpath(file_stem + '.json')
+    markdown_file_location = output_directory.joinpath(file_stem + '.md')
+    for file_location, text in [
+            (json_file_location, json.dumps(screen_result, indent=4)),
+            (markdown_file_location, get_screen_markdown(screen_result))]:
+        temporary_file_location = file_location.with_name('.'.join([file_location.name, str(os.getpid()), 'tmp']))
+        with open(temporary_file_location, 'w') as f:
+            f.write(text)
+        temporary_file_location.replace(file_location)
+    return json_file_location, markdown_file_location
@@ -0,0 +1,86 @@
+import argparse
+import json
+import pathlib
+import statistics
+import subprocess
+import sys
+import time
+
+root_directory = pathlib.Path(__file__).parent.parent.resolve()
+
+# pipeline stages in the order a full run imports them.  Each stage is timed after the stages before it, so that its
+# time is the import cost it adds.
+startup_stages = {
+    'cli': 'import main',
+    'ingest': 'from input_processor import InputProcessor',
+    'plotting': 'import matplotlib; matplotlib.use("Agg"); import matplotlib.font_manager',
+    'renderer': 'main.load_renderer()'}
+
+stage_timer = """
+import json, sys, time
+sys.path.insert(0, {src_directory!r})
+timings = {{}}
+for stage_name, stage_code in {stages!r}.items():
+    start_time = time.perf_counter()
+    exec(stage_code)
+    timings[stage_name] = time.perf_counter() - start_time
+print(json.dumps(timings))
+"""
+
+
+def run_startup_benchmark(repeat=5, stages=None) -> dict:
+    """
+    Time the interpreter start up and the imports of each pipeline stage, each in a new interpreter so that
+    modules are imported cold.
+
+    :param repeat: number of interpreters started for each measurement
+    :param stages: dictionary of stage name to the code that imports it.  Defaults to startup_stages.
+    :return: dictionary of measurement name to a dictionary of the median and minimum time in seconds
+    """
+    stages = stages or startup_stages
+    timings = {'interpreter': []}
+    timings.update({i: [] for i in stages.keys()})
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        subprocess.run([sys.executable, '-c', 'pass'], check=True)
+        timings['interpreter'].append(time.perf_counter() - start_time)
+        completed_process = subprocess.run(
+            [sys.executable, '-c', stage_timer.format(src_directory=str(root_directory.joinpath('src')), stages=stages)],
+            capture_output=True, text=True, check=True, cwd=root_directory)
+        for stage_name, stage_time in json.loads(completed_process.stdout.splitlines()[-1]).items():
+            timings[stage_name].append(stage_time)
+    return {
+        measurement_name: {'median': statistics.median(measurement_times), 'minimum': min(measurement_times)}
+        for measurement_name, measurement_times in timings.items()}
+
+
+def build_parser():
+    """
+    Build argument parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog='ASHRAE 140 Automation startup benchmark',
+        description='Time the imports of each pipeline stage of the command line program')
+    parser.add_argument(
+        '--repeat',
+        '-r',
+        type=int,
+        default=5,
+        help='Number of interpreters started for each measurement.')
+    parser.add_argument(
+        '--output',
+        '-o',
+        help='Json file to write the timings to, e.g. to track them between runs.')
+    return parser
+
+
+if __name__ == "__main__":
+    benchmark_args = build_parser().parse_args()
+    benchmark_results = run_startup_benchmark(repeat=benchmark_args.repeat)
+    print('{:<12} {:>10} {:>10}'.format('stage', 'median (s)', 'min (s)'))
+    for benchmark_name, benchmark_timings in benchmark_results.items():
+        print('{:<12} {:>10.3f} {:>10.3f}'.format(
+            benchmark_name, benchmark_timings['median'], benchmark_timings['minimum']))
+    if benchmark_args.output:
+        with open(benchmark_args.output, 'w') as f:
+            json.dump(benchmark_results, f, indent=4)
@@ -0,0 +1,77 @@
+import logging
+import pandas as pd
+
+
+class ValidationEvents:
+    """
+    Collection of the validation failures found while cleansing the tables of an input file.  Each event records
+    the table, check, and column, with the row indices and values that failed, so that the failed rows are only
+    rendered to text when a report is requested with get_report().
+
+    Events are dictionaries of:
+        table_name - table being cleansed, set by the caller through the table_name attribute
+        check - name of the check that failed, e.g. cases, months, numeric, limits
+        column - column that was checked
+        message - description of the failure and the action taken
+        level - logging level of the failure
+        row_index - index labels of the failed rows
+        values - values of the failed rows in the checked column
+    """
+
+    def __init__(self):
+        self.events = []
+        # table of the events added, which is set before each table is cleansed
+        self.table_name = None
+        return
+
+    def __repr__(self):
+        rep = 'ValidationEvents(events=' + str(len(self.events)) + ')'
+        return rep
+
+    def __len__(self):
+        return len(self.events)
+
+    def __iter__(self):
+        return iter(self.events)
+
+    def __str__(self):
+        return self.get_report()
+
+    def add(self, check, column, message, row_index=(), values=(), level=logging.ERROR) -> dict:
+        """
+        Record a validation failure
+
+        :param check: name of the check that failed
+        :param column: column that was checked
+        :param message: description of the failure and the action taken
+        :param row_index: index labels of the failed rows
+        :param values: values of the failed rows in the checked column
+        :param level: logging level of the failure
+        :return: validation event
+        """
+        event = {
+            'table_name': self.table_name,
+            'check': check,
+            'column': column,
+            'message': message,
+            'level': level,
+            'row_index': list(row_index),
+            'values': list(values)}
+        self.events.append(event)
+        return event
+
+    def get_report(self) -> str:
+        """
+        Render the validation events to text, with a table of the failed rows of each event
+
+        :return: report text
+        """
+        report_sections = []
+        for event in self.events:
+            report_sections.append('{} - {} ({}): {}'.format(
+                logging.getLevelName(event['level']), event['table_name'], event['column'], event['message']))
+            if event['row_index']:
+                report_sections.append(
+                    pd.Series(event['values'], index=event['row_index'], name=event['column'], dtype=object)
+                    .to_string())
+        return '\n'.join(report_sections)
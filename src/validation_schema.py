@@ -0,0 +1,305 @@
+import functools
+import json
+import logging
+import pathlib
+import numpy as np
+import pandas as pd
+from custom_exceptions import ASHRAE140ProcessingError
+from src.validation_events import ValidationEvents
+
+root_directory = pathlib.Path(__file__).parent.parent.resolve()
+
+default_schema_location = root_directory.joinpath('src', 'validation_schema.json')
+
+# supported aggregates of consistency checks, and the description of a failure of each comparison
+consistency_aggregates = ('sum', 'max', 'min', 'mean')
+consistency_comparisons = {
+    'equal': 'does not match',
+    'less_equal': 'exceeds',
+    'greater_equal': 'is less than'}
+
+
+class TablePlan:
+    """
+    Compiled validation plan of one table of the validation schema.  The numeric columns and their limits are held
+    as arrays, so that every numeric column of a table is coerced and checked in one array operation.
+
+    :param table_name: table key of the validation schema
+    :param section_type: section type (e.g. TF, GC, HE)
+    :param table_schema: table entry of the validation schema
+    :param valid_cases: valid case identifiers of the section, or None if cases are not checked
+    :param valid_months: valid month identifiers
+    """
+
+    def __init__(self, table_name, section_type, table_schema, valid_cases=None, valid_months=()):
+        self.table_name = table_name
+        self.section_type = section_type
+        self.case_column = None
+        self.month_column = None
+        self.numeric_columns = []
+        limits = []
+        for column_name, column_schema in table_schema.get('columns', {}).items():
+            column_type = column_schema.get('type', 'numeric')
+            if column_type == 'case':
+                self.case_column = column_name
+            elif column_type == 'month':
+                self.month_column = column_name
+            elif column_type == 'numeric':
+                self.numeric_columns.append(column_name)
+                limits.append((
+                    column_schema.get('lower_limit', -float("inf")), column_schema.get('upper_limit', float("inf"))))
+            else:
+                raise ASHRAE140ProcessingError(
+                    'Column type ({}) of {} in the {} validation schema is not supported'.format(
+                        column_type, column_name, table_name))
+        self.lower_limits, self.upper_limits = np.array(limits, dtype=float).reshape(-1, 2).T
+        self.valid_cases = None if valid_cases is None else frozenset(valid_cases)
+        self.valid_months = frozenset(valid_months)
+        self.processed_table = table_schema.get('processed_table')
+        self.processed_path = table_schema.get('processed_path')
+        return
+
+    def __repr__(self):
+        rep = 'TablePlan(table_name=' + str(self.table_name) + ', section_type=' + str(self.section_type) + ')'
+        return rep
+
+    def check_numeric(self, df, column_names=None):
+        """
+        Coerce the numeric columns of a dataframe and compare them against their limits.  Values are truncated to
+        integers before the limits are compared, and values that are missing or not numeric fail the limits.
+
+        :param df: pandas DataFrame to check
+        :param column_names: numeric columns of the plan to check.  Defaults to every numeric column of the plan that
+            is in the dataframe.
+        :return: tuple of the checked column names, the coerced pandas DataFrame of those columns, and boolean arrays
+            (rows x columns) of the values that are not numeric and the values that fail the limits
+        """
+        if column_names is None:
+            column_names = [i for i in self.numeric_columns if i in df.columns]
+        column_indices = [self.numeric_columns.index(i) for i in column_names]
+        numeric_df = df[column_names].apply(pd.to_numeric, errors='coerce')
+        numeric_values = numeric_df.to_numpy(dtype=float)
+        failed_numeric = np.isnan(numeric_values)
+        lower_limits = self.lower_limits[column_indices]
+        upper_limits = self.upper_limits[column_indices]
+        with np.errstate(invalid='ignore'):
+            truncated_values = np.trunc(numeric_values)
+            failed_limits = ~((lower_limits <= truncated_values) & (truncated_values <= upper_limits))
+        return column_names, numeric_df, failed_numeric, failed_limits
+
+    def get_processed_frame(self, table_data, column_names=None) -> pd.DataFrame:
+        """
+        Convert a table of a processed json file to a dataframe of the plan columns by following the processed path
+        of the plan.  Path items in braces bind the json key at that level to a column of that name, and other items
+        must match the json key.  The {column} item binds the key to the numeric column the value belongs to.  Tables
+        with a single numeric column may omit it, in which case the values at the end of the path are that column.
+
+        :param table_data: table of a processed json file
+        :param column_names: columns to read.  Defaults to the numeric columns of the plan.
+        :return: pandas DataFrame with one row for each set of bound keys, indexed by the bound keys
+        """
+        column_names = self.numeric_columns if column_names is None else column_names
+        default_column = self.numeric_columns[0] if len(self.numeric_columns) == 1 else None
+        rows = {}
+        for bindings, value in _walk_processed_path(table_data, self.processed_path or [], {}):
+            column_name = bindings.pop('column', default_column)
+            if column_name not in column_names:
+                continue
+            rows.setdefault(tuple(bindings.values()), dict(bindings))[column_name] = value
+        return pd.DataFrame(list(rows.values()), index=list(rows.keys()), dtype=object)
+
+
+def _walk_processed_path(data, path, bindings):
+    if not path:
+        yield bindings, data
+        return
+    if not isinstance(data, dict):
+        return
+    path_item, remaining_path = path[0], path[1:]
+    if path_item.startswith('{') and path_item.endswith('}'):
+        for key, value in data.items():
+            yield from _walk_processed_path(value, remaining_path, {**bindings, path_item[1:-1]: key})
+    elif path_item in data:
+        yield from _walk_processed_path(data[path_item], remaining_path, bindings)
+    return
+
+
+class ValidationSchema:
+    """
+    Declarative description of the tables of each section, compiled into a TablePlan for each table.  The schema file
+    is json formatted as:
+        valid_months - list of valid month identifiers
+        sections - dictionary of section type (e.g. TF, GC, HE) to:
+            valid_cases - list of valid case identifiers, or null if cases are not checked
+            tables - dictionary of table name to:
+                columns - dictionary of column name to a dictionary of:
+                    type - case, month, or numeric
+                    lower_limit, upper_limit - limits of numeric columns, which default to no limit
+                processed_table (optional) - top level key of the table in processed json files
+                processed_path (optional) - path of the values in the processed table, see
+                    TablePlan.get_processed_frame
+            consistency_checks (optional) - dictionary of check name to a comparison between two tables of the
+                section, see check_consistency, formatted as:
+                    table, column - values that are aggregated for each key
+                    aggregate - sum, max, min, or mean
+                    scale - factor applied to the aggregated values, e.g. 0.001 for kWh to MWh.  Defaults to 1.
+                    compare_table, compare_column - values compared against, with one value for each key
+                    comparison - equal, less_equal, or greater_equal
+                    key - path binding the values are grouped and compared by.  Defaults to case.
+                    relative_tolerance, absolute_tolerance - allowed difference, relative to the compared value and
+                        absolute.  Default to 0.
+
+    :param schema_location: location of the schema file.  Defaults to validation_schema.json in the src directory.
+    """
+
+    def __init__(self, schema_location=None):
+        self.schema_location = pathlib.Path(schema_location or default_schema_location)
+        with open(self.schema_location, 'r') as f:
+            self.schema = json.load(f)
+        self.valid_months = frozenset(self.schema.get('valid_months', []))
+        self.valid_cases = {}
+        self.plans = {}
+        self.consistency_checks = {}
+        for section_type, section_schema in self.schema.get('sections', {}).items():
+            valid_cases = section_schema.get('valid_cases')
+            self.valid_cases[section_type] = None if valid_cases is None else frozenset(valid_cases)
+            for table_name, table_schema in section_schema.get('tables', {}).items():
+                self.plans[(section_type, table_name)] = TablePlan(
+                    table_name=table_name,
+                    section_type=section_type,
+                    table_schema=table_schema,
+                    valid_cases=valid_cases,
+                    valid_months=self.valid_months)
+            self.consistency_checks[section_type] = {}
+            for check_name, check_schema in section_schema.get('consistency_checks', {}).items():
+                consistency_check = {
+                    'aggregate': 'sum', 'scale': 1, 'key': 'case', 'relative_tolerance': 0, 'absolute_tolerance': 0,
+                    **check_schema}
+                if consistency_check['aggregate'] not in consistency_aggregates or \
+                        consistency_check['comparison'] not in consistency_comparisons:
+                    raise ASHRAE140ProcessingError(
+                        'Consistency check ({}) of the {} validation schema is not supported'.format(
+                            check_name, section_type))
+                self.consistency_checks[section_type][check_name] = consistency_check
+        return
+
+    def __repr__(self):
+        rep = 'ValidationSchema(schema_location=' + str(self.schema_location) + ')'
+        return rep
+
+    def get_plan(self, section_type, table_name) -> TablePlan:
+        """
+        Get the compiled plan of a table
+
+        :param section_type: section type (e.g. TF, GC, HE)
+        :param table_name: table key of the validation schema
+        :return: TablePlan object
+        """
+        try:
+            return self.plans[(section_type, table_name)]
+        except KeyError:
+            raise ASHRAE140ProcessingError(
+                'Table ({}) was not found in the {} validation schema'.format(table_name, section_type))
+
+    def check_processed_data(self, data, section_type, validation_events=None) -> ValidationEvents:
+        """
+        Check the values of processed json data against the numeric columns of the schema tables of its section.
+        Missing values are not reported, since they were reported and removed when the input file was processed.
+
+        :param data: processed json data
+        :param section_type: section type (e.g. TF, GC, HE)
+        :param validation_events: ValidationEvents object to add the failures to
+        :return: ValidationEvents object
+        """
+        validation_events = ValidationEvents() if validation_events is None else validation_events
+        for (plan_section_type, _), plan in self.plans.items():
+            if plan_section_type != section_type or not plan.processed_path or plan.processed_table not in data:
+                continue
+            df = plan.get_processed_frame(data[plan.processed_table])
+            if df.empty:
+                continue
+            column_names, numeric_df, failed_numeric, failed_limits = plan.check_numeric(df)
+            present_values = df[column_names].notnull().to_numpy()
+            validation_events.table_name = plan.processed_table
+            for column_index, column_name in enumerate(column_names):
+                for check, failed_values, message in [
+                        ('numeric', failed_numeric, 'Values did not appear to be numeric'),
+                        ('limits', failed_limits, 'Values were outside of the limits of the validation schema')]:
+                    failed_rows = failed_values[:, column_index] & present_values[:, column_index]
+                    if failed_rows.any():
+                        validation_events.add(
+                            check, column_name, message, df.index[failed_rows], df[column_name][failed_rows])
+        validation_events.table_name = None
+        return validation_events
+
+    def _get_keyed_values(self, data, section_type, table_name, column_name, key) -> pd.Series:
+        table_plan = self.get_plan(section_type, table_name)
+        if not table_plan.processed_path or table_plan.processed_table not in data:
+            return None
+        df = table_plan.get_processed_frame(data[table_plan.processed_table], column_names=[column_name, ])
+        if column_name not in df.columns or key not in df.columns:
+            return None
+        return pd.Series(pd.to_numeric(df[column_name], errors='coerce').to_numpy(dtype=float), index=df[key])
+
+    def check_consistency(self, data, section_type, validation_events=None) -> ValidationEvents:
+        """
+        Check that the tables of processed json data are consistent with each other, e.g. that the monthly heating
+        loads of a case sum to its annual heating load.  For each consistency check of the section, the values of
+        the table are aggregated for each key and compared against the values of the compared table in one array
+        operation.  Keys with missing values in either table are not compared, and checks of tables that are not in
+        the data are skipped.
+
+        :param data: processed json data
+        :param section_type: section type (e.g. TF, GC, HE)
+        :param validation_events: ValidationEvents object to add the failures to
+        :return: ValidationEvents object with an event for each failed check, holding the keys that failed and the
+            aggregated and compared values of each key
+        """
+        validation_events = ValidationEvents() if validation_events is None else validation_events
+        for check_name, consistency_check in self.consistency_checks.get(section_type, {}).items():
+            values = self._get_keyed_values(
+                data, section_type, consistency_check['table'], consistency_check['column'], consistency_check['key'])
+            compare_values = self._get_keyed_values(
+                data, section_type, consistency_check['compare_table'], consistency_check['compare_column'],
+                consistency_check['key'])
+            if values is None or compare_values is None:
+                continue
+            grouped_values = values.groupby(level=0, sort=False)
+            aggregated_values = grouped_values.agg(consistency_check['aggregate'])
+            # keys with a missing value are not compared, rather than compared with a partial aggregate
+            aggregated_values[values.isnull().groupby(level=0, sort=False).any()] = np.nan
+            aggregated_values = aggregated_values * consistency_check['scale']
+            compare_values = compare_values[~compare_values.index.duplicated()].reindex(aggregated_values.index)
+            differences = aggregated_values.to_numpy() - compare_values.to_numpy()
+            tolerances = consistency_check['absolute_tolerance'] + consistency_check['relative_tolerance'] * np.abs(
+                compare_values.to_numpy())
+            with np.errstate(invalid='ignore'):
+                if consistency_check['comparison'] == 'equal':
+                    failed_keys = np.abs(differences) > tolerances
+                elif consistency_check['comparison'] == 'less_equal':
+                    failed_keys = differences > tolerances
+                else:
+                    failed_keys = -differences > tolerances
+            if failed_keys.any():
+                validation_events.table_name = consistency_check['table']
+                validation_events.add(
+                    check_name, consistency_check['column'], '{} of {} {} {} of {}'.format(
+                        consistency_check['aggregate'], consistency_check['column'],
+                        consistency_comparisons[consistency_check['comparison']],
+                        consistency_check['compare_column'], consistency_check['compare_table']),
+                    aggregated_values.index[failed_keys],
+                    zip(aggregated_values[failed_keys], compare_values[failed_keys]),
+                    level=logging.WARNING)
+        validation_events.table_name = None
+        return validation_events
+
+
+@functools.lru_cache(maxsize=None)
+def get_validation_schema(schema_location=None) -> ValidationSchema:
+    """
+    Get the compiled validation schema, which is read and compiled once per process.
+
+    :param schema_location: location of the schema file.  Defaults to validation_schema.json in the src directory.
+    :return: ValidationSchema object
+    """
+    return ValidationSchema(schema_location=schema_location)
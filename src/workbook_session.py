@@ -0,0 +1,168 @@
+import numpy as np
+import openpyxl
+import pandas as pd
+from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+from openpyxl.utils import column_index_from_string
+from pandas.io.parsers import TextParser
+from custom_exceptions import ASHRAE140ProcessingError
+
+
+class WorkbookSession:
+    """
+    Hold the cell grid of an Excel workbook in memory so that every data source region is read from a single pass
+    over the file.
+
+    Each sheet referenced by the requested regions is streamed once in read-only mode, up to the last row needed by
+    any of those regions.  Regions are then served as dataframes sliced from that grid, using the same parsing rules
+    as pd.read_excel.
+
+    :param file_location: location of the workbook
+    :param data_sources: data extraction instructions, formatted as described in SetDataSources
+    """
+
+    def __init__(self, file_location, data_sources):
+        self.file_location = file_location
+        self.data_sources = data_sources
+        # converted cell values for each loaded sheet, stored as a list of rows
+        self.grid = {}
+        return
+
+    def __repr__(self):
+        rep = 'WorkbookSession(' \
+              'file_location=' + str(self.file_location) + \
+              ')'
+        return rep
+
+    def _get_data_source(self, region_name):
+        """
+        Unpack the data extraction instructions for a region
+
+        :param region_name: Named section of data in the data_sources object.
+        :return: tab, start row, columns, number of rows, and pd.read_excel keyword arguments
+        """
+        try:
+            data_source = self.data_sources[region_name]
+        except KeyError:
+            raise ASHRAE140ProcessingError('Data extraction instructions for the {} section were not found'
+                                           .format(region_name))
+        data_tab, skip_rows, excel_cols, n_rows, kwargs = [*list(data_source) + [{}] * 5][:5]
+        return data_tab, skip_rows, excel_cols, n_rows, {'header': 0, **kwargs}
+
+    def _get_rows_needed(self, region_name):
+        """
+        Get the number of sheet rows that must be read to parse a region, including skipped and header rows.
+
+        :param region_name: Named section of data in the data_sources object.
+        :return: number of rows from the top of the sheet
+        """
+        _, skip_rows, _, n_rows, kwargs = self._get_data_source(region_name)
+        header_rows = 1 if kwargs['header'] is None else 1 + kwargs['header']
+        return skip_rows + header_rows + n_rows
+
+    @staticmethod
+    def _convert_cell(cell):
+        """
+        Convert an openpyxl cell to the value pd.read_excel would produce for it.
+
+        :param cell: openpyxl cell object
+        :return: converted cell value
+        """
+        if cell.value is None:
+            return ''
+        elif cell.data_type == TYPE_ERROR:
+            return np.nan
+        elif cell.data_type == TYPE_NUMERIC:
+            value = int(cell.value)
+            if value == cell.value:
+                return value
+            return float(cell.value)
+        return cell.value
+
+    @staticmethod
+    def _get_column_indices(excel_cols):
+        """
+        Convert an Excel column range (e.g. 'B:L' or 'A,C:D') into a list of zero-based column indices
+
+        :param excel_cols: Excel column range string
+        :return: list of column indices
+        """
+        if not isinstance(excel_cols, str):
+            return excel_cols
+        column_indices = []
+        for column_range in excel_cols.split(','):
+            if ':' in column_range:
+                start, end = column_range.split(':')
+                column_indices.extend(range(
+                    column_index_from_string(start.strip()) - 1,
+                    column_index_from_string(end.strip())))
+            else:
+                column_indices.append(column_index_from_string(column_range.strip()) - 1)
+        return column_indices
+
+    def load(self, region_names=None):
+        """
+        Open the workbook once and read every sheet range needed by the requested regions into memory.
+
+        :param region_names: regions to load.  All data sources are loaded if not provided.
+        :return: Updated grid class object
+        """
+        if region_names is None:
+            region_names = list(self.data_sources.keys())
+        rows_by_sheet = {}
+        for region_name in region_names:
+            data_tab = self._get_data_source(region_name)[0]
+            rows_by_sheet[data_tab] = max(rows_by_sheet.get(data_tab, 0), self._get_rows_needed(region_name))
+        # skip sheets that have already been read deep enough
+        rows_by_sheet = {
+            data_tab: rows_needed for data_tab, rows_needed in rows_by_sheet.items()
+            if len(self.grid.get(data_tab, [])) < rows_needed}
+        if not rows_by_sheet:
+            return self
+        workbook = openpyxl.load_workbook(self.file_location, read_only=True, data_only=True, keep_links=False)
+        try:
+            for data_tab, rows_needed in rows_by_sheet.items():
+                try:
+                    sheet = workbook[data_tab]
+                except KeyError:
+                    raise ASHRAE140ProcessingError('Worksheet ({}) was not found in {}'
+                                                   .format(data_tab, str(self.file_location)))
+                sheet.reset_dimensions()
+                rows = []
+                for row in sheet.iter_rows(max_row=rows_needed):
+                    converted_row = [self._convert_cell(cell) for cell in row]
+                    # trim trailing empty elements
+                    while converted_row and converted_row[-1] == '':
+                        converted_row.pop()
+                    rows.append(converted_row)
+                self.grid[data_tab] = rows
+        finally:
+            workbook.close()
+        return self
+
+    def get_region(self, region_name) -> pd.DataFrame:
+        """
+        Retrieve a section of the in-memory grid and return it as a pandas dataframe
+
+        :param region_name: Named section of data in the data_sources object.
+        :return: Section of excel file converted to dataframe
+        """
+        data_tab, skip_rows, excel_cols, n_rows, kwargs = self._get_data_source(region_name)
+        rows_needed = self._get_rows_needed(region_name)
+        if len(self.grid.get(data_tab, [])) < rows_needed:
+            self.load([region_name, ])
+        data = self.grid[data_tab][:rows_needed]
+        # Trim trailing empty rows and extend rows to the same width, as pd.read_excel does
+        last_row_with_data = max([idx for idx, row in enumerate(data) if row], default=-1)
+        data = data[:last_row_with_data + 1]
+        if not data:
+            return pd.DataFrame()
+        max_width = max(len(row) for row in data)
+        data = [row + [''] * (max_width - len(row)) for row in data]
+        parser = TextParser(
+            data,
+            skiprows=skip_rows,
+            nrows=n_rows,
+            usecols=self._get_column_indices(excel_cols),
+            skip_blank_lines=False,
+            **kwargs)
+        return parser.read(nrows=n_rows)
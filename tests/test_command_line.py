@@ -0,0 +1,33 @@
+import logging.handlers
+import subprocess
+import unittest
+import pathlib
+import sys
+
+this_script_path = pathlib.Path(__file__)
+sys.path.append(str(this_script_path.parent.parent.joinpath('src', )))
+from logger import Logger, configure_logging
+
+
+class TestCommandLine(unittest.TestCase):
+    """
+    Test the start up and logging of the command line program
+    """
+
+    def test_logging_is_configured_once_with_queued_file_handlers(self):
+        logging_configuration = configure_logging()
+        file_logger = Logger(logger_name='file_logger').logger
+        file_handlers = list(file_logger.handlers)
+        Logger(logger_name='file_logger')
+        self.assertIs(configure_logging(), logging_configuration)
+        self.assertEqual(file_logger.handlers, file_handlers)
+        self.assertTrue(all(isinstance(i, logging.handlers.QueueHandler) for i in file_handlers))
+        return
+
+    def test_command_line_starts_without_plotting_modules(self):
+        completed_process = subprocess.run(
+            [sys.executable, '-c', 'import sys; sys.path.insert(0, "src"); import main; '
+                                   'print(sorted({"pandas", "numpy", "matplotlib", "plotly"} & set(sys.modules)))'],
+            cwd=this_script_path.parent.parent, capture_output=True, text=True, check=True)
+        self.assertEqual(completed_process.stdout.strip(), '[]')
+        return
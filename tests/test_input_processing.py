@@ -4,13 +4,18 @@ import tempfile
 import pathlib
 import sys
 from argparse import Namespace
+import pandas as pd
 
 this_script_path = pathlib.Path(__file__)
 sys.path.append(str(this_script_path.parent.parent.joinpath('src', )))
-from src.main import main
+from src.main import main, process_input_file, process_input_files
 from src.input_processor import InputProcessor
 from src.descriptors import ASHRAE140FileNotFoundError
 from src.input_processor import ASHRAE140TypeError
+from src.excel_processor import ExcelProcessor
+from src.data_cleanser import DataCleanser
+from src.validation_schema import ValidationSchema, ASHRAE140ProcessingError
+from src.ingest_cache import IngestCache
 
 
 class TestInputProcessor(unittest.TestCase):
@@ -72,3 +77,181 @@ class TestInputProcessor(unittest.TestCase):
             with tempfile.NamedTemporaryFile(suffix='.xlssxm') as tf:
                 InputProcessor(input_file_location=tf.name)
         return
+
+    def test_workbook_regions_match_read_excel(self):
+        ep = ExcelProcessor(file_location='input/EnergyPlus/9.0.1/Std140_TF_output.xlsx')
+        for region_name, data_source in ep.data_sources.items():
+            data_tab, skip_rows, excel_cols, n_rows, kwargs = [*list(data_source) + [{}] * 5][:5]
+            expected_df = pd.read_excel(
+                ep.file_location,
+                sheet_name=data_tab,
+                skiprows=skip_rows,
+                usecols=excel_cols,
+                nrows=n_rows,
+                **kwargs)
+            pd.testing.assert_frame_equal(ep._get_data(region_name), expected_df)
+        return
+
+    def test_selected_tables_only_are_extracted(self):
+        ep = ExcelProcessor(
+            file_location='input/EnergyPlus/9.0.1/Std140_TF_output.xlsx',
+            tables=['monthly_conditioned_zone_loads', ])
+        self.assertEqual(ep.test_data, {})
+        ep.run()
+        self.assertEqual(list(ep.test_data.keys()), ['monthly_conditioned_zone_loads', ])
+        # only the rows down to the end of the requested region are read
+        self.assertEqual(len(ep.workbook.grid['YourData']), 201)
+        return
+
+    def test_unknown_tables_only_fail_the_file(self):
+        with tempfile.TemporaryDirectory() as cache_directory:
+            for ingest_cache in [None, IngestCache(cache_directory=cache_directory)]:
+                ip = InputProcessor(
+                    input_file_location='input/EnergyPlus/9.0.1/Std140_TF_output.xlsx',
+                    tables=['not_a_table', ],
+                    ingest_cache=ingest_cache,
+                    logger_level='CRITICAL',
+                    logger_name='console_only_logger')
+                with self.assertRaises(ASHRAE140ProcessingError):
+                    ip.run()
+            self.assertIsNone(process_input_file(
+                'input/EnergyPlus/9.0.1/Std140_TF_output.xlsx',
+                logger_level='CRITICAL',
+                logger_name='console_only_logger',
+                tables=['not_a_table', ]))
+        return
+
+    def test_ingest_cache_serves_repeat_runs(self):
+        with tempfile.TemporaryDirectory() as cache_directory:
+            ingest_cache = IngestCache(cache_directory=cache_directory)
+            ep = ExcelProcessor(
+                file_location='input/EnergyPlus/9.0.1/Std140_TF_output.xlsx',
+                ingest_cache=ingest_cache)
+            ep.run()
+            cached_ep = ExcelProcessor(
+                file_location='input/EnergyPlus/9.0.1/Std140_TF_output.xlsx',
+                ingest_cache=ingest_cache)
+            cached_ep.run()
+            self.assertEqual(cached_ep.test_data, ep.test_data)
+            # the workbook is not read when the tables are served from the cache
+            self.assertEqual(cached_ep.workbook.grid, {})
+        return
+
+    def test_ingest_cache_keeps_validation_events(self):
+        with tempfile.TemporaryDirectory() as cache_directory:
+            ingest_cache = IngestCache(cache_directory=cache_directory)
+            ep = ExcelProcessor(
+                file_location='input/BSIMAC/9.9.0.7.4/Std140_TF_output.xlsx',
+                ingest_cache=ingest_cache)
+            ep.run()
+            cached_ep = ExcelProcessor(
+                file_location='input/BSIMAC/9.9.0.7.4/Std140_TF_output.xlsx',
+                ingest_cache=ingest_cache)
+            cached_ep.run()
+            self.assertEqual(cached_ep.workbook.grid, {})
+            self.assertTrue(len(ep.validation_events))
+            self.assertEqual(
+                [(i['table_name'], i['check'], i['column'], i['row_index']) for i in cached_ep.validation_events],
+                [(i['table_name'], i['check'], i['column'], i['row_index']) for i in ep.validation_events])
+        return
+
+    def test_batch_ingestion_isolates_failed_files(self):
+        input_files = ['input/missing/0.0.0/Std140_TF_Output.xlsx', 'input/missing/0.0.0/Std140_HE_Output.xlsx']
+        batch_summary = process_input_files(
+            input_files=input_files,
+            args=Namespace(logger_level='WARNING', jobs=2),
+            logger_name='console_only_logger')
+        self.assertEqual(batch_summary['output_files'], [None, None])
+        self.assertEqual(batch_summary['failed_files'], input_files)
+        return
+
+    def test_data_cleanser_collects_validation_events(self):
+        df = pd.DataFrame({
+            'case': ['600', '999', '610'],
+            'peak_heating_hour': [1, 30, 'n/a'],
+            'peak_cooling_hour': [2, 3, 4]})
+        dc = DataCleanser(df)
+        df = dc.cleanse('conditioned_zone_loads_non_free_float')
+        self.assertEqual(df['case'].tolist(), ['600', '610'])
+        self.assertEqual(
+            [(i['check'], i['column'], i['row_index']) for i in dc.validation_events],
+            [('cases', 'case', [1, ]), ('numeric', 'peak_heating_hour', [1, ]), ('limits', 'peak_heating_hour', [1, ])])
+        self.assertEqual([i['values'] for i in dc.validation_events][:2], [['999', ], ['n/a', ]])
+        self.assertIn('999', dc.validation_events.get_report())
+        return
+
+    def test_data_cleanser_checks_numeric_columns_together(self):
+        df = pd.DataFrame({
+            'hour': [1, 2, 25, 'x'],
+            'south': [10.5, -1, 20, None]})
+        dc = DataCleanser(df)
+        failed_limits = dc._check_numeric_columns([
+            ('hour', {'lower_limit': 0, 'upper_limit': 24}),
+            ('south', {'lower_limit': 0}),
+            'missing_column'])
+        self.assertEqual(failed_limits.columns.tolist(), ['hour', 'south'])
+        self.assertEqual(failed_limits['hour'].tolist(), [False, False, True, True])
+        self.assertEqual(failed_limits['south'].tolist(), [False, True, False, True])
+        self.assertEqual(dc.df['hour'].isnull().tolist(), [False, False, True, True])
+        self.assertEqual(dc.df['south'].tolist()[0], 10.5)
+        self.assertEqual(
+            [(i['check'], i['column']) for i in dc.validation_events],
+            [('numeric', 'hour'), ('limits', 'hour'), ('numeric', 'south'), ('limits', 'south')])
+        return
+
+    def test_validation_schema_checks_tables_and_processed_data(self):
+        validation_schema = ValidationSchema()
+        table_plan = validation_schema.get_plan('TF', 'monthly_conditioned_zone_loads')
+        self.assertEqual((table_plan.case_column, table_plan.month_column), ('case', 'month'))
+        self.assertEqual(table_plan.numeric_columns[:2], ['total_heating_kwh', 'total_cooling_kwh'])
+        self.assertEqual(table_plan.upper_limits.tolist()[:3], [1000, 1000, 10])
+        with self.assertRaises(ASHRAE140ProcessingError):
+            validation_schema.get_plan('GC', 'monthly_conditioned_zone_loads')
+        dc = DataCleanser(pd.DataFrame({
+            'month': ['Jan', 'Foo', 'Feb'],
+            'case': ['600', '600', '600'],
+            'total_heating_kwh': [10, 20, 2000]}))
+        df = dc.cleanse('monthly_conditioned_zone_loads')
+        self.assertEqual(df['month'].tolist(), ['Jan', 'Feb'])
+        self.assertTrue(pd.isnull(df['total_heating_kwh'].iloc[1]))
+        validation_events = validation_schema.check_processed_data({
+            'monthly_conditioned_zone_loads': {'600': {
+                'Jan': {'total_heating_kwh': 10, 'peak_heating_hour': 30},
+                'Feb': {'total_heating_kwh': None, 'peak_heating_hour': 'x'}}},
+            'furnace_loads': {'HE100': -1}}, 'TF')
+        self.assertEqual(
+            [(i['table_name'], i['check'], i['column'], i['row_index']) for i in validation_events],
+            [('monthly_conditioned_zone_loads', 'numeric', 'peak_heating_hour', [('600', 'Feb'), ]),
+             ('monthly_conditioned_zone_loads', 'limits', 'peak_heating_hour', [('600', 'Jan'), ('600', 'Feb')])])
+        validation_events = validation_schema.check_processed_data({'furnace_loads': {'HE100': -1}}, 'HE')
+        self.assertEqual([(i['column'], i['values']) for i in validation_events], [('GJ', [-1, ])])
+        return
+
+    def test_validation_schema_checks_consistency_between_tables(self):
+        months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+        data = {
+            'conditioned_zone_loads_non_free_float': {
+                '600': {'annual_heating_MWh': 1.2, 'annual_cooling_MWh': 2.4, 'peak_heating_kW': 3.0,
+                        'peak_cooling_kW': 4.0},
+                '900': {'annual_heating_MWh': 1.2, 'annual_cooling_MWh': 2.4, 'peak_heating_kW': 3.0,
+                        'peak_cooling_kW': 4.0}},
+            'monthly_conditioned_zone_loads': {
+                case: {
+                    month: {'total_heating_kwh': 100, 'total_cooling_kwh': 200, 'peak_heating_kw': 3.0,
+                            'peak_cooling_kw': 4.0}
+                    for month in months}
+                for case in ['600', '900']}}
+        validation_schema = ValidationSchema()
+        self.assertEqual(len(validation_schema.check_consistency(data, 'TF')), 0)
+        data['monthly_conditioned_zone_loads']['900']['Jan']['total_heating_kwh'] = 500
+        data['monthly_conditioned_zone_loads']['600']['Jul']['peak_cooling_kw'] = 4.5
+        data['monthly_conditioned_zone_loads']['600']['Feb']['total_cooling_kwh'] = None
+        validation_events = validation_schema.check_consistency(data, 'TF')
+        self.assertEqual(
+            [(i['check'], i['row_index']) for i in validation_events],
+            [('monthly_heating_matches_annual', ['900', ]), ('monthly_peak_cooling_within_annual', ['600', ])])
+        self.assertAlmostEqual(validation_events.events[0]['values'][0][0], 1.6)
+        self.assertEqual(validation_events.events[1]['values'][0], (4.5, 4.0))
+        del data['conditioned_zone_loads_non_free_float']
+        self.assertEqual(len(validation_schema.check_consistency(data, 'TF')), 0)
+        return
@@ -0,0 +1,157 @@
+import os.path
+import json
+import unittest
+import tempfile
+import pathlib
+import sys
+import pandas as pd
+
+this_script_path = pathlib.Path(__file__)
+sys.path.append(str(this_script_path.parent.parent.joinpath('src', )))
+from src.result_cube import ResultCube
+from src.baseline_cache import BaselineCache, get_reference_statistics, read_processed_json, load_processed_file
+from src.processed_sidecar import write_sidecar, read_sidecar
+from src.results_store import ResultsStore
+from src.processed_catalog import ProcessedCatalog
+
+
+class TestProcessedData(unittest.TestCase):
+    """
+    Test the reading, caching, and storage of processed files
+    """
+
+    def test_result_cube_returns_nan_for_missing_values(self):
+        json_data = {
+            'program_a': {'loads': {'600': {'heating': 1.0, 'cooling': 2}}},
+            'program_b': {'loads': {'900': {'heating': 3.0, 'month': 'Jan'}}}}
+        result_cube = ResultCube.from_json_data(json_data, 'loads')
+        selection = result_cube.select(cases=['600', '900', '999'], metrics=['heating', 'month'])
+        self.assertEqual(selection.shape, (2, 3, 2))
+        self.assertEqual(selection[0, 0, 0], 1.0)
+        self.assertEqual(selection[1, 1, 0], 3.0)
+        self.assertTrue(pd.isna(selection[0, 1, 0]))
+        self.assertTrue(pd.isna(selection[:, 2, :]).all())
+        self.assertTrue(pd.isna(selection[:, :, 1]).all())
+        return
+
+    def test_result_cube_case_differences(self):
+        json_data = {
+            'program_a': {'loads': {'600': {'heating': 5.0}, '610': {'heating': 4.5}}},
+            'program_b': {'loads': {'600': {'heating': 6.0}}}}
+        result_cube = ResultCube.from_json_data(json_data, 'loads')
+        deltas = result_cube.select_deltas(['610-600', '600-600'], metrics=['heating', ])
+        self.assertEqual(deltas[0, :, 0].tolist(), [-0.5, 0.0])
+        self.assertTrue(pd.isna(deltas[1, 0, 0]))
+        self.assertEqual(deltas[1, 1, 0], 0.0)
+        return
+
+    def test_baseline_cache_reloads_changed_files(self):
+        table_lookup = [('loads', ['program_name', ])]
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            file_location = pathlib.Path(temporary_directory).joinpath('std140_tf_output.json')
+            file_location.write_text('{"loads": {"600": {"heating": 1.0}}}')
+            baseline_cache = BaselineCache(cache_directory=pathlib.Path(temporary_directory).joinpath('cache'))
+            entry = baseline_cache.load(file_location, 'program_a', table_lookup)
+            self.assertIs(baseline_cache.load(file_location, 'program_a', table_lookup), entry)
+            self.assertEqual(entry['tables']['loads'].loc['program_a', ('600', 'heating')], 1.0)
+            file_location.write_text('{"loads": {"600": {"heating": 2.5}}}')
+            os.utime(file_location, ns=(0, 0))
+            entry = baseline_cache.load(file_location, 'program_a', table_lookup)
+            self.assertEqual(entry['json'], {'loads': {'600': {'heating': 2.5}}})
+            # a change to the caching code does not serve the entries stored by the previous code
+            changed_code_cache = BaselineCache(cache_directory=baseline_cache.cache_directory)
+            changed_code_cache._code_fingerprint = 'changed'
+            self.assertNotEqual(
+                changed_code_cache._get_disk_key(file_location.read_bytes(), 'program_a', table_lookup),
+                baseline_cache._get_disk_key(file_location.read_bytes(), 'program_a', table_lookup))
+        return
+
+    def test_reference_statistics_exclude_missing_values(self):
+        json_data = {
+            'program_a': {'loads': {'600': {'heating': 1.0}}},
+            'program_b': {'loads': {'600': {'heating': 4.0}, '900': {'heating': 2.0}}},
+            'program_c': {'loads': {'600': {'heating': float('nan')}}}}
+        reference_statistics = get_reference_statistics(json_data)['loads']
+        self.assertEqual(
+            reference_statistics.select(cases=['600', '900'], metrics=['heating', ])[:, :, 0].T.tolist(),
+            [[1.0, 4.0, 2.5], [2.0, 2.0, 2.0]])
+        return
+
+    def test_read_processed_json_parses_requested_sections(self):
+        data = {
+            'identifying_information': {'software_name': 'a "quoted", name'},
+            'loads': {'600': {'heating': 1.0}},
+            'temperatures': [{'600': 20.0}, ]}
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            file_location = pathlib.Path(temporary_directory).joinpath('std140_tf_output.json')
+            for text in [json.dumps(data, indent=4, sort_keys=True), json.dumps(data)]:
+                file_location.write_text(text)
+                self.assertEqual(
+                    read_processed_json(file_location, data_keys=['temperatures', 'identifying_information']),
+                    {k: v for k, v in data.items() if k != 'loads'})
+                self.assertEqual(read_processed_json(file_location), data)
+        return
+
+    def test_sidecar_matches_json_and_is_ignored_when_stale(self):
+        data = {
+            'identifying_information': {'software_name': 'program_a', 'notes': None},
+            'loads': {'600': {'heating': 1.5, 'peak_hour': 14}, '610': {'heating': float('nan'), 'peak_hour': 3}}}
+        table_lookup = [('loads', ['program_name', ])]
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            file_location = pathlib.Path(temporary_directory).joinpath('std140_tf_output.json')
+            file_location.write_text(json.dumps(data, indent=4, sort_keys=True))
+            json_entry = load_processed_file(file_location, 'program_a', table_lookup)
+            write_sidecar(file_location)
+            sidecar_entry = load_processed_file(file_location, 'program_a', table_lookup)
+            self.assertEqual(json.dumps(sidecar_entry['json']), json.dumps(json_entry['json']))
+            self.assertTrue(sidecar_entry['tables']['loads'].equals(json_entry['tables']['loads']))
+            self.assertEqual(list(sidecar_entry['tables']['loads'].dtypes), list(json_entry['tables']['loads'].dtypes))
+            file_location.write_text(json.dumps({'loads': {'600': {'heating': 2.0}}}, indent=4))
+            self.assertIsNone(read_sidecar(file_location))
+            self.assertEqual(load_processed_file(file_location, 'program_a', table_lookup)['json'],
+                             {'loads': {'600': {'heating': 2.0}}})
+        return
+
+    def test_results_store_queries_across_programs(self):
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            file_locations = []
+            for program, heating in [('program_a', 4.0), ('program_b', 4.5)]:
+                file_location = pathlib.Path(temporary_directory).joinpath(program, '1.0', 'std140_tf_output.json')
+                file_location.parent.mkdir(parents=True)
+                file_location.write_text(json.dumps({'loads': {'600': {'heating': heating, 'peak_hour': 'n/a'}}}))
+                file_locations.append(file_location)
+            results_store = ResultsStore(pathlib.Path(temporary_directory).joinpath('results.sqlite'))
+            self.assertEqual(len(results_store.update_files(file_locations)), 2)
+            self.assertEqual(results_store.update_files(file_locations), [])
+            rows = results_store.query(section='TF', table_name='loads', case='600', metric='heating')
+            self.assertEqual([(i['program'], i['value']) for i in rows], [('program_a', 4.0), ('program_b', 4.5)])
+            file_locations[1].write_text(json.dumps({'loads': {'600': {'heating': 5.0}}}))
+            self.assertEqual(results_store.update_files(file_locations), [file_locations[1], ])
+            result_cube = results_store.get_result_cube('loads', file_locations, ['program_a', 'program_b'])
+            self.assertEqual(result_cube.select(metrics=['heating', ])[:, 0, 0].tolist(), [4.0, 5.0])
+            self.assertTrue(pd.isna(result_cube.select(metrics=['peak_hour', ])[:, 0, 0]).all())
+        return
+
+    def test_processed_catalog_tracks_baselines_and_renders(self):
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            processed_file_directory = pathlib.Path(temporary_directory).joinpath('processed')
+            file_locations = []
+            for program in ['esp-r-hot3000/1.7', 'analytical/0', 'program_a/1.0']:
+                file_location = processed_file_directory.joinpath(program, 'std140_he_output.json')
+                file_location.parent.mkdir(parents=True)
+                file_location.write_text(json.dumps({'identifying_information': {'software_name': program}}))
+                file_locations.append(file_location)
+            catalog = ProcessedCatalog(processed_file_directory.joinpath('catalog.json'))
+            self.assertEqual(catalog.get_baseline_files('HE'), file_locations[:2])
+            self.assertEqual(catalog.get_files(section='HE', baseline=False), file_locations[2:])
+            self.assertEqual(catalog.get_entry(file_locations[2])['program'], 'program_a')
+            render_hash = catalog.get_render_hash(file_locations[2])
+            catalog.set_rendered(file_locations[2], ['images/figure_1.png', ], render_hash)
+            catalog.save()
+            catalog = ProcessedCatalog(processed_file_directory.joinpath('catalog.json'))
+            self.assertTrue(catalog.is_rendered(file_locations[2], catalog.get_render_hash(file_locations[2])))
+            # a changed baseline file changes the render inputs of the tested file
+            file_locations[1].write_text(json.dumps({'identifying_information': {'software_name': 'changed'}}))
+            self.assertEqual(catalog.update_files(file_locations), [file_locations[1], ])
+            self.assertFalse(catalog.is_rendered(file_locations[2], catalog.get_render_hash(file_locations[2])))
+        return
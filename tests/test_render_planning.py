@@ -0,0 +1,83 @@
+import json
+import subprocess
+import unittest
+import tempfile
+import pathlib
+import sys
+
+this_script_path = pathlib.Path(__file__)
+sys.path.append(str(this_script_path.parent.parent.joinpath('src', )))
+from src.processed_catalog import ProcessedCatalog
+from src.change_planner import get_changed_files, plan_render_jobs
+from src.render_manifest import AccessRecordingDict, RenderManifest
+from src.graphics_renderer import GraphicsRenderer
+from src.render_dependencies import get_render_dependencies, get_affected_render_functions
+
+
+class TestRenderPlanning(unittest.TestCase):
+    """
+    Test the selection of the graphics to render for processed files
+    """
+
+    def test_render_manifest_tracks_data_keys_read(self):
+        accessed_data_keys = set()
+        json_data = {
+            'program_a': AccessRecordingDict({'loads': {'600': 1.0}, 'temperatures': {'600': 20.0}}, accessed_data_keys)}
+        self.assertEqual(json_data['program_a']['loads'], {'600': 1.0})
+        self.assertEqual(accessed_data_keys, {'loads', })
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            output_file = pathlib.Path(temporary_directory).joinpath('images', 'figure.png')
+            output_file.parent.mkdir()
+            output_file.write_text('')
+            manifest_location = pathlib.Path(temporary_directory).joinpath('render_manifest.json')
+            render_manifest = RenderManifest(manifest_location, GraphicsRenderer)
+            render_manifest.update('render_section_tf_figure_b8_1', json_data, accessed_data_keys, [output_file, ])
+            render_manifest.save()
+            render_manifest = RenderManifest(manifest_location, GraphicsRenderer)
+            self.assertEqual(
+                render_manifest.entries['render_section_tf_figure_b8_1']['output_files'], ['images/figure.png', ])
+            json_data['program_a']['temperatures']['600'] = 21.0
+            self.assertTrue(render_manifest.is_current('render_section_tf_figure_b8_1', json_data))
+            json_data['program_a']['loads']['600'] = 2.0
+            render_manifest = RenderManifest(manifest_location, GraphicsRenderer)
+            self.assertFalse(render_manifest.is_current('render_section_tf_figure_b8_1', json_data))
+        return
+
+    def test_render_dependencies_registry(self):
+        render_dependencies = get_render_dependencies(GraphicsRenderer)
+        self.assertIn('hourly_annual_zone_temperature_bin_data', render_dependencies['render_section_tf_figure_b8_h1'])
+        self.assertNotIn('monthly_conditioned_zone_loads', render_dependencies['render_section_tf_figure_b8_h1'])
+        affected_render_functions = get_affected_render_functions(
+            GraphicsRenderer, ['hourly_annual_zone_temperature_bin_data', ])
+        self.assertIn('render_section_tf_figure_b8_h1', affected_render_functions)
+        self.assertNotIn('render_section_tf_table_b8_1', affected_render_functions)
+        return
+
+    def test_changed_files_plan_render_jobs(self):
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            repository_directory = pathlib.Path(temporary_directory)
+            file_location = repository_directory.joinpath('processed', 'program_a', '1.0', 'std140_tf_output.json')
+            file_location.parent.mkdir(parents=True)
+            file_location.write_text(json.dumps({
+                'conditioned_zone_loads_non_free_float': {'600': {'annual_heating_MWh': 4.0}},
+                'free_float_case_zone_temperatures': {'600FF': {'average_temperature': 25.0}}}))
+            subprocess.run(['git', 'init', '-q'], cwd=repository_directory, check=True)
+            subprocess.run(['git', 'add', '.'], cwd=repository_directory, check=True)
+            subprocess.run(
+                ['git', '-c', 'user.name=test', '-c', 'user.email=test@test', 'commit', '-q', '-m', 'test'],
+                cwd=repository_directory, check=True)
+            file_location.write_text(json.dumps({
+                'conditioned_zone_loads_non_free_float': {'600': {'annual_heating_MWh': 4.5}},
+                'free_float_case_zone_temperatures': {'600FF': {'average_temperature': 25.0}}}))
+            new_file_location = repository_directory.joinpath('processed', 'program_b', '1.0', 'std140_tf_output.json')
+            new_file_location.parent.mkdir(parents=True)
+            new_file_location.write_text(file_location.read_text())
+            changed_files = get_changed_files('HEAD', repository_directory=repository_directory)
+            self.assertEqual(changed_files, [file_location, new_file_location])
+            catalog = ProcessedCatalog(repository_directory.joinpath('processed', 'catalog.json'))
+            render_jobs = plan_render_jobs(changed_files, 'HEAD', catalog, GraphicsRenderer, repository_directory)
+            self.assertEqual(render_jobs[file_location], [
+                i for i in get_affected_render_functions(GraphicsRenderer, ['conditioned_zone_loads_non_free_float', ])
+                if 'tf' in i])
+            self.assertIsNone(render_jobs[new_file_location])
+        return
@@ -0,0 +1,89 @@
+import shutil
+import unittest
+import pathlib
+import sys
+from argparse import Namespace
+from unittest import mock
+
+this_script_path = pathlib.Path(__file__)
+sys.path.append(str(this_script_path.parent.parent.joinpath('src', )))
+import src.main
+from src.main import create_images, load_renderer
+
+
+class TestRendering(unittest.TestCase):
+    """
+    Test the rendering of processed files into graphics and tables
+    """
+
+    def setUp(self):
+        # rendered files are written to rendered/images/<software-name>/<version>, so the processed file is copied to
+        # a program that is removed after the test
+        root_directory = this_script_path.parent.parent
+        self.processed_file_location = root_directory.joinpath(
+            'processed', 'render-test', '0.0.0', 'std140_he_output.json')
+        self.render_file_directory = root_directory.joinpath('rendered', 'images', 'render-test', '0.0.0')
+        self.processed_file_location.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(
+            root_directory.joinpath('processed', 'test', '0.0.0', 'std140_he_output.json'),
+            self.processed_file_location)
+        self.render_function_names = [
+            'render_section_he_table_b16_6_1', 'render_section_he_table_b16_6_2', 'render_section_he_table_b16_6_3']
+        return
+
+    def tearDown(self):
+        shutil.rmtree(self.processed_file_location.parent.parent)
+        shutil.rmtree(self.render_file_directory.parent, ignore_errors=True)
+        return
+
+    def _render(self, jobs):
+        render_results = create_images(
+            input_file=self.processed_file_location,
+            args=Namespace(logger_level='CRITICAL', jobs=jobs, render_graphics=None, no_cache=True),
+            logger_name='console_only_logger',
+            render_function_names=self.render_function_names)
+        rendered_files = {
+            i.relative_to(self.render_file_directory).as_posix(): i.read_text()
+            for i in self.render_file_directory.rglob('*.md')}
+        shutil.rmtree(self.render_file_directory)
+        return render_results, rendered_files
+
+    def test_parallel_render_matches_serial_render(self):
+        serial_results, serial_files = self._render(jobs=1)
+        parallel_results, parallel_files = self._render(jobs=2)
+        self.assertEqual(serial_results, {i: None for i in self.render_function_names})
+        self.assertEqual(parallel_results, serial_results)
+        self.assertTrue(serial_files)
+        self.assertEqual(parallel_files, serial_files)
+        return
+
+    def test_parallel_render_loads_renderer_data_in_workers_only(self):
+        with mock.patch.object(src.main, '_load_graphics_renderer', side_effect=AssertionError('loaded in parent')):
+            render_results = create_images(
+                input_file=self.processed_file_location,
+                args=Namespace(logger_level='CRITICAL', jobs=2, render_graphics=None, no_cache=False),
+                logger_name='console_only_logger',
+                render_function_names=self.render_function_names)
+        self.assertEqual(render_results, {i: None for i in self.render_function_names})
+        # the manifest written from the json read by the parent is current for a serial run
+        with mock.patch.object(src.main, 'run_render_function') as run_render_function:
+            render_results = create_images(
+                input_file=self.processed_file_location,
+                args=Namespace(logger_level='CRITICAL', jobs=1, render_graphics=None, no_cache=False),
+                logger_name='console_only_logger',
+                render_function_names=self.render_function_names)
+        run_render_function.assert_not_called()
+        self.assertEqual(render_results, {i: None for i in self.render_function_names})
+        return
+
+    def test_serial_render_reports_failed_function_and_continues(self):
+        with mock.patch.object(load_renderer(), self.render_function_names[0], side_effect=KeyError('missing')):
+            render_results = create_images(
+                input_file=self.processed_file_location,
+                args=Namespace(logger_level='CRITICAL', jobs=1, render_graphics=None, no_cache=True),
+                logger_name='console_only_logger',
+                render_function_names=self.render_function_names)
+        self.assertIn('KeyError', render_results[self.render_function_names[0]])
+        self.assertEqual([render_results[i] for i in self.render_function_names[1:]], [None, None])
+        self.assertTrue(self.render_file_directory.joinpath('render_manifest.json').is_file())
+        return
@@ -0,0 +1,83 @@
+import json
+import subprocess
+import unittest
+import tempfile
+import pathlib
+import sys
+
+this_script_path = pathlib.Path(__file__)
+sys.path.append(str(this_script_path.parent.parent.joinpath('src', )))
+from src.processed_catalog import ProcessedCatalog
+from src.screening import screen_processed_file, write_screen_summary
+from src.agreement_metrics import get_agreement_table
+
+
+class TestScreening(unittest.TestCase):
+    """
+    Test the comparison of processed files with the reference programs without rendering
+    """
+
+    def test_screening_compares_cells_with_reference_range(self):
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            processed_file_directory = pathlib.Path(temporary_directory).joinpath('processed')
+            file_values = {
+                'esp-r-hot3000/1.7': {'600': 1.0, '900': 2.0},
+                'analytical/0': {'600': 3.0, '900': 4.0},
+                'program_a/1.0': {'600': 2.0, '900': 5.0, '910': 1.0}}
+            for program, values in file_values.items():
+                file_location = processed_file_directory.joinpath(program, 'std140_he_output.json')
+                file_location.parent.mkdir(parents=True)
+                file_location.write_text(json.dumps({
+                    'identifying_information': {'software_name': program},
+                    'fuel_consumption': {i: {'total_fuel_consumption_m3': j} for i, j in values.items()}}))
+            catalog = ProcessedCatalog(processed_file_directory.joinpath('catalog.json'))
+            screen_result = screen_processed_file(file_location, catalog=catalog)
+            self.assertEqual(screen_result['summary'], {'cells': 3, 'inside': 1, 'outside': 1, 'no_reference': 1})
+            self.assertEqual(screen_result['tables']['fuel_consumption']['outside_cells'], [{
+                'case': '900', 'metric': 'total_fuel_consumption_m3', 'value': 5.0, 'min': 2.0, 'max': 4.0,
+                'deviation': 1.0, 'deviation_percent': 100 / 3}])
+            json_file_location, markdown_file_location = write_screen_summary(screen_result, temporary_directory)
+            with open(json_file_location, 'r') as f:
+                self.assertEqual(json.load(f)['summary'], screen_result['summary'])
+            self.assertIn('| fuel_consumption | 900 |', markdown_file_location.read_text())
+        return
+
+    def test_screening_starts_without_plotting_modules(self):
+        completed_process = subprocess.run(
+            [sys.executable, '-c', 'import sys; sys.path.insert(0, "src"); import screening; '
+                                   'print(sorted({"matplotlib", "plotly"} & set(sys.modules)))'],
+            cwd=this_script_path.parent.parent, capture_output=True, text=True, check=True)
+        self.assertEqual(completed_process.stdout.strip(), '[]')
+        return
+
+    def test_agreement_metrics_compare_profiles_and_histograms(self):
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            processed_file_directory = pathlib.Path(temporary_directory).joinpath('processed')
+            file_values = {
+                'energyplus/9.0.1': ([10.0, 20.0], [0, 2, 0]),
+                'esp-r/13.3': ([30.0, 40.0], [0, 2, 0]),
+                'program_a/1.0': ([22.0, 26.0], [0, 0, 2])}
+            for program, (monthly_values, bin_values) in file_values.items():
+                file_location = processed_file_directory.joinpath(program, 'std140_tf_output.json')
+                file_location.parent.mkdir(parents=True)
+                file_location.write_text(json.dumps({
+                    'monthly_conditioned_zone_loads': {'600': {
+                        month: {'total_heating_kwh': value, 'peak_heating_day': 1}
+                        for month, value in zip(['Jan', 'Feb'], monthly_values)}},
+                    'hourly_annual_zone_temperature_bin_data': {'900FF': {'temperature_bin_c': {
+                        str(temperature_bin): {'number_of_hours': value}
+                        for temperature_bin, value in zip([-1, 0, 1], bin_values)}}}}))
+            catalog = ProcessedCatalog(processed_file_directory.joinpath('catalog.json'))
+            agreement_table = get_agreement_table('TF', catalog=catalog).set_index(['program', 'table_name'])
+            # reference mean is [20, 30], so the errors of program_a are [2, -4]
+            profile_row = agreement_table.loc[('program_a-1.0', 'monthly_conditioned_zone_loads')]
+            self.assertEqual(profile_row['series'], '600>total_heating_kwh')
+            self.assertEqual(profile_row['steps'], 2)
+            self.assertAlmostEqual(profile_row['nmbe_percent'], -4.0)
+            self.assertAlmostEqual(profile_row['cv_rmse_percent'], 100 * 10 ** 0.5 / 25)
+            histogram_row = agreement_table.loc[('program_a-1.0', 'hourly_annual_zone_temperature_bin_data')]
+            self.assertAlmostEqual(histogram_row['ks_distance'], 1.0)
+            self.assertAlmostEqual(histogram_row['earth_movers_distance'], 1.0)
+            self.assertEqual(agreement_table.loc[('esp-r-13.3', 'hourly_annual_zone_temperature_bin_data')][
+                'ks_distance'], 0.0)
+        return